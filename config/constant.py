@@ -1,7 +1,149 @@
 HEADLESS = False
 
+# where BaseTest.initialize_browser starts browsers: "local" drivers, or "remote" sessions on Selenium
+# Grid nodes (a local `java -jar selenium-server-<version>.jar standalone` listens on
+# http://localhost:4444). With several nodes main.py gives each node its own shard of the selected
+# tests; "capabilities" adds per-browser capabilities to remote sessions (e.g. {"chrome": {"platformName": "linux"}})
+WEBDRIVER_BACKEND = {
+    "backend": "local",
+    "nodes": ["http://localhost:4444"],
+    "capabilities": {}
+}
+
+# keep one browser session per worker process and reset it between tests instead of relaunching
+REUSE_BROWSER = True
+
+# log in through the API and write the session straight into the browser instead of using the login form
+API_LOGIN = True
+
+# run read-only @multi_language tests once per browser, checking every language of the run in one
+# session and account (switching the /cn, /en, /bm route) instead of once per language process
+MULTI_LANGUAGE = True
+# where the web app keeps its session; "{token}" and "{username}" are filled in by BaseTest.login_as
+FRONTEND_AUTH = {
+    "cookies": {
+        "token": "{token}"
+    },
+    "local_storage": {
+        "token": "{token}",
+        "username": "{username}"
+    }
+}
+
+# pre-registered accounts; fill with `python -m utils.account_pool --target fresh=20`
+ACCOUNT_POOL = {
+    "path": "account_pool.db",
+    # accounts kept ready per state: fresh, funded, turnover_complete, vip_<level>
+    "targets": {
+        "fresh": 10
+    },
+    "deposit_amount": 100,
+    "refill_workers": 3,
+    "refill_interval": 30,
+    # top the pool up in a background thread while main.py runs
+    "refill_during_run": False
+}
+
+# back office load scenarios for utils.load_scenario; steps: register, login, deposit, approve_deposit,
+# transfer, withdraw, add_4d_cards, bet_4d. "setup" runs once per user, "steps" repeat for "duration" seconds
+# (0 runs them once). "ramp_up" spreads user start over seconds and "target_rps" caps requests (0 = no cap).
+LOAD_SCENARIOS = {
+    "spam_deposit": {
+        "users": 20,
+        "workers": 5,
+        "ramp_up": 0,
+        "duration": 0,
+        "target_rps": 0,
+        "setup": ["register", "login"],
+        "steps": [{
+            "name": "deposit",
+            "amount": [30, 2000],
+            "promo": "10DSRB"
+        }]
+    },
+    "wallet_churn": {
+        "users": 10,
+        "ramp_up": 10,
+        "duration": 120,
+        "target_rps": 5,
+        "setup": ["register", "login", {
+            "name": "deposit",
+            "amount": 500
+        }, "approve_deposit", "add_4d_cards"],
+        "steps": [{
+            "name": "transfer",
+            "amount": 1
+        }, "bet_4d", {
+            "name": "withdraw",
+            "amount": 50
+        }]
+    }
+}
+
+# lean browser profile (utils/lean_browser.py) for classes setting LEAN_BROWSER = True or tests
+# decorated with @lean_browser(): no images, web fonts, analytics or third-party iframes, and MUI
+# transitions/animations switched off. Animation waits (BaseTest.wait_animation) are scaled by
+# "sleep_scale" while it is on.
+LEAN_BROWSER = {
+    "sleep_scale": 0.25,
+    "block_extensions": [".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg", ".woff", ".woff2", ".ttf", ".otf", ".mp4"],
+    "block_urls": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*facebook.net*",
+        "*connect.facebook.com*", "*hotjar.com*", "*clarity.ms*", "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+        "*youtube.com/embed*", "*tawk.to*", "*livechatinc.com*"
+    ]
+}
+
+# record the web app's own API responses (utils/network_capture.py) so tests can compare the UI
+# against the payload it rendered; only URLs containing one of "url_patterns" are kept, and a
+# lookup waits up to "timeout" seconds only while a request for that path is still in flight
+NETWORK_CAPTURE = {"enabled": True, "url_patterns": ["/api/"], "max_entries": 200, "timeout": 5}
+
+# promos, VIP levels, providers and reward types (utils/reference_cache.py) cached on disk under
+# test_results/reference_cache for "ttl" seconds and shared by every worker process; main.py
+# refetches all of it with "workers" threads before the run when "warm_up" is set
+REFERENCE_CACHE = {"enabled": True, "ttl": 900, "warm_up": True, "workers": 8}
+
+# what `python main.py` runs without arguments; override with --classes/--languages/--browsers/--workers
+RUN_DEFAULTS = {"classes": ["TestProfilePage"], "languages": ["bm"], "browsers": ["firefox"], "workers": 1}
+
+# nested helper spans per test, written as Chrome trace JSON under test_results/traces/<run_id>
+TRACING = {
+    "enabled": True,
+    # slowest helpers printed at the end of a run
+    "top_n": 15
+}
+
+# utils/fixtures.py: promo codes used for locked promo turnovers, largest single deposit when
+# topping up to a balance or VIP target, and users built at once by resolve_many
+FIXTURES = {"promo_codes": ["10DSRB"], "max_deposit": 2000, "workers": 4}
+
+# stored runs (test_results/runs) used to predict test durations for longest-first scheduling;
+# tests with no history at all are assumed to take "default" seconds
+DURATION_HISTORY = {"runs": 10, "default": 60}
+
+# history pages fetched in parallel when reconciling the history table against the API
+HISTORY_VERIFIER = {"fetch_workers": 6}
+
+# utils/turnover_service.py: ModifyTurnover calls sent at once when changing many turnovers
+TURNOVER_SERVICE = {"workers": 8}
+
 API_URL = "https://staging.sosyokmy.com/whitelabel-staging-2/public"
 
+# point API helpers at the in-process mock back office (utils/mock_backoffice.py) instead of staging
+USE_MOCK_BACKOFFICE = False
+MOCK_BACKOFFICE = {
+    "host": "127.0.0.1",
+    "port": 8765,
+    # added to every mock response
+    "latency_ms": 0,
+    "jitter_ms": 0,
+    # fixed accounts created when the mock starts: CREDENTIALS entries, plus the shared
+    # test accounts whose password is their username
+    "seed_credentials": ["valid_user", "luffy_user", "duplicated_user", "complete_turnover", "incomplete_turnover"],
+    "seed_users": ["LuffyTest1", "LuffyTest2", "LuffyTest3", "LuffyTest4", "LuffyTest5"]
+}
+
 CREDENTIALS = {
     "valid_user": {
         "username": "EmoKing1",
@@ -51,11 +193,17 @@ CREDENTIALS = {
     "transfer_amount": {
         "amount": "2.0"
     },
+    # concurrent main wallet -> provider transfers in TransferBase; 1 transfers one provider at a time
+    "transfer_workers": {
+        "workers": "8"
+    },
+    # concurrent Bet4d calls when seeding 4D records in bulk
+    "fourd_seed_workers": {
+        "workers": "8"
+    },
     "deposit": {
         "invalid_voucher": "abc",
     },
-    "image_url": "https://picsum.photos/200/300",
-    "image_path": "test_deposit.jpg",
     "BO_testing_url": "https://staging.sosyokmy.com/whitelabel-test/public",
     "BO_base_url": "https://staging.sosyokmy.com/whitelabel-staging-2/public",
     "RejectDepositRequest": "{BO_base_url}/api/recharge/refuse/batch?user_ids[]={ID}&pass=123456",
@@ -66,8 +214,8 @@ CREDENTIALS = {
     "ApproveWithdrawRequest": "{BO_base_url}/api/withdraw/approve?user_ids[]={ID}&pass=123456",
     "CheckTurnover": "{BO_base_url}/api/check-turnover?pass=123456&user_id={ID}&lang={language}",
     "ModifyTurnover": "{BO_base_url}/api/modify-turnover?pass=123456&user_id={userID}&turnover_id={turnover_id}&action={action}",
-    "SpecifyDateHistory": "{BO_base_url}/api/filter-records-by-date?type={record_type_value}&page=1&from={start_date}&to={end_date}",
-    "DateHistory": "{BO_base_url}/api/filter-records-by-date?type={record_type_value}&page=1&date={date_option_id}",
+    "SpecifyDateHistory": "{BO_base_url}/api/filter-records-by-date?type={record_type_value}&page={page}&from={start_date}&to={end_date}",
+    "DateHistory": "{BO_base_url}/api/filter-records-by-date?type={record_type_value}&page={page}&date={date_option_id}",
     "PlaceBet": "{BO_base_url}/api/simulate-game-records?passcode=99999&user_id={userID}&amount={transfer_amount}&type={type}&provider_id={game_id}&game_record_date={game_record_date}",
     "CreateDownline": "{BO_base_url}/api/qa-generate-user?pass=123456&user_id={userID}&t2=1&t3=1",
     "CreateRebate": "{BO_base_url}/api/qa-calculate-rebate?pass=123456&user_ids={userID}&month={current_month}",
@@ -482,17 +630,13 @@ LANGUAGE_SETTINGS = {
 }
 
 
-PROFILE_URL = {
-    "large_image_url": "https://sample-files.com/downloads/images/jpg/landscape_hires_4000x2667_6.83mb.jpg",
-    "replace_image_url": "https://bobo-bucket.s3.ap-southeast-1.amazonaws.com/whitelabel/default-profile/AvatarP1.png",
-    "valid_image_url": "https://bobo-bucket.s3.ap-southeast-1.amazonaws.com/chatbot/chatbot_avatar.png",
-    "invalid_format_url": "https://sample-files.com/downloads/documents/txt/simple.txt",
-}
-
 LIVE_AGENT_URL = {
     "chatbot_base_url": "https://dev.whitelabel-dev.com/chatbot/",
     "whatsapp_base_url": "https://api.whatsapp.com/send/",
     "telegram_base_url": "https://t.me/"
 }
 
-FOUR_D_PRIZES = [3400,1200,600,210,80]
\ No newline at end of file
+FOUR_D_PRIZES = [3400,1200,600,210,80]
+
+if USE_MOCK_BACKOFFICE:
+    API_URL = CREDENTIALS["BO_base_url"] = f"http://{MOCK_BACKOFFICE['host']}:{MOCK_BACKOFFICE['port']}"
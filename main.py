@@ -1,200 +1,158 @@
+import argparse
 import logging
 import multiprocessing
 import os
+import time
 import unittest
-from datetime import datetime
-from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Font
-from tests.authentication_test.test_login import TestLogin
-from tests.authentication_test.test_register import TestRegister
-#from tests.authentication_test.test_setting import TestSetting
-#from tests.authentication_test.test_forgotpassword import TestPassword
-from tests.deposit_test.test_quickreload import TestQuickReload
-from tests.deposit_test.test_banktransfer import TestBankTransfer
-from tests.withdraw_test.test_withdrawtransfer import TestWithdrawTransfer
-#from tests.withdraw_test.test_ewallet import TestEWallet
-#from tests.coupon_test.test_coupon import TestCoupon
-#from tests.transaction_history_test.test_history import TestHistory
-from tests.test_profile import TestProfilePage
-from tests.deposit_test.test_spamdeposit import TestSpamDeposit
-from tests.transfer_test.test_transfer import TestTransfer
-from tests.transfer_test.test_main_provider import TestMainProvider
-from tests.transfer_test.test_provider_to_provider import TestProviderToProvider
-from tests.revert_test.revert_test import TestRevert
+from datetime import datetime, timedelta
+from utils.scheduler import finish_process, predict_run, run_parallel
+from utils.durations import DurationModel
+from utils.test_registry import TestRegistry, load_suite, shard
+from utils.results_store import ResultsStore, build_reports, error_message, new_run_id
+from utils.account_pool import AccountProvisioner, default_helper_factory, get_account_pool
+from config.constant import ACCOUNT_POOL, MULTI_LANGUAGE, REFERENCE_CACHE, RUN_DEFAULTS, USE_MOCK_BACKOFFICE
+from utils.mock_backoffice import ensure_mock_backoffice
+from utils.tracing import format_top_helpers
+from utils.webdriver_backend import NODE_ENV, node_label, nodes
+from utils.multi_language import result_target, runs_language_pass
 
 
 class CustomTestResult(unittest.TextTestResult):
 
-    def __init__(self, stream, descriptions, verbosity):
+    def __init__(self, stream, descriptions, verbosity, store=None):
         super().__init__(stream, descriptions, verbosity)
         self.successes = []
-        self.errors_and_failures = []
-        self.test_results = []
+        self.store = store
+        self._started = {}
+
+    def startTest(self, test):
+        super().startTest(test)
+        self._started[test.id()] = time.monotonic()
+
+    def _store(self, status, test, err=None, reason=None):
+        if self.store is None:
+            return
+        test, language = result_target(test)
+        duration = getattr(test, "remote_duration", None)
+        started = self._started.pop(test.id(), None)
+        if language and duration is None:
+            # the next language of the pass starts now
+            self._started[test.id()] = time.monotonic()
+        if duration is None and started is not None:
+            duration = time.monotonic() - started
+        message, formatted = reason, None
+        if err:
+            error_type, error_value, tb = err
+            message = error_message(status, error_value)
+            formatted = getattr(error_value, "remote_traceback", None) or self._exc_info_to_string(err, test)
+        self.store.append(
+            test.__class__.__name__, getattr(test, "_testMethodName", str(test)), status, duration, message, formatted,
+            worker=getattr(test, "remote_worker", None), **({"language": language} if language else {})
+        )
 
     def addSuccess(self, test):
         super().addSuccess(test)
         self.successes.append(test)
-        self.test_results.append(("PASS", test, None))
+        if not runs_language_pass(test):
+            self._store("PASS", test)
+
+    def addSubTest(self, test, subtest, err):
+        super().addSubTest(test, subtest, err)
+        if err is None:
+            self._store("PASS", subtest)
+        else:
+            self._store("FAILURE" if issubclass(err[0], test.failureException) else "ERROR", subtest, err)
 
     def addError(self, test, err):
         super().addError(test, err)
-        self.errors_and_failures.append(("ERROR", test, err))
-        self.test_results.append(("ERROR", test, err))
+        self._store("ERROR", test, err)
 
     def addFailure(self, test, err):
         super().addFailure(test, err)
-        self.errors_and_failures.append(("FAILURE", test, err))
-        self.test_results.append(("FAILURE", test, err))
+        self._store("FAILURE", test, err)
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self._store("SKIP", test, reason=reason)
 
 
 class CustomTestRunner(unittest.TextTestRunner):
 
-    def __init__(self, language, browser, **kwargs):
+    def __init__(self, language, browser, run_id=None, node=None, languages=None, **kwargs):
         super().__init__(**kwargs)
         self.language = language
         self.browser = browser
+        self.languages = languages
+        self.run_id = run_id or new_run_id()
+        # inherited by scheduler workers so their traces land in the same run directory
+        os.environ["TEST_RUN_ID"] = self.run_id
+        self.store = ResultsStore(self.run_id, language, browser, node=node)
+        self.durations = DurationModel.load()
 
     def _makeResult(self):
-        return CustomTestResult(self.stream, self.descriptions, self.verbosity)
+        return CustomTestResult(self.stream, self.descriptions, self.verbosity, self.store)
 
     def run(self, test):
+        started = self.report_prediction(test, 1)
         result = super().run(test)
+        self.report_actual(started)
+        return self.finish(result)
+
+    def run_parallel(self, test, workers):
+        result = self._makeResult()
+        started = self.report_prediction(test, workers)
+        run_parallel(
+            test, result, self.language, self.browser, workers, model=self.durations, languages=self.languages
+        )
+        result.printErrors()
+        self.stream.writeln(result.separator2)
+        self.stream.writeln(f"Ran {result.testsRun} tests across {workers} workers")
+        self.report_actual(started)
+        return self.finish(result)
+
+    def report_prediction(self, test, workers):
+        self.predicted = predict_run(test, self.durations, self.language, self.browser, workers)
+        finish_at = datetime.now() + timedelta(seconds=self.predicted)
+        message = f"Predicted finish in {self.predicted:.0f}s (around {finish_at:%H:%M:%S})"
+        self.stream.writeln(message)
+        logging.info(message)
+        return time.monotonic()
+
+    def report_actual(self, started):
+        elapsed = time.monotonic() - started
+        message = (
+            f"Finished in {elapsed:.0f}s at {datetime.now():%H:%M:%S}; predicted {self.predicted:.0f}s "
+            f"({elapsed - self.predicted:+.0f}s)"
+        )
+        self.stream.writeln(message)
+        logging.info(message)
+
+    def finish(self, result):
         logging.info(f"Total tests run: {result.testsRun}")
         logging.info(f"Successes: {len(result.successes)}")
         logging.info(f"Failures: {len(result.failures)}")
         logging.info(f"Errors: {len(result.errors)}")
-        self.write_to_excel(result)
+        self.store.close()
+        self.log_slowest_helpers()
         return result
 
-    def write_to_excel(self, result):
-        test_results_by_class = {}
-        for status, test, error in result.test_results:
-            test_class = test.__class__.__name__
-            if test_class not in test_results_by_class:
-                test_results_by_class[test_class] = []
-            test_results_by_class[test_class].append((status, test, error))
-
-        for test_class, class_results in test_results_by_class.items():
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{test_class}.xlsx"
-
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            results_dir = os.path.join(current_dir, "test_results")
-            os.makedirs(results_dir, exist_ok=True)
-
-            filepath = os.path.join(results_dir, filename)
-
-            wb = Workbook()
-            ws = wb.active
-            ws.title = f"{test_class}_{self.language}_{self.browser}"
-
-            pass_fill = PatternFill(start_color="90EE90",
-                                    end_color="90EE90",
-                                    fill_type="solid")
-            fail_fill = PatternFill(start_color="FFB6C1",
-                                    end_color="FFB6C1",
-                                    fill_type="solid")
-            header_font = Font(bold=True)
-
-            headers = ["Test Class", "Test Name", "Status", "Error Message"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col)
-                cell.value = header
-                cell.font = header_font
-
-            row = 2
-            for status, test, error in class_results:
-                ws.cell(row=row, column=1, value=test_class)
-                ws.cell(row=row, column=2, value=test._testMethodName)
-                ws.cell(row=row, column=3, value=status)
-
-                if error:
-                    error_type, error_value, traceback = error
-                    error_msg = str(error_value)
-
-                    if isinstance(
-                            error_value,
-                            AssertionError) or "Test failed:" in error_msg:
-                        ws.cell(row=row, column=4, value=error_msg)
-                    else:
-                        formatted_msg = f"Test failed: {error_msg}"
-                        ws.cell(row=row, column=4, value=formatted_msg)
-
-                    for col in range(1, 5):
-                        ws.cell(row=row, column=col).fill = fail_fill
-                else:
-                    for col in range(1, 5):
-                        ws.cell(row=row, column=col).fill = pass_fill
-
-                row += 1
-
-            for row_idx in range(1, ws.max_row + 1):
-                cell = ws.cell(row=row_idx, column=4)
-                if cell.value:
-                    lines = str(cell.value).count('\n') + 1
-                    ws.row_dimensions[row_idx].height = 15 * max(lines, 1)
-
-            for col in ws.columns:
-                max_length = 0
-                column = col[0].column_letter
-                for cell in col:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = (max_length + 2)
-                ws.column_dimensions[column].width = adjusted_width
-
-            wb.save(filepath)
-            logging.info(f"Test results Excel file created at: {filepath}")
-
-            if os.path.exists(filepath):
-                logging.info(f"Excel file successfully created: {filename}")
-            else:
-                logging.error(f"Failed to create Excel file: {filename}")
-
-
-def create_test_suite(language, browser):
-    suite = unittest.TestSuite()
-
-    # test_classes = [
-    #    TestLogin, TestRegister, TestSetting, TestPassword, TestProfilePage, TestQuickReload, TestBankTransfer, TestTransfer,
-    #    TestSpamDeposit, TestWithdrawTransfer, TestEWallet, TestCoupon, TestHistory,
-    #    TestDailyCheckIn, TestDailyMission, TestInviteFriends, TestLuckyWheelSpinPage, TestProfilePage, TestPromotion
-    # ]
-    test_classes = [TestProfilePage]
-
-    for test_class in test_classes:
-        # Generate test methods if it's TestRevert
-        if test_class == TestRevert:
-            # Generate the test methods
-            TestRevert.generate_test_methods(language=language,
-                                             browser=browser)
-            # Get all test methods (including auto-generated ones)
-            test_methods = TestRevert.get_test_methods(language=language,
-                                                       browser=browser)
-
-            # Add each test method to suite
-            for method_name in test_methods:
-                suite.addTest(
-                    test_class(method_name, language=language,
-                               browser=browser))
-        else:
-            # Handle other test classes normally
-            tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-            for test in tests:
-                suite.addTest(
-                    test_class(test._testMethodName,
-                               language=language,
-                               browser=browser))
+    def log_slowest_helpers(self):
+        lines = format_top_helpers(self.run_id)
+        if lines:
+            logging.info("Slowest helpers so far:\n" + "\n".join(lines))
+
 
-    return suite
+def create_test_suite(language, browser, selections, languages=None):
+    return load_suite(selections, language, browser, languages)
 
 
-def run_tests(language, browser):
+def run_tests(language, browser, selections, workers=1, run_id=None, node=None, languages=None):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_filename = f"TestResults_{language}_{browser}_{timestamp}.log"
+    if node:
+        # inherited by scheduler workers, read by utils.webdriver_backend
+        os.environ[NODE_ENV] = node
+        log_filename = f"TestResults_{language}_{browser}_{node_label(node)}_{timestamp}.log"
 
     logging.basicConfig(
         level=logging.INFO,
@@ -206,9 +164,15 @@ def run_tests(language, browser):
 
     logging.info(
         f"Starting test run in {browser} browser for {language} language...")
-    suite = create_test_suite(language, browser)
-    runner = CustomTestRunner(language, browser, verbosity=2)
-    result = runner.run(suite)
+    try:
+        suite = create_test_suite(language, browser, selections, languages)
+        runner = CustomTestRunner(language, browser, run_id=run_id, node=node, languages=languages, verbosity=2)
+        if workers > 1:
+            result = runner.run_parallel(suite, workers)
+        else:
+            result = runner.run(suite)
+    finally:
+        finish_process()
 
     logging.info("\n" + "=" * 50)
     logging.info("TEST RUN SUMMARY")
@@ -222,22 +186,106 @@ def run_tests(language, browser):
     return result.wasSuccessful()
 
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the whitelabel E2E suite.")
+    parser.add_argument(
+        "-c", "--classes", nargs="+", default=RUN_DEFAULTS["classes"],
+        help="test class names or module paths, globs allowed (e.g. TestTransfer 'tests.deposit_test.*')"
+    )
+    parser.add_argument("-m", "--methods", nargs="+", help="test method globs (e.g. 'test_0[1-3]_*')")
+    parser.add_argument("-l", "--languages", nargs="+", default=RUN_DEFAULTS["languages"])
+    parser.add_argument("-b", "--browsers", nargs="+", default=RUN_DEFAULTS["browsers"])
+    parser.add_argument(
+        "-w", "--workers", type=int, default=RUN_DEFAULTS["workers"],
+        help="browser workers per (browser, language) run; 1 keeps the serial runner"
+    )
+    parser.add_argument("--shard", default="1/1", help="INDEX/COUNT, e.g. 2/4 runs the second of four shards")
+    parser.add_argument(
+        "--nodes", nargs="+", default=nodes(),
+        help="Selenium Grid URLs; each node runs its own shard of the selection (default: WEBDRIVER_BACKEND)"
+    )
+    parser.add_argument(
+        "--multi-language", action=argparse.BooleanOptionalAction, default=MULTI_LANGUAGE,
+        help="run @multi_language tests once, checking every language in one session (default: MULTI_LANGUAGE)"
+    )
+    parser.add_argument("--list", action="store_true", help="print the selected tests and exit")
+    args = parser.parse_args(argv)
+    try:
+        args.shard_index, args.shard_count = (int(part) for part in args.shard.split("/"))
+    except ValueError:
+        parser.error("--shard must look like INDEX/COUNT")
+    if not 1 <= args.shard_index <= args.shard_count:
+        parser.error("--shard INDEX must be between 1 and COUNT")
+    return args
+
+
 if __name__ == "__main__":
-    # languages = ["cn", "en", "bm"]
-    #browsers = ["chrome", "firefox","edge","safari"]
-    languages = ["bm"]
-    browsers = ["firefox"]
+    args = parse_args()
+    registry = TestRegistry()
+    selections = shard(
+        registry, registry.select(args.classes, args.methods), args.shard_index, args.shard_count
+    )
+
+    # None runs browsers locally; otherwise every node gets its own slice of this shard
+    node_urls = args.nodes or [None]
+    assignments = [
+        (node, node_selections) for index, node in enumerate(node_urls)
+        for node_selections in [shard(registry, selections, index + 1, len(node_urls))] if node_selections
+    ]
+
+    if args.list or not selections:
+        if not selections:
+            print("No tests match the selection")
+        for node, node_selections in assignments:
+            if node:
+                print(f"[{node}]")
+            for selection in node_selections:
+                methods = ", ".join(selection.methods) if selection.methods is not None else "(generated at load time)"
+                print(f"{selection.module}.{selection.class_name}: {methods}")
+        raise SystemExit(0 if selections else 1)
+
+    languages = args.languages
+    # the first language's process runs the @multi_language tests for all of them
+    multi_languages = languages if args.multi_language else None
+    browsers = args.browsers
+    workers = args.workers
+    run_id = new_run_id()
     processes = []
 
+    if USE_MOCK_BACKOFFICE:
+        # served from this process so every worker shares one set of mock wallets
+        ensure_mock_backoffice()
+
+    if REFERENCE_CACHE["warm_up"]:
+        # every worker process then reads promos, VIP levels, providers and rewards from disk;
+        # imported here because it pulls in requests, which --list does not need
+        from utils import reference_cache
+        reference_cache.warm_up(languages)
+
+    if ACCOUNT_POOL["refill_during_run"]:
+        provisioner = AccountProvisioner(get_account_pool(), default_helper_factory())
+        provisioner.start_refill()
+
     for browser in browsers:
         for language in languages:
-            logging.info(
-                f"Starting test run for language: {language}, browser: {browser}"
-            )
-            process = multiprocessing.Process(target=run_tests,
-                                              args=(language, browser))
-            process.start()
-            processes.append(process)
+            for node, node_selections in assignments:
+                logging.info(
+                    f"Starting test run for language: {language}, browser: {browser}"
+                    + (f" on {node}" if node else "")
+                )
+                process = multiprocessing.Process(
+                    target=run_tests,
+                    args=(language, browser, node_selections, workers, run_id, node, multi_languages)
+                )
+                process.start()
+                processes.append(process)
 
     for process in processes:
         process.join()
+
+    # built once every process has finished; results of every node and process are merged from
+    # test_results/runs/<run_id>
+    build_reports(run_id)
+    print("Slowest helpers:")
+    for line in format_top_helpers(run_id):
+        print(f"  {line}")
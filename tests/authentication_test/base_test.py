@@ -7,10 +7,6 @@ import requests
 import re
 from datetime import datetime, timedelta
 import os
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.safari.service import Service as SafariService
-from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.safari.options import Options as SafariOptions
@@ -18,9 +14,8 @@ from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, UnexpectedAlertPresentException
-from config.constant import HEADLESS, CREDENTIALS, LANGUAGE_SETTINGS, PROFILE_URL, API_URL
-import tempfile
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, UnexpectedAlertPresentException, StaleElementReferenceException
+from config.constant import HEADLESS, REUSE_BROWSER, API_LOGIN, FRONTEND_AUTH, CREDENTIALS, LANGUAGE_SETTINGS, API_URL, NETWORK_CAPTURE
 import requests
 import string
 from urllib.parse import urlparse
@@ -31,6 +26,20 @@ from selenium.webdriver.remote.remote_connection import RemoteConnection
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.remote_connection import ClientConfig
 from selenium.webdriver.safari.options import Options as SafariOptions
+from concurrent.futures import ThreadPoolExecutor
+from utils.api_client import get_client
+from utils.driver_pool import get_driver_pool
+from utils.waits import Waits
+from utils.dom_snapshot import snapshot
+from utils.fixtures import UserState, get_fixture_resolver
+from utils import lean_browser
+from utils.network_capture import NetworkCapture, logging_capability
+from utils import reference_cache
+from utils.image_fixtures import get_image_store
+from utils.webdriver_backend import start_driver
+from utils.multi_language import language_url
+from utils.turnover_service import TurnoverService, summarize
+from utils.tracing import traced_helpers, tracer
 
 
 class ContinueOnFailureTestResult(unittest.TestResult):
@@ -44,7 +53,15 @@ class ContinueOnFailureTestResult(unittest.TestResult):
         print(f"Test Error: {test}")
 
 
+@traced_helpers
 class BaseTest(unittest.TestCase):
+    # lean browser profile for every test of the class; single tests can use @lean_browser()
+    LEAN_BROWSER = False
+    # every language a @multi_language test checks in this session, set by the runner
+    languages = None
+    # accounts resolved during a multi-language pass, reused for the following languages
+    pass_users = None
+    session_user = None
 
     @classmethod
     def setUpClass(cls):
@@ -52,13 +69,16 @@ class BaseTest(unittest.TestCase):
         cls.logger.setLevel(logging.DEBUG)
 
     @classmethod
-    def initialize_browser(cls, browser):
+    def initialize_browser(cls, browser, lean=False):
         if browser == "chrome":
             options = ChromeOptions()
+            if lean:
+                lean_browser.chromium_options(options)
+            if NETWORK_CAPTURE["enabled"]:
+                options.set_capability(*logging_capability(browser))
             if HEADLESS:
                 options.add_argument("--headless")
-            service = ChromeService()
-            return webdriver.Chrome(service=service, options=options)
+            return start_driver(browser, options)
         elif browser == "firefox":
             options = FirefoxOptions()
             firefox_options = options
@@ -89,22 +109,25 @@ class BaseTest(unittest.TestCase):
 
             # Disable safe browsing checks for this test
             firefox_options.set_preference("browser.safebrowsing.enabled", False)
+            if lean:
+                lean_browser.firefox_options(options)
             if HEADLESS:
                 options.add_argument("--headless")
-            service = FirefoxService()
-            return webdriver.Firefox(service=service, options=options)
+            return start_driver(browser, options)
         elif browser == "safari":
             options = SafariOptions()
             if HEADLESS:
                 options.add_argument("--headless")
-            service = SafariService()
-            return webdriver.Safari(service=service, options=options)
+            return start_driver(browser, options)
         elif browser == "edge":
             options = EdgeOptions()
+            if lean:
+                lean_browser.chromium_options(options)
+            if NETWORK_CAPTURE["enabled"]:
+                options.set_capability(*logging_capability(browser))
             if HEADLESS:
                 options.add_argument("--headless")
-            service = EdgeService()
-            return webdriver.Edge(service=service, options=options)
+            return start_driver(browser, options)
         else:
             raise ValueError(f"Unsupported browser: {browser}")
 
@@ -112,6 +135,7 @@ class BaseTest(unittest.TestCase):
         super().__init__(methodName)
         self.language = language
         self.browser = browser
+        self.api = get_client()
 
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.INFO)
@@ -151,12 +175,88 @@ class BaseTest(unittest.TestCase):
         if not self.browser or not self.language:
             raise ValueError("Browser or language is not set.")
         self.logger.info(f"Setting up {self.browser} browser for {self.language} language...")
-        self.driver = self.initialize_browser(self.browser)
+        self.driver = self.acquire_browser()
         self.url = LANGUAGE_SETTINGS[self.language]["home_url"]
+        if self.lean:
+            lean_browser.install(self.driver)
+        if NETWORK_CAPTURE["enabled"]:
+            self.network = NetworkCapture(self.driver)
+            self.network.start()
         self.driver.get(self.url)
         # size of iphone X, as desktop UI is not ready
         self.driver.set_window_size(375, 812)
 
+    def tearDown(self):
+        if hasattr(self, "driver"):
+            self.release_browser()
+
+    @property
+    def lean(self):
+        test_method = getattr(self, self._testMethodName, None)
+        return getattr(test_method, "lean_browser", self.LEAN_BROWSER)
+
+    @property
+    def pool_key(self):
+        # lean and normal sessions are launched with different options, so never hand one out as the other
+        return f"{self.browser}:lean" if self.lean else self.browser
+
+    def acquire_browser(self):
+        lean = self.lean
+        if REUSE_BROWSER:
+            return get_driver_pool().acquire(
+                self.pool_key, lambda _: self.initialize_browser(self.browser, lean),
+                LANGUAGE_SETTINGS[self.language]["home_url"]
+            )
+        return self.initialize_browser(self.browser, lean)
+
+    def switch_language(self, language, url=None):
+        """Continue in ``language`` in the same session by opening ``url`` (default: this page) under its route."""
+        self.logger.info(f"Switching to {language} in the same session")
+        self.language = language
+        self.url = LANGUAGE_SETTINGS[language]["home_url"]
+        if getattr(self, "network", None) is not None:
+            self.network.start()
+        self.driver.get(language_url(url or self.driver.current_url, language))
+        self.waits.page_settled()
+
+    def wait_animation(self, seconds=2):
+        """Fixed wait for a UI animation; shortened by LEAN_BROWSER["sleep_scale"] when animations are off."""
+        time.sleep(lean_browser.animation_delay(seconds) if self.lean else seconds)
+
+    @property
+    def waits(self):
+        return Waits(self.driver, self.logger)
+
+    def snapshot(self, selector=None, children=None, attributes=None, elements=None, lists=None):
+        """Structured data for many elements from one execute_script call; see utils.dom_snapshot."""
+        return snapshot(
+            self.driver, selector, children=children, attributes=attributes, elements=elements, lists=lists
+        )
+
+    def rendered_api_data(self, path, timeout=None):
+        """
+        ``data`` of the web app's latest response for ``path``, i.e. what the page rendered,
+        or None when nothing was captured so callers can fall back to their own request.
+        """
+        network = getattr(self, "network", None)
+        if network is None:
+            return None
+        response = network.latest(path, timeout=timeout)
+        if response is None:
+            self.logger.info(f"No captured response for {path}, calling the API directly")
+            return None
+        self.logger.info(f"Using captured {response}")
+        return response.data
+
+    def release_browser(self):
+        driver = getattr(self, "driver", None)
+        if driver is None:
+            return
+        if REUSE_BROWSER:
+            get_driver_pool().release(self.pool_key, driver)
+        else:
+            driver.quit()
+
     #id
     def navigate_to_login_page(self):
         self.annoucement_close_button()
@@ -168,7 +268,6 @@ class BaseTest(unittest.TestCase):
         self.annoucement_close_button()
         self.daily_checkin_close_button()
         self.click_navigation_bar("footer-profile-button")
-        time.sleep(4)
 
         displayed_text = WebDriverWait(self.driver,
                                        10).until(EC.visibility_of_element_located((By.ID, "username"))).text
@@ -206,7 +305,7 @@ class BaseTest(unittest.TestCase):
             link = self.driver.find_element(By.ID, buttomNavigationBar)
             actions = ActionChains(self.driver)
             actions.move_to_element(link).click().perform()
-            time.sleep(2)
+            self.waits.page_settled()
         except Exception as e:
             self.fail(f"Could not click navigation link: {str(e)}")
 
@@ -223,15 +322,14 @@ class BaseTest(unittest.TestCase):
     def navigate_to_profile_menu(self, element_id):
         actions = ActionChains(self.driver)
         self.click_navigation_bar("footer-profile-button")
-        time.sleep(5)
-        link = self.driver.find_element(By.ID, element_id)
+        link = WebDriverWait(self.driver, 10).until(EC.presence_of_element_located((By.ID, element_id)))
         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", link)
+        self.waits.element_stable(link)
         actions.move_to_element(link).click().perform()
-        time.sleep(5)
+        self.waits.page_settled()
     
     def navigate_to_live_page(self):
         self.click_navigation_bar("footer-live-button")
-        time.sleep(2)
         self.boboLiveLogin()
 
     def navigate_AccSecurity(self):
@@ -278,12 +376,12 @@ class BaseTest(unittest.TestCase):
                                          10).until(EC.element_to_be_clickable((By.ID, "close-modal-button")))
 
             close_button.click()
-            time.sleep(2)
+            self.waits.backdrop_gone()
             if close_mission:
                 close_button = WebDriverWait(self.driver,
                                              10).until(EC.element_to_be_clickable((By.ID, "not-yet-check-in-close")))
                 close_button.click()
-                time.sleep(2)
+                self.waits.backdrop_gone()
         except TimeoutException:
             self.logger.info("No checkin popup found")
             pass
@@ -291,11 +389,99 @@ class BaseTest(unittest.TestCase):
     def perform_login(self, username, password, close_mission=True):
         self.enter_credentials(username, password)
         self.click_login_button()
-        time.sleep(5)
+        self.waits.page_settled()
         self.annoucement_close_button()
-        time.sleep(2)
+        self.waits.backdrop_gone()
         self.daily_checkin_close_button(close_mission)
 
+    def login_as(self, username, password, target_url=None, close_mission=True):
+        """
+        Log in without the login form: fetch a token from the API, write the app's
+        session into the browser and open ``target_url``. Falls back to the form
+        if the token cannot be fetched or the app does not accept the session.
+        """
+        home_url = LANGUAGE_SETTINGS[self.language]["home_url"]
+        if self.pass_users is not None and self.session_user == username:
+            # later languages of a multi-language pass keep the session of the first
+            self.driver.get(target_url or home_url)
+            self.waits.page_settled()
+            if self.is_logged_in():
+                self.logger.info(f"Reusing session of {username}")
+                self.dismiss_popups(close_mission)
+                return
+
+        token = self.api.get_token(username, password) if API_LOGIN else None
+
+        if token:
+            self.inject_session(username, token)
+            self.driver.get(target_url or home_url)
+            self.waits.page_settled()
+            if self.is_logged_in():
+                self.logger.info(f"Logged in as {username} with injected session")
+                self.session_user = username
+                self.dismiss_popups(close_mission)
+                return
+            self.logger.warning(f"Injected session for {username} was not accepted, using the login form")
+            self.clear_session()
+
+        self.driver.get(home_url)
+        self.navigate_to_login_page()
+        self.perform_login(username, password, close_mission)
+        if target_url:
+            self.driver.get(target_url)
+
+    def use_state(self, state=None, login=True, close_mission=True):
+        """Resolve a utils.fixtures.UserState (a fresh account by default) and make it this test's user."""
+        state = state or UserState()
+        user = self.pass_users.get(state.key()) if self.pass_users is not None else None
+        if user is None:
+            user = get_fixture_resolver().resolve(state)
+            if self.pass_users is not None:
+                self.pass_users[state.key()] = user
+        self.username, self.password = user.credentials
+        self.user_id = user.user_id
+        if login:
+            self.login_as(self.username, self.password, close_mission=close_mission)
+        return user
+
+    def inject_session(self, username, token):
+        home = urlparse(LANGUAGE_SETTINGS[self.language]["home_url"])
+        if urlparse(self.driver.current_url).netloc != home.netloc:
+            # cookies and storage can only be written for the page's own origin
+            self.driver.get(LANGUAGE_SETTINGS[self.language]["home_url"])
+
+        for name, value in FRONTEND_AUTH["cookies"].items():
+            self.driver.add_cookie({"name": name, "value": value.format(token=token, username=username), "path": "/"})
+        for key, value in FRONTEND_AUTH["local_storage"].items():
+            self.driver.execute_script(
+                "window.localStorage.setItem(arguments[0], arguments[1]);", key,
+                value.format(token=token, username=username)
+            )
+
+    def clear_session(self):
+        self.session_user = None
+        self.driver.delete_all_cookies()
+        self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+
+    def is_logged_in(self):
+        return not self.driver.find_elements(By.ID, "unlogged-login-button")
+
+    def dismiss_popups(self, close_mission=True):
+        # popups are already rendered once the page has settled, so only look briefly
+        for button_id in ("announcement-close-button", "close-modal-button"):
+            buttons = self.driver.find_elements(By.ID, button_id)
+            if buttons and buttons[0].is_displayed():
+                buttons[0].click()
+                self.waits.backdrop_gone()
+                if button_id == "close-modal-button" and close_mission:
+                    try:
+                        WebDriverWait(self.driver, 3).until(
+                            EC.element_to_be_clickable((By.ID, "not-yet-check-in-close"))
+                        ).click()
+                        self.waits.backdrop_gone()
+                    except TimeoutException:
+                        pass
+
     def get_field(self, field_name, form_type="login"):
         if form_type == "login":
             locator_type, locator_value = self.login_field_locators[field_name]
@@ -365,8 +551,7 @@ class BaseTest(unittest.TestCase):
 
     def error_box(self, expected_error_message, secondText=None):
         #id
-        error_icon = WebDriverWait(self.driver,
-                                   5).until(EC.visibility_of_element_located((By.CSS_SELECTOR, ".swal2-icon")))
+        error_icon = self.waits.toast_shown(".swal2-icon", timeout=5)
         self.assertTrue(error_icon.is_displayed(), "Error message is not displayed")
 
         invalidError = WebDriverWait(self.driver,
@@ -401,12 +586,14 @@ class BaseTest(unittest.TestCase):
         ), "Password field should initially be of type 'password'"
 
         visibility_toggle.click()
-        time.sleep(2)
+        self.waits.until("password_visible", lambda driver: password_input.get_attribute("type") == "text", required=False)
         assert (password_input.get_attribute("type") == "text"), "Password field should be of type 'text' when visible"
         assert (password_input.get_attribute("value") == password), "Visible password should match the entered password"
 
         visibility_toggle.click()
-        time.sleep(2)
+        self.waits.until(
+            "password_hidden", lambda driver: password_input.get_attribute("type") == "password", required=False
+        )
         assert (password_input.get_attribute("type") == "password"), "Password field should revert to type 'password'"
 
     def navigate_to_reload_page(self, tab):
@@ -415,19 +602,19 @@ class BaseTest(unittest.TestCase):
         if tab == "deposit":
             section_button = WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.ID, "home-deposit-button")))
             section_button.click()
-            time.sleep(2)
+            self.waits.page_settled()
 
         elif tab == "withdraw":
             section_button = WebDriverWait(driver,
                                            10).until(EC.element_to_be_clickable((By.ID, "home-withdrawal-button")))
             section_button.click()
-            time.sleep(2)
+            self.waits.page_settled()
 
         elif tab == "transfer":
             section_button = WebDriverWait(driver,
                                            10).until(EC.element_to_be_clickable((By.ID, "home-transfer-button")))
             section_button.click()
-            time.sleep(2)
+            self.waits.page_settled()
 
     def choose_amount(self, index):
         driver = self.driver
@@ -542,72 +729,87 @@ class BaseTest(unittest.TestCase):
         self.logger.info(bonusDesc)
 
         #waitid
-        time.sleep(1)
         close_button = WebDriverWait(self.driver, 10).until(
             EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="CloseIcon"]'))
         )
+        self.waits.element_stable(close_button)
         close_button.click()
-        time.sleep(2)
+        self.waits.backdrop_gone()
 
-    def check_match_record(self, date, index):
+    def collect_table_rows(self, max_pages=None):
+        """
+        Cell texts of every row of the paginated MUI table, one list per row.
+
+        Each page is read with a single snapshot call. After clicking next, the
+        old first row has to be replaced (removed, or showing other text) before
+        the next page is read, so a page is never read twice.
+        """
         driver = self.driver
+        rows = []
+        page = 0
 
         while True:
-            time.sleep(1)
-            table_rows = driver.find_elements(By.CSS_SELECTOR, "tbody.MuiTableBody-root tr")
-            self.logger.info(f"Found {len(table_rows)} rows in the current page")
-
-            for row in table_rows:
-                date_cell = row.find_element(By.CSS_SELECTOR, "td.MuiTableCell-body")
-                date_str = date_cell.text.split(' ')[0]
-                self.logger.info(f"Checking date: {date_str}")
-                day, month, year = date_str.split('/')
-                try:
-                    if index == 0 or index == 1:
-                        if index == 0:
-                            self.logger.info("Today")
-                        else:
-                            self.logger.info("Yesterday")
-                        self.assertEqual(date_str, date, "Wrong Result")
-                        self.logger.info("Matched")
-                    elif index == 2:
-                        self.logger.info("1 Week")
-                        self.assertIn(date_str, date, "Date not found in dates_list")
-                        self.logger.info("Matched")
-                    elif index == 3:
-                        self.logger.info("1 Month")
-                        self.logger.info(f"Extracted month: {month}")
-                        self.assertEqual(month, date, "Date not found in dates_list")
-                        self.logger.info("Matched")
-                    else:
-                        self.logger.info("3 months")
-                        self.logger.info(len(date))
-                        self.assertIn(month, date, "Date not found in dates_list")
-                        self.logger.info("Matched")
-                except AssertionError as e:
-                    self.logger.error(f"Assertion failed: {str(e)}")
-                    self.fail("Wrong Date Display")
-
-            time.sleep(2)
-            next_button = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "button[aria-label='Go to next page']"))
-            )
-
-            # Check if the button is clickable and not disabled
-            if "Mui-disabled" not in next_button.get_attribute("class"):
-                driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
-                next_button.click()
-            else:
+            self.waits.network_idle()
+            self.waits.element_stable((By.CSS_SELECTOR, "tbody.MuiTableBody-root"))
+            page_rows = self.snapshot("tbody.MuiTableBody-root tr", lists={"cells": "td.MuiTableCell-body"})
+            self.logger.info(f"Found {len(page_rows)} rows in the current page")
+            rows.extend(row["lists"]["cells"] for row in page_rows)
+            page += 1
+
+            next_buttons = self.snapshot("button[aria-label='Go to next page']")
+            if max_pages and page >= max_pages:
+                break
+            if not next_buttons or "Mui-disabled" in next_buttons[0]["classes"]:
                 self.logger.info("Next button is disabled; no more pages left.")
                 break
 
-            WebDriverWait(driver,
-                          10).until(EC.visibility_of_element_located((By.CSS_SELECTOR, "tbody.MuiTableBody-root")))
+            self.waits.backdrop_gone()
+            next_button = next_buttons[0]["element"]
+            driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
+            next_button.click()
+            if page_rows:
+                WebDriverWait(driver, 10).until(lambda _: self.row_replaced(page_rows[0]))
 
-            table_rows = driver.find_elements(By.CSS_SELECTOR, "tbody.MuiTableBody-root tr")
-            self.logger.info(f"Found {len(table_rows)} rows after navigating to the next page")
+        return rows
+
+    @staticmethod
+    def row_replaced(row):
+        """True once a row from ``snapshot`` is gone from the page or shows other text."""
+        try:
+            return (row["element"].get_attribute("innerText") or "").strip() != row["text"]
+        except StaleElementReferenceException:
+            return True
 
-            WebDriverWait(driver, 2).until(EC.visibility_of(table_rows[0]))
+    def check_match_record(self, date, index):
+        for cells in self.collect_table_rows():
+            date_str = (cells[0] if cells else "").split(' ')[0]
+            self.logger.info(f"Checking date: {date_str}")
+            day, month, year = date_str.split('/')
+            try:
+                if index == 0 or index == 1:
+                    if index == 0:
+                        self.logger.info("Today")
+                    else:
+                        self.logger.info("Yesterday")
+                    self.assertEqual(date_str, date, "Wrong Result")
+                    self.logger.info("Matched")
+                elif index == 2:
+                    self.logger.info("1 Week")
+                    self.assertIn(date_str, date, "Date not found in dates_list")
+                    self.logger.info("Matched")
+                elif index == 3:
+                    self.logger.info("1 Month")
+                    self.logger.info(f"Extracted month: {month}")
+                    self.assertEqual(month, date, "Date not found in dates_list")
+                    self.logger.info("Matched")
+                else:
+                    self.logger.info("3 months")
+                    self.logger.info(len(date))
+                    self.assertIn(month, date, "Date not found in dates_list")
+                    self.logger.info("Matched")
+            except AssertionError as e:
+                self.logger.error(f"Assertion failed: {str(e)}")
+                self.fail("Wrong Date Display")
 
     #Test Specific
     #Test "Bet Record"
@@ -836,7 +1038,7 @@ class BaseTest(unittest.TestCase):
         else:
             url = CREDENTIALS["ApproveDepositRequest"].format(BO_base_url = CREDENTIALS["BO_base_url"], ID=ID)
 
-        response = requests.get(url)
+        response = self.api.get(url)
 
         if isReject:
             if response.status_code == 200:
@@ -864,12 +1066,12 @@ class BaseTest(unittest.TestCase):
         turnoverList=None
     ):
         driver = self.driver
-        time.sleep(2)
+        self.waits.backdrop_gone()
         submit_button = WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable((By.ID, submit)))
         driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", submit_button)
-        time.sleep(3)
+        self.waits.element_stable(submit_button)
         submit_button.click()
-        time.sleep(2)
+        self.waits.network_idle()
 
         if expected_result == "success":
             try:
@@ -891,7 +1093,7 @@ class BaseTest(unittest.TestCase):
                         ))
                     )
                     OkButton.click()
-                    time.sleep(1)
+                    self.waits.backdrop_gone()
 
                 else:
                     self.success_box()
@@ -899,7 +1101,6 @@ class BaseTest(unittest.TestCase):
                 self.fail("Cannot submit successfully")
 
         elif expected_result == "failure":
-            time.sleep(1)
             if check_general_error:
                 self.check_general_error(
                     expected_error, id, turnoverIncomplete=turnoverIncomplete, locked_by_list=locked_by_list,
@@ -1032,7 +1233,7 @@ class BaseTest(unittest.TestCase):
         try:
             camera_button = WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.ID, "upload-camera-button")))
             camera_button.click()
-            time.sleep(2)
+            self.waits.backdrop_gone()
             take_photo_button = WebDriverWait(driver,
                                               10).until(EC.element_to_be_clickable((By.ID, "camera-capture-button")))
             take_photo_button.click()
@@ -1044,34 +1245,19 @@ class BaseTest(unittest.TestCase):
 
     def upload_from_gallery(self, replace=False, checkLargeFile=False):
         if checkLargeFile:
-            self.test_image_url = PROFILE_URL["large_image_url"]
+            fixture = "large"
         else:
-            if replace:
-                self.test_image_url = PROFILE_URL["replace_image_url"]
-            else:
-                self.test_image_url = PROFILE_URL["valid_image_url"]
+            fixture = "profile_replace" if replace else "profile"
 
         driver = self.driver
         gallery_text = LANGUAGE_SETTINGS[self.language]["change_profile"]["gallery"]
         try:
-            # Get the filename from URL
-            filename = os.path.basename(urlparse(self.test_image_url).path)
-
-            # Create a temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(filename)[1]) as temp_file:
-                try:
-                    response = requests.get(self.test_image_url)
-                    response.raise_for_status()  # Raises an HTTPError for bad responses
-                    temp_file.write(response.content)
-                    self.test_image_path = temp_file.name
-                except requests.exceptions.RequestException as e:
-                    self.fail(f"Failed to download image from URL: {e}")
-                    return False
+            self.test_image_path = get_image_store().path(fixture)
 
             if not os.path.exists(self.test_image_path):
                 raise FileNotFoundError(f"Test image not found at {self.test_image_path}")
 
-            time.sleep(2)
+            self.waits.backdrop_gone()
             WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.ID, "upload-gallery-button")))
             self.logger.info(f"Clicked '{gallery_text}' button")
 
@@ -1080,7 +1266,7 @@ class BaseTest(unittest.TestCase):
             )
             self.logger.info("File input element located.")
             file_input.send_keys(self.test_image_path)
-            time.sleep(2)
+            self.waits.network_idle()
             self.logger.info(f"Uploaded image from {self.test_image_path}")
 
         except Exception as e:
@@ -1108,7 +1294,7 @@ class BaseTest(unittest.TestCase):
 
     def check_balance(self, total_amount=None, games_amount=None, language=None, return_balance=None):
         driver = self.driver
-        time.sleep(2)
+        self.waits.network_idle()
         deposit_balance_element = WebDriverWait(driver,
                                                 10).until(EC.visibility_of_element_located((By.ID, "wallet-balance")))
 
@@ -1160,7 +1346,7 @@ class BaseTest(unittest.TestCase):
             EC.element_to_be_clickable((By.CSS_SELECTOR, "div.MuiPaper-root.mui-theme-l6njlf"))
         )
         non_withdrawable_section.click()
-        time.sleep(2)
+        self.wait_animation()
         parent_divs = driver.find_elements(
             By.CLASS_NAME, "MuiPaper-root.MuiPaper-elevation.MuiPaper-rounded.MuiPaper-elevation0.mui-theme-ppvpol"
         )
@@ -1427,18 +1613,18 @@ class BaseTest(unittest.TestCase):
                 addAccountButton = WebDriverWait(driver,
                                                  10).until(EC.element_to_be_clickable((By.ID, "add-account-button")))
                 addAccountButton.click()
-                time.sleep(2)
+                self.wait_animation()
             else:
                 addAccountButton = WebDriverWait(driver, 10).until(
                     EC.element_to_be_clickable((By.ID, "add-bank-account-button"))
                 )
                 addAccountButton.click()
-            time.sleep(2)
+            self.wait_animation()
 
             WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.ID, "add-bank-form")))
             bankDropdown = WebDriverWait(driver, 3).until(EC.element_to_be_clickable((By.ID, "bank-select")))
             bankDropdown.click()
-            time.sleep(2)
+            self.wait_animation()
 
             options = WebDriverWait(driver, 3).until(
                 EC.presence_of_all_elements_located((By.XPATH, '//ul[@role="listbox"]//li'))
@@ -1574,7 +1760,7 @@ class BaseTest(unittest.TestCase):
         self.logger.info("Refreshing balance")
         balance_refresh = WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.ID, "refresh-button")))
         balance_refresh.click()
-        time.sleep(5)
+        self.waits.network_idle()
         self.logger.info("Done refreshing balance")
         BalanceStr = self.check_balance(language=self.language, return_balance=True)
         if not BalanceStr:
@@ -1585,26 +1771,10 @@ class BaseTest(unittest.TestCase):
 
     def getPromoDetails(self, promo_text, checkPromo=False, remainingPromos=None, verifyInvalidVoucher=False):
         try:
-            payload = {
-                "username": CREDENTIALS["duplicated_user"]["username"],
-                "password": CREDENTIALS["duplicated_user"]["password"]
-            }
-            response = requests.post(f"{CREDENTIALS['BO_base_url']}/api/login", json=payload)
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get("code") != 200:
-                self.fail(f"Login failed: {data.get('message')}")
-
-            token = data["data"]["token"]
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "language": self.language
-            }
-
-            response = requests.get(f"{CREDENTIALS['BO_base_url']}/api/depositInfo", headers=headers)
-            response.raise_for_status()
-            promoList = response.json().get("data", {}).get("popoPromo", [])
+            depositInfo = self.rendered_api_data("/api/depositInfo")
+            if depositInfo is None:
+                depositInfo = reference_cache.deposit_info(self.language) or {}
+            promoList = depositInfo.get("popoPromo", [])
 
             if verifyInvalidVoucher:
                 apiPromoValues = [promo["optionCode"] for promo in promoList]
@@ -1801,7 +1971,7 @@ class BaseTest(unittest.TestCase):
         dummyBank = WebDriverWait(self.driver,
                                   10).until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#Main_Bank img")))
         dummyBank.click()
-        time.sleep(2)
+        self.wait_animation()
         username_input = WebDriverWait(self.driver, 10).until(
             EC.presence_of_element_located((By.XPATH, "//input[@placeholder='Your Username']"))
         )
@@ -1874,7 +2044,7 @@ class BaseTest(unittest.TestCase):
         try:
             time.sleep(2)
             self.scrollToSection("wallet-form-popoPromo")
-            time.sleep(2)
+            self.wait_animation()
             initialPromoOptions = self.getPromoOptions()
             initialPromoTexts = [promo.text for promo in initialPromoOptions]
             self.logger.info(f"Found {len(initialPromoTexts)} promo options")
@@ -2062,11 +2232,11 @@ class BaseTest(unittest.TestCase):
         self.annoucement_close_button()
         self.daily_checkin_close_button()
 
-        time.sleep(2)
+        self.waits.page_settled()
 
     def checkSpinTicket(self):
         self.navigateHomePage()
-        time.sleep(2)
+        self.wait_animation()
         self.logger.info("Checking spin ticket")
         self.clickMiniGameWidget("lucky_wheel")
         self.driver.refresh()
@@ -2240,7 +2410,7 @@ class BaseTest(unittest.TestCase):
         self.click_navigation_bar("footer-profile-button")
         self.click_navigation_bar("settings-button")
         self.click_navigation_bar("logout-list-item")
-        time.sleep(2)
+        self.waits.page_settled()
 
     def successMessage(self, id, successMessage=None):
         try:
@@ -2256,70 +2426,46 @@ class BaseTest(unittest.TestCase):
     def run(self, result=None):
         if result is None:
             result = ContinueOnFailureTestResult()
-        return super().run(result)
+        with tracer.test(self.id()):
+            return super().run(result)
 
     def checkIncompleteTurnover(self, userID, checkIncomplete=False, language=None, transfer_check=False):
-        turnoverAPI = CREDENTIALS["CheckTurnover"].format(BO_base_url = CREDENTIALS["BO_base_url"], ID=userID, language=language)
-        locked_by_list = []
-
-        response = requests.get(turnoverAPI)
-
-        if response.status_code == 200:
-            self.logger.info(f"Turnover API Response: {response.json()}")
-            turnoverData = response.json()
-            if len(turnoverData) == 0:
-                self.logger.info("No turnover data found")
-                self.logger.info(f"Locked by list: {locked_by_list}")
-                return False, locked_by_list
-            else:
-                hasIncomplete = False
-                for turnover in turnoverData:
-                    self.logger.info(f"Progress: {turnover['progress']}")
-                    self.logger.info(f"Target: {turnover['target']}")
-                    progress = float(turnover['progress'])
-                    target = float(turnover['target'])
-                    locked = turnover['lockedby']
-
-                    if transfer_check:
-                        if locked.startswith('Promo:'):
-                            promo_code = locked.replace('Promo:', '').strip()
-                            locked_by_list.append(promo_code)
-                            if checkIncomplete and progress < target:
-                                hasIncomplete = True
-                    else:
-                        locked_by_list.append(locked)
-                        if checkIncomplete and progress < target:
-                            hasIncomplete = True
-
-                uniqueLockedBy = list(set(locked_by_list))
-                return (hasIncomplete, uniqueLockedBy) if checkIncomplete else (False, uniqueLockedBy)
-        else:
-            self.logger.error(f"Failed to check turnover. Status code: {response.status_code}")
+        try:
+            turnoverData = self.turnovers(userID, language).state()
+        except requests.HTTPError as e:
+            self.logger.error(f"Failed to check turnover. Status code: {e.response.status_code}")
             self.fail("Check turnover failed")
 
+        if len(turnoverData) == 0:
+            self.logger.info("No turnover data found")
+            return False, []
+        return summarize(turnoverData, checkIncomplete, transfer_check)
+
+    def turnovers(self, userID, language=None):
+        """TurnoverService for the user; fetch once, then apply actions and read the result from it."""
+        service = TurnoverService(userID, language, client=self.api, logger=self.logger)
+        service.fetch()
+        return service
+
     def switchAccount(self, username, password):
-        self.logout()
-        self.perform_login(username, password)
+        self.clear_session()
+        self.login_as(username, password)
 
     def login(self, username, password):
-        payload = {
-            "username": username,
-            "password": password
-        }
-        response = requests.post(f"{CREDENTIALS['BO_base_url']}/api/v2/login", json=payload)
-        response.raise_for_status()
-        data = response.json()
+        token = self.api.get_token(username, password)
 
-        if data.get("code") == 200:
-            token = data["data"]["token"]
+        if token:
             self.logger.info("Login successful!")
             return token
         else:
-            self.logger.error(f"Login failed: {data.get('message')}")
+            self.logger.error(f"Login failed for {username}")
             return None
 
+    def api_credentials(self):
+        return (self.username, self.password)
+
     def get_game_ids(self, headers):
-        response = requests.get(f"{CREDENTIALS['BO_base_url']}/api/transfers", headers=headers)
+        response = self.api.get(f"{CREDENTIALS['BO_base_url']}/api/transfers", headers=headers)
         response.raise_for_status()
         result = response.json().get("data")
         result = sorted(self.parse_game_ids(result), key=lambda x: x["id"])
@@ -2349,7 +2495,6 @@ class BaseTest(unittest.TestCase):
 
     def navigate_to_transfer(self):
         self.navigate_to_reload_page("transfer")
-        time.sleep(2)
 
     def generate_valid_phone(self):
         phone = "1"
@@ -2360,15 +2505,7 @@ class BaseTest(unittest.TestCase):
         return f"{phone}{remaining_digits}"
 
     def get_vip_levels(self, language=None):
-        token = self.login(self.username, self.password)
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Language": language if language else self.language
-        }
-        response = requests.get(f"{API_URL}/api/uservip", headers=headers)
-        response.raise_for_status()
-        vip_levels = response.json().get("data")
-        return vip_levels
+        return reference_cache.vip_levels(language if language else self.language)
 
     def performWithdrawTest(self, is_reject=False, is_processing=False):
         try:
@@ -2415,105 +2552,42 @@ class BaseTest(unittest.TestCase):
 
     def get_turnover_ids(self, userID, language=None):
         try:
-            turnoverAPI = CREDENTIALS["CheckTurnover"].format(BO_base_url = CREDENTIALS["BO_base_url"], ID=userID, language=language)
-            turnover_ids = []
-
-            response = requests.get(turnoverAPI)
-            if response.status_code == 200:
-                turnoverData = response.json()
-                self.logger.info(f"Turnover data: {turnoverData}")
-
-                for item in turnoverData:
-                    if 'id' in item:
-                        turnover_ids.append(item['id'])
-
-                self.logger.info(f"Found turnover IDs: {turnover_ids}")
-                return turnover_ids
-            else:
-                self.logger.error(f"Failed to get turnover data. Status code: {response.status_code}")
-                return []
-
+            turnover_ids = self.turnovers(userID, language).ids
+            self.logger.info(f"Found turnover IDs: {turnover_ids}")
+            return turnover_ids
         except Exception as e:
             self.logger.error(f"Error getting turnover IDs: {str(e)}")
             return []
 
     def modify_turnover_status(self, userID, turnoverIDs, action_type="unlock", partial=False):
-
         try:
-            turnover_actions = {
-                "success": 1,
-                "in_progress": 0,
-                "unlock": -1
-            }
-
-            action = turnover_actions.get(action_type)
-            if action is None:
-                self.logger.error(f"Invalid action type: {action_type}")
-                return False
-
-            if partial and len(turnoverIDs) > 1:
-                num_to_complete = random.randint(1, len(turnoverIDs) - 1)
-                selected_ids = random.sample(turnoverIDs, num_to_complete)
-                self.logger.info(f"Partially completing {num_to_complete} out of {len(turnoverIDs)} turnovers")
-            else:
-                selected_ids = turnoverIDs
-
-            for turnover_id in selected_ids:
-                modify_url = CREDENTIALS["ModifyTurnover"].format(BO_base_url = CREDENTIALS["BO_base_url"], userID=userID, turnover_id=turnover_id, action=action)
-                self.logger.info(f"Attempting to {action_type} turnover ID: {turnover_id}")
-
-                response = requests.get(modify_url)
-                if response.status_code == 200:
-                    self.logger.info(f"Successfully {action_type} turnover ID: {turnover_id}")
-                else:
-                    self.logger.error(
-                        f"Failed to {action_type} turnover ID {turnover_id}. Status code: {response.status_code}"
-                    )
-                    return False
-
-            return True
-
+            service = TurnoverService(userID, client=self.api, logger=self.logger)
+            return service.apply(action_type, turnoverIDs, partial=partial)
         except Exception as e:
             self.logger.error(f"Error modifying turnover: {str(e)}")
             return False
 
-    def get_user_vip_id(self):
-        token = self.login(self.username, self.password)
-        headers = {
-            "Authorization": f"Bearer {token}",
-        }
-        response = requests.get(f"{API_URL}/api/user", headers=headers)
-        response.raise_for_status()
-        vip_id = response.json().get("data")["vip"]
-        return vip_id
-
     def get_user_id(self):
-        token = self.login(self.username, self.password)
         headers = {
-            "Authorization": f"Bearer {token}",
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
-        response = requests.get(f"{CREDENTIALS['BO_base_url']}/api/user", headers=headers)
+        response = self.api.get(
+            f"{CREDENTIALS['BO_base_url']}/api/user", credentials=self.api_credentials(), headers=headers
+        )
         return response.json().get("data")["id"]
 
     def get_user_vip_id(self):
-        token = self.login(self.username, self.password)
-        headers = {
-            "Authorization": f"Bearer {token}",
-        }
-        response = requests.get(f"{API_URL}/api/user", headers=headers)
+        response = self.api.get(f"{API_URL}/api/user", credentials=self.api_credentials())
         response.raise_for_status()
         vip_id = response.json().get("data")["vip"]
         return vip_id
 
     def get_user_info(self, info_name, language=None):
-        token = self.login(self.username, self.password)
         headers = {
-            "Authorization": f"Bearer {token}",
             "Language": language if language else self.language
         }
-        response = requests.get(f"{API_URL}/api/user", headers=headers)
+        response = self.api.get(f"{API_URL}/api/user", credentials=self.api_credentials(), headers=headers)
         response.raise_for_status()
         user_info = response.json().get("data")
         return user_info.get(info_name)
@@ -2529,11 +2603,11 @@ class BaseTest(unittest.TestCase):
         # Scroll to element and click
         self.logger.info("Scrolling to 4D tab")
         self.driver.execute_script("arguments[0].scrollIntoView(true);", tab_button)
-        time.sleep(1)
+        self.waits.element_stable(tab_button)
 
         self.logger.info("Clicking 4D tab")
         self.driver.execute_script("arguments[0].click();", tab_button)
-        time.sleep(3)
+        self.waits.page_settled()
     
     def bobolive_topup_diamond(self):
         self.logger.info("Topping up diamond")
@@ -2554,24 +2628,21 @@ class BaseTest(unittest.TestCase):
         time.sleep(2)
     
     def add_4d_cards_api(self, userID, amount):
-        token = self.login(self.username, self.password)
         headers = {
             "Accept": "application/json",
-            "Authorization": f"Bearer {token}",
         }
         data = {
             "user_id": str(userID),
             "amount": str(amount),
             "pass": "123456",
         }
-        response = requests.post(f"{CREDENTIALS['Add4dCards'].format(BO_base_url = CREDENTIALS["BO_base_url"])}", headers=headers, json=data)
+        response = self.api.post(
+            CREDENTIALS['Add4dCards'].format(BO_base_url=CREDENTIALS["BO_base_url"]), credentials=self.api_credentials(),
+            headers=headers, json=data
+        )
         response.raise_for_status()
     
     def get_4d_history_api(self, four_d_number="", start_date="", end_date="", is_won="", page="", per_page=""):
-        token = self.login(self.username, self.password)
-        headers = {
-            "Authorization": f"Bearer {token}",
-        }
         data = {
             "four_d_number": four_d_number,
             "start_date": start_date,
@@ -2580,63 +2651,97 @@ class BaseTest(unittest.TestCase):
             "page": page,
             "per_page": per_page,
         }
-        response = requests.post(f"{CREDENTIALS['Get4dHistory'].format(BO_base_url = CREDENTIALS["BO_base_url"])}", headers=headers, json=data)
+        response = self.api.post(
+            CREDENTIALS['Get4dHistory'].format(BO_base_url=CREDENTIALS["BO_base_url"]), credentials=self.api_credentials(),
+            json=data
+        )
         response.raise_for_status()
         return response.json().get("data")
     
-    def bet_4d_api(self, four_d_number, date_time_str, bet_platforms, source, type, coupon_id, B="0", S="0", SA="0", SB="0", SC="0", SD="0", SE="0"):
-        try:
-            # Extract date_only from date_time_str (assuming UTC format like "2025-03-18T02:48:02.715Z")
-            date_only = date_time_str.split('T')[0] if 'T' in date_time_str else date_time_str
-            
-            # Get authentication token
-            token = self.login(self.username, self.password)
-            
-            url = CREDENTIALS['Bet4d'].format(BO_base_url = CREDENTIALS["BO_base_url"])
-
-            user_id = self.get_user_id()
-            payload = {'pass': '123456',
-            'user_id': user_id,
-            'bet_number': four_d_number,
-            'bet_number_list': four_d_number,
-            'bet_dates': date_only,
-            'bet_platforms': bet_platforms,
-            'source': source,
-            'B': B,
-            'S': S,
-            'SA': SA,
-            'SB': SB,
-            'SC': SC,
-            'SD': SD,
-            'SE': SE,
-            'type': type,
-            'coupon_id': coupon_id,
-            'user_bet_time': date_time_str,
-            'show_id': "-1",
-            'user_bet_date': date_only}
-            files=[
-
-            ]
-            headers = {
-            'Accept': 'application/json',
-            'Authorization': f"Bearer {token}"
-            }
-            
-            self.logger.info(f"Payload: {payload}")
-            
-
-            response = requests.request("POST", url, headers=headers, data=payload, files=files)
+    def build_4d_bet_payload(self, user_id, four_d_number, date_time_str, bet_platforms, source, type, coupon_id, B="0", S="0", SA="0", SB="0", SC="0", SD="0", SE="0"):
+        # Extract date_only from date_time_str (assuming UTC format like "2025-03-18T02:48:02.715Z")
+        date_only = date_time_str.split('T')[0] if 'T' in date_time_str else date_time_str
+        return {'pass': '123456',
+        'user_id': user_id,
+        'bet_number': four_d_number,
+        'bet_number_list': four_d_number,
+        'bet_dates': date_only,
+        'bet_platforms': bet_platforms,
+        'source': source,
+        'B': B,
+        'S': S,
+        'SA': SA,
+        'SB': SB,
+        'SC': SC,
+        'SD': SD,
+        'SE': SE,
+        'type': type,
+        'coupon_id': coupon_id,
+        'user_bet_time': date_time_str,
+        'show_id': "-1",
+        'user_bet_date': date_only}
+
+    def post_4d_bet(self, payload):
+        headers = {
+        'Accept': 'application/json',
+        }
+        self.logger.info(f"Payload: {payload}")
+        response = self.api.post(
+            CREDENTIALS['Bet4d'].format(BO_base_url = CREDENTIALS["BO_base_url"]), credentials=self.api_credentials(),
+            headers=headers, data=payload, files=[]
+        )
+        self.logger.info(response.text)
+        return response
 
-            self.logger.info(response.text)
+    def bet_4d_api(self, four_d_number, date_time_str, bet_platforms, source, type, coupon_id, B="0", S="0", SA="0", SB="0", SC="0", SD="0", SE="0", user_id=None):
+        try:
+            payload = self.build_4d_bet_payload(
+                user_id or self.get_user_id(), four_d_number, date_time_str, bet_platforms, source, type, coupon_id,
+                B=B, S=S, SA=SA, SB=SB, SC=SC, SD=SD, SE=SE
+            )
+            return self.post_4d_bet(payload)
         
         except requests.exceptions.RequestException as e:
             self.logger.error(f"API request failed: {str(e)}")
         except Exception as e:
             self.logger.error(f"An error occurred: {str(e)}")
+
+    def bet_4d_bulk(self, bets, workers=None):
+        """
+        Place many 4D bets for the current user with one token and user id lookup.
+
+        ``bets`` are dicts of bet_4d_api keyword arguments (without user_id). Bets
+        are posted concurrently and a list of {"payload", "record_id", "status_code"}
+        comes back in the order given; record_id is None for bets that failed.
+        """
+        if not bets:
+            return []
+        # warms the client's token cache so the workers don't all log in at once
+        self.api.get_token(*self.api_credentials())
+        user_id = self.get_user_id()
+        payloads = [self.build_4d_bet_payload(user_id, **bet) for bet in bets]
+
+        def place(payload):
+            try:
+                response = self.post_4d_bet(payload)
+                data = response.json().get("data") if response.ok else None
+                record_id = data.get("id") if isinstance(data, dict) else None
+                return {"payload": payload, "record_id": record_id, "status_code": response.status_code}
+            except (requests.exceptions.RequestException, ValueError) as e:
+                self.logger.error(f"4D bet {payload['bet_number']} failed: {str(e)}")
+                return {"payload": payload, "record_id": None, "status_code": None}
+
+        workers = max(1, min(workers or int(CREDENTIALS['fourd_seed_workers']['workers']), len(payloads)))
+        self.logger.info(f"Placing {len(payloads)} 4D bets with {workers} workers")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(place, payloads))
+
+        failed = sum(1 for result in results if result["status_code"] != 200)
+        if failed:
+            self.logger.error(f"{failed} of {len(results)} 4D bets failed")
+        return results
         
     def update_bet_result(self, bet_record_id, action, amount):
-        token = self.login(self.username, self.password)
-        
         payload = {'pass': '123456',
         'betRecordId': bet_record_id,
         'action': action,
@@ -2648,8 +2753,10 @@ class BaseTest(unittest.TestCase):
         ]
         headers = {
         'Accept': 'application/json',
-        'Authorization': f"Bearer {token}"
         }
 
-        response = requests.request("POST", CREDENTIALS['UpdateBetResult'].format(BO_base_url = CREDENTIALS["BO_base_url"]), headers=headers, data=payload, files=files)
+        response = self.api.post(
+            CREDENTIALS['UpdateBetResult'].format(BO_base_url=CREDENTIALS["BO_base_url"]),
+            credentials=self.api_credentials(), headers=headers, data=payload, files=files
+        )
         response.raise_for_status()
\ No newline at end of file
@@ -37,19 +37,18 @@ class TestPasswordPage(BaseTest):
         if not self.browser or not self.language:
             raise ValueError("Browser or language is not set.")
         self.logger.info(f"Setting up {self.browser} browser for {self.language} language...")
-        self.driver = self.initialize_browser(self.browser)
+        self.driver = self.acquire_browser()
         self.url = LANGUAGE_SETTINGS[self.language]["home_url"]
         self.driver.get(self.url)
         #self.driver.maximize_window()
         self.driver.set_window_size(375, 812)
-        self.navigate_to_login_page()
-        self.perform_login(CREDENTIALS["duplicated_user"]["username"], CREDENTIALS["duplicated_user"]["password"])
+        self.login_as(CREDENTIALS["duplicated_user"]["username"], CREDENTIALS["duplicated_user"]["password"])
         self.navigate_to_setting_page(self.language)
         self.navigate_to_resetPassword_page()
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
 
     def fill_password_fields(self, password_data):
         driver = self.driver
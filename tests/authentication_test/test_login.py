@@ -5,6 +5,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from config.constant import LANGUAGE_SETTINGS, CREDENTIALS
 from selenium.webdriver.support.ui import WebDriverWait
 from .base_test import BaseTest, ContinueOnFailureTestResult
+from utils.multi_language import multi_language
 
 
 class TestLogin(BaseTest):
@@ -18,7 +19,7 @@ class TestLogin(BaseTest):
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
 
     def generic_login(self, username, password, expected_result="success"):
         try:
@@ -37,6 +38,7 @@ class TestLogin(BaseTest):
         except Exception as e:
             self.fail(f"Login attempt failed: {str(e.msg)}")
 
+    @multi_language
     def test_01_EmptyFields(self):
         self.logger.info("Starting test_01_EmptyFields...")
         try:
@@ -15,6 +15,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, NoSuchWindowException
 from config.constant import LANGUAGE_SETTINGS, CREDENTIALS
 from .base_test import BaseTest, ContinueOnFailureTestResult
+from utils.multi_language import multi_language
 
 # ID validation
 # verify can login or not after successfully registration
@@ -39,7 +40,7 @@ class TestRegister(BaseTest):
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
 
     def get_field(self, field_name):
         locator_type, locator_value = self.field_locators[field_name]
@@ -106,6 +107,7 @@ class TestRegister(BaseTest):
 
         return f"{phone}{remaining_digits}"
 
+    @multi_language
     def test_01_EmptyFields(self):
         driver = self.driver
         fields = LANGUAGE_SETTINGS[self.language]["fields"]
@@ -30,19 +30,18 @@ class TestSetting(BaseTest):
             self.username, self.password = result
             self.logger.info(f"Successfully registered account: {self.username}")
 
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             self.navigate_to_setting_page(self.language)
 
         except Exception as e:
             self.logger.error(f"Setup failed: {str(e)}")
             if hasattr(self, 'driver'):
-                self.driver.quit()
+                self.release_browser()
             raise
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
 
     def click_confirm_button(self):
         driver = self.driver
@@ -40,19 +40,18 @@ class TestCouponPage(BaseTest):
         if not self.browser or not self.language:
             raise ValueError("Browser or language is not set.")
         self.logger.info(f"Setting up {self.browser} browser for {self.language} language...")
-        self.driver = self.initialize_browser(self.browser)
+        self.driver = self.acquire_browser()
         self.url = LANGUAGE_SETTINGS[self.language]["home_url"]
         self.driver.get(self.url)
         # size of iphone X, as desktop UI is not ready
         self.driver.set_window_size(375, 812)
         #self.driver.maximize_window()
-        self.navigate_to_login_page()
-        self.perform_login(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
+        self.login_as(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
         self.navigate_to_coupon()
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
 
     def navigate_to_coupon(self):
         driver = self.driver
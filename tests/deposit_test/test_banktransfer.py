@@ -21,14 +21,13 @@ class TestBankTransfer(BaseTest):
 
     def setUp(self):
         super().setUp()
-        self.navigate_to_login_page()
-        self.perform_login(CREDENTIALS["duplicated_user"]["username"], CREDENTIALS["duplicated_user"]["password"])
+        self.login_as(CREDENTIALS["duplicated_user"]["username"], CREDENTIALS["duplicated_user"]["password"])
         self.navigate_to_bank_transfer()
         time.sleep(2)
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
 
     def navigate_to_bank_transfer(self):
 
@@ -34,12 +34,11 @@ class TestQuickReload(BaseTest):
 
     def setUp(self):
         super().setUp()
-        self.navigate_to_login_page()
-        self.perform_login(CREDENTIALS["duplicated_user"]["username"], CREDENTIALS["duplicated_user"]["password"])
+        self.login_as(CREDENTIALS["duplicated_user"]["username"], CREDENTIALS["duplicated_user"]["password"])
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
 
     def navigate_to_quickreload(self):
 
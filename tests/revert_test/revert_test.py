@@ -1,3 +1,4 @@
+import logging
 import unittest
 import time
 import requests
@@ -10,10 +11,13 @@ from tests.authentication_test.base_test import BaseTest
 from tests.test_init import TestInit
 from datetime import datetime
 from tests.transfer_test.transfer_base import TransferBase
+from utils import reference_cache
 import math
 
 
 class TestRevert(TransferBase):
+    # only credits and buttons are asserted on
+    LEAN_BROWSER = True
 
     BATCH_SIZE = int(CREDENTIALS['revert_batch_size']['batch_size'])
     _test_methods_generated = False
@@ -59,8 +63,7 @@ class TestRevert(TransferBase):
                 raise Exception("No credentials available for test")
 
             self.logger.info(f"Logging in with username: {self.username}")
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             self.navigate_to_transfer()
 
         except Exception as e:
@@ -75,7 +78,7 @@ class TestRevert(TransferBase):
         try:
             if hasattr(self, 'driver') and self.driver and not self.browser_closed:
                 self.logger.info("Closing browser...")
-                self.driver.quit()
+                self.release_browser()
                 self.driver = None
                 self.browser_closed = True
         except Exception as e:
@@ -85,7 +88,7 @@ class TestRevert(TransferBase):
         one_click_revert = WebDriverWait(self.driver,
                                          10).until(EC.element_to_be_clickable((By.ID, "rebate-all-button")))
         self.driver.execute_script("arguments[0].scrollIntoView(true);", one_click_revert)
-        time.sleep(2)
+        self.wait_animation()
         one_click_revert.click()
 
     def click_revert_button(self):
@@ -100,7 +103,7 @@ class TestRevert(TransferBase):
 
             # Scroll into view first
             self.driver.execute_script("arguments[0].scrollIntoView(true);", revert_button)
-            time.sleep(2)
+            self.wait_animation()
 
             try:
                 revert_button.click()
@@ -185,9 +188,17 @@ class TestRevert(TransferBase):
             all_credits_valid = True
             non_zero_credits = []
 
-            providers = WebDriverWait(driver, 20).until(
+            WebDriverWait(driver, 20).until(
                 EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div[id^='provider-button-']"))
             )
+            providers = self.snapshot(
+                "div[id^='provider-button-']",
+                children={
+                    "name": "[id^='provider-name-']",
+                    "credit": "[id^='provider-credit-']",
+                    "expand": "[data-testid='ExpandMoreIcon']"
+                }
+            )
             self.logger.info(f"Found {len(providers)} providers")
 
             expected_credits = {}
@@ -198,12 +209,11 @@ class TestRevert(TransferBase):
 
             for provider in providers[:10]:
                 try:
-                    provider_id = provider.get_attribute('id').replace('provider-button-', '')
-                    provider_name = provider.find_element(By.ID, f"provider-name-{provider_id}").text.strip()
+                    provider_id = provider['id'].replace('provider-button-', '')
+                    provider_name = provider['children']['name'] or ""
 
                     if int(provider_id) == -1:
-                        provider_credit_element = provider.find_element(By.ID, f"provider-credit-{provider_id}")
-                        provider_credit = provider_credit_element.text.strip()
+                        provider_credit = provider['children']['credit']
 
                         if provider_credit:
                             credit_value = float(provider_credit.replace(',', ''))
@@ -243,29 +253,33 @@ class TestRevert(TransferBase):
                                         f"Provider {provider_id} credit matches expected value: {credit_value}"
                                     )
 
-                    expand_icon = provider.find_elements(By.CSS_SELECTOR, "[data-testid='ExpandMoreIcon']")
-                    if expand_icon:
-
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", provider)
+                    if provider['children']['expand'] is not None:
+                        provider_element = provider['element']
+                        self.driver.execute_script("arguments[0].scrollIntoView(true);", provider_element)
                         time.sleep(1)
                         try:
-                            provider.click()
+                            provider_element.click()
                         except:
-                            self.driver.execute_script("arguments[0].click();", provider)
+                            self.driver.execute_script("arguments[0].click();", provider_element)
                         time.sleep(1)
 
-                        game_credits = driver.find_elements(By.CSS_SELECTOR, f"[id^='game-credit-']")
-                        for credit_element in game_credits:
+                        games = self.snapshot({
+                            "credits": "[id^='game-credit-']",
+                            "names": "[id^='game-text-']",
+                            "failed_tags": "[id^='game-tag-'][id$='_failed']"
+                        })
+                        game_names = {item['id'].replace('game-text-', ''): item['text'] for item in games['names']}
+                        failed_tags = {
+                            item['id'].replace('game-tag-', '').replace('_failed', ''): item['visible']
+                            for item in games['failed_tags']
+                        }
+
+                        for credit_item in games['credits']:
                             try:
-                                game_id = credit_element.get_attribute('id').replace('game-credit-', '')
-                                credit = credit_element.text.strip()
-
-                                try:
-                                    game_text_element = driver.find_element(By.ID, f"game-text-{game_id}")
-                                    self.driver.execute_script("arguments[0].scrollIntoView(true);", game_text_element)
-                                    game_name = game_text_element.text.strip()
-                                except:
-                                    game_name = f"Game {game_id}"
+                                game_id = credit_item['id'].replace('game-credit-', '')
+                                # collapsed providers keep their games mounted but hidden; skip those like .text did
+                                credit = credit_item['text'] if credit_item['visible'] else ""
+                                game_name = game_names.get(game_id) or f"Game {game_id}"
 
                                 if credit:
                                     credit_value = float(credit.replace(',', ''))
@@ -278,21 +292,15 @@ class TestRevert(TransferBase):
                                             if failed_transfers.get(game_id, False):
                                                 self.logger.info(f"Game {game_id} has non-zero credit: {credit_value} ")
                                                 self.logger.info(f"Game {game_id} has failed transfer, checking tag...")
-                                                try:
-                                                    failed_tag = driver.find_element(
-                                                        By.ID, f"game-tag-{game_id}_failed"
-                                                    )
-                                                    if credit_value > 0 or not failed_tag.is_displayed():
-                                                        non_zero_credits.append({
-                                                            'id': game_id,
-                                                            'name': game_name,
-                                                            'credit': credit_value,
-                                                            'failed': "No failed tag displayed"
-                                                        })
-
+                                                if game_id in failed_tags:
+                                                    non_zero_credits.append({
+                                                        'id': game_id,
+                                                        'name': game_name,
+                                                        'credit': credit_value,
+                                                        'failed': "No failed tag displayed"
+                                                    })
                                                     all_credits_valid = False
-
-                                                except:
+                                                else:
                                                     self.logger.info(f"Failed tag not found for game {game_id}")
                                         else:
                                             self.logger.info(f"Game {game_id} has zero credit: {credit_value}")
@@ -312,24 +320,22 @@ class TestRevert(TransferBase):
 
                                 if failed_transfers.get(game_id, False):
                                     self.logger.info(f"Game {game_id} has failed transfer, checking tag...")
-                                    try:
-                                        failed_tag = driver.find_element(By.ID, f"game-tag-{game_id}_failed")
-                                        if not failed_tag.is_displayed():
-                                            self.logger.info(
-                                                f"Game {game_id} has failed transfer but tag is not displayed"
-                                            )
-                                            all_credits_valid = False
-                                        else:
-                                            self.logger.info(f"Found failed tag displayed for game {game_id}")
-                                    except:
+                                    if game_id not in failed_tags:
                                         self.logger.info(
                                             f"Failed tag not found for game {game_id} with failed transfer"
                                         )
                                         all_credits_valid = False
+                                    elif not failed_tags[game_id]:
+                                        self.logger.info(
+                                            f"Game {game_id} has failed transfer but tag is not displayed"
+                                        )
+                                        all_credits_valid = False
+                                    else:
+                                        self.logger.info(f"Found failed tag displayed for game {game_id}")
                             except Exception as e:
                                 self.logger.error(f"Error checking provider {provider_id}: {str(e)}")
                                 continue
-                        provider.click()
+                        provider['element'].click()
                         time.sleep(1)
 
                 except Exception as e:
@@ -600,25 +606,12 @@ class TestRevert(TransferBase):
 
     @classmethod
     def get_total_providers(cls, browser, language):
-        temp_instance = cls(methodName="runTest", browser=browser, language=language)
-        token = temp_instance.login(
-            CREDENTIALS['duplicated_user']['username'], CREDENTIALS['duplicated_user']['password']
-        )
-        if not token:
+        try:
+            return len([provider for provider in reference_cache.providers() if provider["id"] > 0])
+        except Exception as e:
+            logging.getLogger(cls.__name__).warning(f"Could not count providers: {str(e)}")
             return 3
 
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
-
-        all_games = temp_instance.get_game_ids(headers)
-        providers = [game for game in all_games if game["id"] > 0]
-        total_providers = len(providers)
-        #print(f"Total providers found: {total_providers}")
-        return total_providers
-
     @classmethod
     def generate_test_methods(cls, browser, language):
         if cls._test_methods_generated:
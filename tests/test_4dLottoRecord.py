@@ -17,6 +17,7 @@ import io
 from pyzbar.pyzbar import decode
 from urllib.parse import urlparse, parse_qs
 from tests.test_init import TestInit
+from utils.fixtures import UserState
 from typing import Dict, Any, Optional, List, Union, Tuple, BinaryIO, TypeVar, Type
 import requests
 import math
@@ -47,7 +48,7 @@ class Test4dLottoRecord(BaseTest):
         if not self.browser or not self.language:
             raise ValueError("Browser or language is not set.")
         self.logger.info(f"Setting up {self.browser} browser for {self.language} language...")
-        self.driver = self.initialize_browser(self.browser)
+        self.driver = self.acquire_browser()
         self.url = LANGUAGE_SETTINGS[self.language]["home_url"]
         self.driver.get(self.url)
         # self.driver.maximize_window()
@@ -56,34 +57,30 @@ class Test4dLottoRecord(BaseTest):
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
     
     def setup_test_user(self, register_new=False):
         """Set up test user - either create new or use existing"""
         if register_new:
             self.logger.info("Registering new account...")
-            self.username, self.password = self.test_init.register_new_account()
+            self.use_state(UserState(fourd_cards=25))
+            return self.username, self.password
+
+        if self.language == "bm":
+            self.username = "LuffyTest1"
+            self.password = "LuffyTest1"
+        elif self.language == "cn":
+            self.username = "LuffyTest2"
+            self.password = "LuffyTest2"
+        elif self.language == "en":
+            self.username = "LuffyTest3"
+            self.password = "LuffyTest3"
         else:
-            if self.language == "bm":
-                self.username = "LuffyTest1"
-                self.password = "LuffyTest1"
-            elif self.language == "cn":
-                self.username = "LuffyTest2"
-                self.password = "LuffyTest2"
-            elif self.language == "en":
-                self.username = "LuffyTest3"
-                self.password = "LuffyTest3"
-            else:
-                self.username = "LuffyTest4"
-                self.password = "LuffyTest4"
-                
-        while self.username == None or self.password == None:
-            self.logger.info("Registering new account...")
-            self.username, self.password = self.test_init.register_new_account()
+            self.username = "LuffyTest4"
+            self.password = "LuffyTest4"
             
         self.logger.info(f"Username: {self.username}, Password: {self.password}")
-        self.navigate_to_login_page()
-        self.perform_login(self.username, self.password)
+        self.login_as(self.username, self.password)
         
         
         userID = self.get_user_id()
@@ -180,7 +177,7 @@ class Test4dLottoRecord(BaseTest):
             self.assertEqual(str(value), str(expected_value), f"Digit in field {index} is incorrect")
             
     def generate_4d_record(self, number_of_records, four_d_number=None):
-        
+        bets = []
         for _ in range(number_of_records):
             platforms = "GD"
             
@@ -194,8 +191,17 @@ class Test4dLottoRecord(BaseTest):
             
             random_amount = random.choice([0.5, 1.0, 1.5])
             
-            self.bet_4d_api(random_number, date_time_str, platforms, "whitelabel", "coupon", "2", B=random_amount)
-        
+            bets.append({
+                "four_d_number": random_number,
+                "date_time_str": date_time_str,
+                "bet_platforms": platforms,
+                "source": "whitelabel",
+                "type": "coupon",
+                "coupon_id": "2",
+                "B": random_amount
+            })
+
+        return self.bet_4d_bulk(bets)
     
     def test_01_InfoShown(self):
         try:
@@ -8,6 +8,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from config.constant import LANGUAGE_SETTINGS, CREDENTIALS, API_URL
 from tests.authentication_test.base_test import BaseTest
+from utils import reference_cache
 import time
 import requests
 
@@ -41,12 +42,8 @@ class RewardClass():
     
     def get_reward_type(self, reward_id):
         try:
-            response = requests.get(f"{self.api_url}/api/rewards/{reward_id}")
-            response.raise_for_status()
-            result = response.json().get("data")
-            if not result or 'reward_type' not in result:
-                raise ValueError("Invalid reward data returned from API.")
-            return result['reward_type']
+            # the same few rewards repeat across a 31 day cycle
+            return reference_cache.reward_type(reward_id)
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Error fetching reward type: {e}")
             return None
@@ -101,7 +98,7 @@ class TestDailyCheckIn(BaseTest):
         if not self.browser or not self.language:
             raise ValueError("Browser or language is not set.")
         self.logger.info(f"Setting up {self.browser} browser for {self.language} language...")
-        self.driver = self.initialize_browser(self.browser)
+        self.driver = self.acquire_browser()
         self.url = LANGUAGE_SETTINGS[self.language]["home_url"]
         self.driver.get(self.url)
         #self.driver.maximize_window()
@@ -109,7 +106,7 @@ class TestDailyCheckIn(BaseTest):
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
             
     def navigate_to_check_in_page(self):
         driver = self.driver
@@ -512,20 +509,13 @@ class TestDailyCheckIn(BaseTest):
     
     
     def get_vip_levels(self):
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-        }
-        response = requests.get(f"{API_URL}/api/uservip", headers=headers)
-        response.raise_for_status()
-        vip_levels = response.json().get("data")
-        return vip_levels
+        return reference_cache.vip_levels()
 
         
     def test_01_BasicCheckInFlowPopup(self):
         self.logger.info("Starting basic check-in flow test via popup")
         try:
-            self.navigate_to_login_page()
-            self.perform_login(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
+            self.login_as(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
             self.get_api_token(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
             
             user_id = self.get_id_number()
@@ -553,8 +543,7 @@ class TestDailyCheckIn(BaseTest):
     def test_02_BasicCheckInFlowCheckInPage(self):
         self.logger.info("Starting basic check-in flow test via check-in page")
         try:
-            self.navigate_to_login_page()
-            self.perform_login(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
+            self.login_as(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
             self.get_api_token(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
             
             user_id = self.get_id_number()
@@ -617,8 +606,7 @@ class TestDailyCheckIn(BaseTest):
     def test_04_SpecialRewards(self):
         self.logger.info("Starting special rewards test")
         try:
-            self.navigate_to_login_page()
-            self.perform_login(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
+            self.login_as(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
             self.get_api_token(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
             user_id = self.get_id_number()
             special_days = [7, 14, 21, 31]
@@ -642,8 +630,7 @@ class TestDailyCheckIn(BaseTest):
     def test_05_Day28NoSpecialRewards(self):
         self.logger.info("Starting special rewards test")
         try:
-            self.navigate_to_login_page()
-            self.perform_login(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
+            self.login_as(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
             self.get_api_token(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
             user_id = self.get_id_number()
             simulate_success = self.simulate_check_in(user_id, 27, 1)
@@ -665,8 +652,7 @@ class TestDailyCheckIn(BaseTest):
     def test_06_ResetAfter1DayMissed(self):
         self.logger.info("Starting rewards reset after one day are missed")
         try:
-            self.navigate_to_login_page()
-            self.perform_login(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
+            self.login_as(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
             self.get_api_token(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
             
             user_id = self.get_id_number()
@@ -696,8 +682,7 @@ class TestDailyCheckIn(BaseTest):
     def test_07_ResetAfterManyDaysMissed(self):
         self.logger.info("Starting rewards reset after 7 days are missed")
         try:
-            self.navigate_to_login_page()
-            self.perform_login(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
+            self.login_as(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
             self.get_api_token(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
             
             user_id = self.get_id_number()
@@ -727,8 +712,7 @@ class TestDailyCheckIn(BaseTest):
     def test_08_ResetAfterDay31(self):
         self.logger.info("Starting rewards reset after day 31 test")
         try:
-            self.navigate_to_login_page()
-            self.perform_login(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
+            self.login_as(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
             self.get_api_token(CREDENTIALS["valid_user"]["username"], CREDENTIALS["valid_user"]["password"])
             
             user_id = self.get_id_number()
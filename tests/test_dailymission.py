@@ -10,6 +10,7 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from config.constant import API_URL, LANGUAGE_SETTINGS, CREDENTIALS
 from tests.authentication_test.base_test import BaseTest
+from utils.multi_language import multi_language
 import pyperclip
 from PIL import Image
 import io
@@ -18,11 +19,12 @@ from urllib.parse import urlparse, parse_qs
 from tests.test_init import TestInit
 from typing import Dict, Any, Optional, List, Union, Tuple, BinaryIO, TypeVar, Type
 import requests
-import random
 import json
 import re
 
 class TestDailyMission(BaseTest):
+    # each test sets up its own user, so methods can be spread across workers
+    ORDERED_TESTS = False
 
     def __init__(
         self, methodName: str = 'runTest', language: Optional[str] = None, browser: Optional[str] = None
@@ -45,7 +47,7 @@ class TestDailyMission(BaseTest):
         if not self.browser or not self.language:
             raise ValueError("Browser or language is not set.")
         self.logger.info(f"Setting up {self.browser} browser for {self.language} language...")
-        self.driver = self.initialize_browser(self.browser)
+        self.driver = self.acquire_browser()
         self.url = LANGUAGE_SETTINGS[self.language]["home_url"]
         self.driver.get(self.url)
         # self.driver.maximize_window()
@@ -55,7 +57,7 @@ class TestDailyMission(BaseTest):
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
     
     def get_mission_api(self):
         """Get missions data from API"""
@@ -72,25 +74,24 @@ class TestDailyMission(BaseTest):
     def setup_test_user(self, register_new=False, close_mission=True):
         """Set up test user - either create new or use existing"""
         if register_new:
-            # 使用测试ID创建唯一的账户名
-            self.username, self.password = self.test_init.register_new_account()
+            self.use_state(close_mission=close_mission)
+            return self.username, self.password
+
+        if self.language == "cn":
+            self.username = "LuffyTest1"
+            self.password = "LuffyTest1"
+        elif self.language == "en":
+            self.username = "LuffyTest2"
+            self.password = "LuffyTest2"
+        elif self.language == "bm":
+            self.username = "LuffyTest3"
+            self.password = "LuffyTest3"
         else:
-            if self.language == "cn":
-                self.username = "LuffyTest1"
-                self.password = "LuffyTest1"
-            elif self.language == "en":
-                self.username = "LuffyTest2"
-                self.password = "LuffyTest2"
-            elif self.language == "bm":
-                self.username = "LuffyTest3"
-                self.password = "LuffyTest3"
-            
-        while self.username == None or self.password == None:
-            ## try again
-            self.username, self.password = self.test_init.register_new_account()
-        
-        self.navigate_to_login_page()
-        self.perform_login(self.username, self.password, close_mission)
+            # no fixed account for other languages, so they get a new one
+            self.use_state(close_mission=close_mission)
+            return self.username, self.password
+        
+        self.login_as(self.username, self.password, close_mission=close_mission)
         return self.username, self.password
     
     def navigate_to_missions_page(self):
@@ -553,70 +554,6 @@ class TestDailyMission(BaseTest):
         # No amount found
         return None
     
-    def modify_turnover_status(self, userID, turnoverIDs, action_type="unlock", partial=False):
-
-        try:
-            turnover_actions = {
-                "success": 1,
-                "in_progress": 0,
-                "unlock": -1
-            }
-
-            action = turnover_actions.get(action_type)
-            if action is None:
-                self.logger.error(f"Invalid action type: {action_type}")
-                return False
-
-            if partial and len(turnoverIDs) > 1:
-                num_to_complete = random.randint(1, len(turnoverIDs) - 1)
-                selected_ids = random.sample(turnoverIDs, num_to_complete)
-                self.logger.info(f"Partially completing {num_to_complete} out of {len(turnoverIDs)} turnovers")
-            else:
-                selected_ids = turnoverIDs
-
-            for turnover_id in selected_ids:
-                modify_url = CREDENTIALS["ModifyTurnover"].format(BO_base_url = CREDENTIALS["BO_base_url"], userID=userID, turnover_id=turnover_id, action=action)
-                self.logger.info(f"Attempting to {action_type} turnover ID: {turnover_id}")
-
-                response = requests.get(modify_url)
-                if response.status_code == 200:
-                    self.logger.info(f"Successfully {action_type} turnover ID: {turnover_id}")
-                else:
-                    self.logger.error(
-                        f"Failed to {action_type} turnover ID {turnover_id}. Status code: {response.status_code}"
-                    )
-                    return False
-
-            return True
-
-        except Exception as e:
-            self.logger.error(f"Error modifying turnover: {str(e)}")
-            return False
-
-    def get_turnover_ids(self, userID, language=None):
-        try:
-            turnoverAPI = CREDENTIALS["CheckTurnover"].format(BO_base_url = CREDENTIALS["BO_base_url"], ID=userID, language=language)
-            turnover_ids = []
-
-            response = requests.get(turnoverAPI)
-            if response.status_code == 200:
-                turnoverData = response.json()
-                self.logger.info(f"Turnover data: {turnoverData}")
-
-                for item in turnoverData:
-                    if 'id' in item:
-                        turnover_ids.append(item['id'])
-
-                self.logger.info(f"Found turnover IDs: {turnover_ids}")
-                return turnover_ids
-            else:
-                self.logger.error(f"Failed to get turnover data. Status code: {response.status_code}")
-                return []
-
-        except Exception as e:
-            self.logger.error(f"Error getting turnover IDs: {str(e)}")
-            return []
-
     def request_withdraw_api(self, amount, bank):
         token = self.login(self.username, self.password)
         headers = {
@@ -800,6 +737,7 @@ class TestDailyMission(BaseTest):
         
         return reward_value, reward_type
                 
+    @multi_language
     def test_01_AllMissionShown(self):
         """Test to verify that all missions from the API are shown in the UI."""
         try:
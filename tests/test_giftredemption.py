@@ -42,7 +42,7 @@ class TestGiftRedemption(BaseTest):
         if not self.browser or not self.language:
             raise ValueError("Browser or language is not set.")
         self.logger.info(f"Setting up {self.browser} browser for {self.language} language...")
-        self.driver = self.initialize_browser(self.browser)
+        self.driver = self.acquire_browser()
         self.url = LANGUAGE_SETTINGS[self.language]["home_url"]
         self.driver.get(self.url)
         # self.driver.maximize_window()
@@ -60,7 +60,7 @@ class TestGiftRedemption(BaseTest):
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
     
     # Helper methods
     def wait_for_element(self, by, value, timeout=10):
@@ -125,28 +125,40 @@ class TestGiftRedemption(BaseTest):
     
     def get_gift_titles(self, gift_cards=None):
         """Extract gift titles from the provided gift cards or all current cards"""
-        if gift_cards is None:
-            gift_cards = self.get_all_gift_cards()
-            
         gift_titles = []
-        for card in gift_cards:
-            try:
-                title_element = card.find_element(By.XPATH, ".//div[contains(@class, 'MuiTypography-h6')]")
-                gift_titles.append(title_element.text)
-            except NoSuchElementException:
-                continue
-        
+        for card in self.get_gift_card_details(gift_cards):
+            if card["title"] is not None:
+                gift_titles.append(card["title"])
+
         return gift_titles
     
     def get_gift_points(self, gift_card):
         """Extract points value from a gift card"""
-        try:
-            points_text = gift_card.find_element(By.XPATH, ".//p[contains(@class, 'MuiTypography-body2')]").text
+        points = self.get_gift_card_details([gift_card])[0]["points"]
+        if points is None:
+            self.logger.warning("Couldn't extract points for a gift")
+        return points
 
-            return int(''.join(filter(str.isdigit, points_text)))
-        except (NoSuchElementException, ValueError) as e:
-            self.logger.warning(f"Couldn't extract points for a gift: {str(e)}")
-            return None
+    def get_gift_card_details(self, gift_cards=None):
+        """Title and points of the provided gift cards (or all current cards), read in one script call"""
+        children = {
+            "title": "div[class*='MuiTypography-h6']",
+            "points": "p[class*='MuiTypography-body2']"
+        }
+        if gift_cards is None:
+            cards = self.snapshot("div[class*='MuiCard-root']", children=children)
+        else:
+            cards = self.snapshot(elements=gift_cards, children=children)
+
+        details = []
+        for card in cards:
+            points_digits = ''.join(filter(str.isdigit, card["children"]["points"] or ""))
+            details.append({
+                "element": card["element"],
+                "title": card["children"]["title"],
+                "points": int(points_digits) if points_digits else None
+            })
+        return details
     
     def set_points_filter(self, target_value):
         """Set the points filter slider to the target value"""
@@ -288,6 +300,9 @@ class TestGiftRedemption(BaseTest):
             return False
     
     def get_gift_api(self):
+        gifts = self.rendered_api_data("/api/gifts")
+        if gifts is not None:
+            return gifts
         token = self.login(self.username, self.password)
         headers = {
             "Authorization": f"Bearer {token}",
@@ -722,15 +737,10 @@ class TestGiftRedemption(BaseTest):
         list: List of tuples (title, points)
         """
         gift_data = []
-        for card in cards[:min(num_samples, len(cards))]:
-            points = self.get_gift_points(card)
-            try:
-                title = card.find_element(By.XPATH, ".//div[contains(@class, 'MuiTypography-h6')]").text
-                if points is not None:
-                    gift_data.append((title, points))
-                    self.logger.info(f"Gift: {title}, Points: {points}")
-            except NoSuchElementException:
-                pass
+        for card in self.get_gift_card_details(cards[:min(num_samples, len(cards))]):
+            if card["title"] is not None and card["points"] is not None:
+                gift_data.append((card["title"], card["points"]))
+                self.logger.info(f"Gift: {card['title']}, Points: {card['points']}")
         return gift_data
 
     def verify_sorting_by_points(self, sorted_points, expected_order="ascending"):
@@ -966,21 +976,16 @@ class TestGiftRedemption(BaseTest):
         self.logger.info(f"Found {len(gift_cards)} gifts matching '{search_keyword}'")
         
         # Find a gift that costs more than user's points
-        for card in gift_cards:
-            points = self.get_gift_points(card)
-            if points is None:
+        for card in self.get_gift_card_details(gift_cards):
+            points = card["points"]
+            gift_title = card["title"]
+            if points is None or gift_title is None:
                 continue
                 
-            try:
-                title_element = card.find_element(By.XPATH, ".//div[contains(@class, 'MuiTypography-h6')]")
-                gift_title = title_element.text
-                
-                # Check if the gift is unaffordable
-                if points > current_points:
-                    self.logger.info(f"Found unaffordable gift: {gift_title} ({points} points), user has {current_points} points")
-                    return card, gift_title, points
-            except NoSuchElementException:
-                continue
+            # Check if the gift is unaffordable
+            if points > current_points:
+                self.logger.info(f"Found unaffordable gift: {gift_title} ({points} points), user has {current_points} points")
+                return card["element"], gift_title, points
         
         self.logger.error("Could not find an unaffordable gift")
         return None, None, None
@@ -1044,8 +1049,7 @@ class TestGiftRedemption(BaseTest):
     def test_01_SearchGift(self):
         try:
             self.logger.info("Starting search gift test...")
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             
             self.navigate_to_profile_menu("profile-menu-gift_change")
             self.wait_for_gift_page_load()
@@ -1081,8 +1085,7 @@ class TestGiftRedemption(BaseTest):
     def test_02_ClearSearchField(self):
         try:
             self.logger.info("Starting clear search field test...")
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             
             self.navigate_to_profile_menu("profile-menu-gift_change")
             self.wait_for_gift_page_load()
@@ -1115,8 +1118,7 @@ class TestGiftRedemption(BaseTest):
     def test_03_SearchGiftNotInList(self):
         try:
             self.logger.info("Starting test for searching a gift not in reward list...")
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             
             self.navigate_to_profile_menu("profile-menu-gift_change")
             self.wait_for_gift_page_load()
@@ -1160,8 +1162,7 @@ class TestGiftRedemption(BaseTest):
     def test_04_FilterGiftsByPointRange(self):
         try:
             self.logger.info("Starting test for filtering gifts by point range...")
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             
             self.navigate_to_profile_menu("profile-menu-gift_change")
             self.wait_for_gift_page_load()
@@ -1187,12 +1188,12 @@ class TestGiftRedemption(BaseTest):
             all_within_range = True
             gifts_outside_range = []
             
-            for gift in filtered_gifts:
-                points = self.get_gift_points(gift)
+            for gift in self.get_gift_card_details(filtered_gifts):
+                points = gift["points"]
                 if points is None:
                     continue
                     
-                gift_title = gift.find_element(By.XPATH, ".//div[contains(@class, 'MuiTypography-h6')]").text
+                gift_title = gift["title"]
                 
                 # Check if the gift's points are within range
                 if points > actual_value:
@@ -1214,8 +1215,7 @@ class TestGiftRedemption(BaseTest):
         """Test marking gifts as favorites"""
         try:
             self.logger.info("Starting test for marking gifts as favorites...")
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             
             self.navigate_to_profile_menu("profile-menu-gift_change")
             self.wait_for_gift_page_load()
@@ -1266,8 +1266,7 @@ class TestGiftRedemption(BaseTest):
         """Test sorting gifts by My Favourite"""
         try:
             self.logger.info("Starting test for sorting gifts by My Favourite...")
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             
             self.navigate_to_profile_menu("profile-menu-gift_change")
             self.wait_for_gift_page_load()
@@ -1307,8 +1306,7 @@ class TestGiftRedemption(BaseTest):
         """Test unfavoriting gifts"""
         try:
             self.logger.info("Starting test for unfavoriting gifts...")
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             
             self.navigate_to_profile_menu("profile-menu-gift_change")
             self.wait_for_gift_page_load()
@@ -1358,8 +1356,7 @@ class TestGiftRedemption(BaseTest):
         """Test sorting gifts by lowest points"""
         try:
             self.logger.info("Starting test for sorting gifts by lowest points...")
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             
             self.navigate_to_profile_menu("profile-menu-gift_change")
             self.wait_for_gift_page_load()
@@ -1405,8 +1402,7 @@ class TestGiftRedemption(BaseTest):
         """Test sorting gifts by highest points"""
         try:
             self.logger.info("Starting test for sorting gifts by highest points...")
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             
             self.navigate_to_profile_menu("profile-menu-gift_change")
             self.wait_for_gift_page_load()
@@ -1452,8 +1448,7 @@ class TestGiftRedemption(BaseTest):
         """Test sorting gifts by Last Updated"""
         try:
             self.logger.info("Starting test for sorting gifts by Last Updated...")
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             
             self.navigate_to_profile_menu("profile-menu-gift_change")
             self.wait_for_gift_page_load()
@@ -1505,8 +1500,7 @@ class TestGiftRedemption(BaseTest):
         """Test redeeming a 4D gift card with sufficient points"""
         try:
             self.logger.info("Starting test for redeeming a 4D gift with sufficient points...")
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             
             card_before = self.get4DCards()
             
@@ -1558,8 +1552,7 @@ class TestGiftRedemption(BaseTest):
         """Test redeeming a physical voucher gift with WhatsApp redirection"""
         try:
             self.logger.info("Starting test for redeeming a physical voucher gift...")
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             
             self.navigate_to_profile_menu("profile-menu-gift_change")
             self.wait_for_gift_page_load()
@@ -1610,8 +1603,7 @@ class TestGiftRedemption(BaseTest):
             # Step 1: Create a new account and login
             self.logger.info("Creating a new account for testing insufficient points scenario")
             self.username, self.password = self.test_init.register_new_account()
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             
             # Step 2: Navigate to gift redemption page
             self.navigate_to_profile_menu("profile-menu-gift_change")
@@ -1657,8 +1649,7 @@ class TestGiftRedemption(BaseTest):
             self.logger.info("Creating a new account for testing diff vip levels scenario")
             self.username, self.password = self.test_init.register_new_account()
             print(f"self.username: {self.username}")
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
                         
             vip_levels = self.get_vip_levels()
             # Automatically create test scenarios from defined constants
@@ -1742,8 +1733,7 @@ class TestGiftRedemption(BaseTest):
             redemption_count = 3  # Increase this number to redeem more times
             self.logger.info(f"Starting test for redeeming 4D gifts {redemption_count} times...")
             
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             
             # Navigate to gift page
             self.navigate_to_profile_menu("profile-menu-gift_change")
@@ -1868,8 +1858,7 @@ class TestGiftRedemption(BaseTest):
             # Create a new account to ensure controlled point balance
             self.logger.info("Creating a new account for testing")
             self.username, self.password = self.test_init.register_new_account()
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             
             # Get card state before any redemptions
             self.driver.get(self.url)
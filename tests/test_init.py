@@ -1,9 +1,6 @@
 import unittest
 import random
-import string
-import requests
 import logging
-import os
 import pandas as pd
 from datetime import datetime
 from selenium.webdriver.common.by import By
@@ -11,8 +8,12 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from config.constant import LANGUAGE_SETTINGS, CREDENTIALS
 from tests.authentication_test.base_test import BaseTest
+from utils.account_pool import CHECKED_OUT, FRESH, AccountProvisioner, get_account_pool
+from utils.image_fixtures import get_image_store
+from utils.tracing import traced_helpers
 
 
+@traced_helpers
 class TestInit(BaseTest):
 
     @classmethod
@@ -23,31 +24,6 @@ class TestInit(BaseTest):
     def __init__(self, methodName="runTest", language=None, browser=None):
         super().__init__(methodName, language, browser)
 
-    def download_image(self):
-        try:
-            image_url = CREDENTIALS["image_url"]
-            image_path = CREDENTIALS["image_path"]
-
-            response = requests.get(image_url, timeout=30)
-            if response.status_code == 200:
-                with open(image_path, "wb") as f:
-                    f.write(response.content)
-                self.logger.info(f"Successfully downloaded image to {image_path}")
-                return image_path
-
-            self.logger.info("Download failed, creating fallback image")
-            with open(image_path, "wb") as f:
-                f.write(
-                    bytes.fromhex(
-                        'FFD8FFE000104A46494600010100000100010000FFDB004300080606070605080707070909080A0C140D0C0B0B0C1912130F141D1A1F1E1D1A1C1C20242E2720222C231C1C2837292C30313434341F27393D38323C2E333432FFDB0043010909090C0B0C180D0D1832211C213232323232323232323232323232323232323232323232323232323232323232323232323232323232323232323232323232FFC00011080001000103012200021101031101FFC4001F0000010501010101010100000000000000000102030405060708090A0BFFC400B51000020102040403040705040400010277000102031104052131061241510761711322328108144291A1B1C109233352F0156272D10A162434E125F11718191A262728292A35363738393A434445464748494A535455565758595A636465666768696A737475767778797A82838485868788898A92939495969798999AA2A3A4A5A6A7A8A9AAB2B3B4B5B6B7B8B9BAC2C3C4C5C6C7C8C9CAD2D3D4D5D6D7D8D9DAE1E2E3E4E5E6E7E8E9EAF1F2F3F4F5F6F7F8F9FAFFC4001F0100030101010101010101010000000000000102030405060708090A0BFFC400B51100020102040403040705040400010277000102031104052131061241510761711322328108144291A1B1C109233352F0156272D10A162434E125F11718191A262728292A35363738393A434445464748494A535455565758595A636465666768696A737475767778797A82838485868788898A92939495969798999AA2A3A4A5A6A7A8A9AAB2B3B4B5B6B7B8B9BAC2C3C4C5C6C7C8C9CAD2D3D4D5D6D7D8D9DAE2E3E4E5E6E7E8E9EAF2F3F4F5F6F7F8F9FAFFDA000C03010002110311003F00F7FA28A2800A28A2803FFD9'
-                    )
-                )
-            return image_path
-
-        except Exception as e:
-            self.logger.error(f"Error downloading/creating image: {str(e)}")
-            raise
-
     def submit_deposit_api(
         self, amount=None, paytype="bank", transferType="2", bankId=9, promoCode=None, username=None, password=None,
         check_history_amount=False
@@ -58,12 +34,14 @@ class TestInit(BaseTest):
                 self.logger.error("Failed to get token")
                 return False
 
+            credentials = (username, password)
             headers = {
-                "Authorization": f"Bearer {token}",
                 "Accept": "application/json"
             }
 
-            deposit_info_response = requests.get(f"{CREDENTIALS['BO_base_url']}/api/depositInfo", headers=headers)
+            deposit_info_response = self.api.get(
+                f"{CREDENTIALS['BO_base_url']}/api/depositInfo", credentials=credentials, headers=headers
+            )
             if deposit_info_response.status_code != 200:
                 self.logger.error(f"Failed to get deposit info: {deposit_info_response.text}")
                 return False
@@ -79,19 +57,14 @@ class TestInit(BaseTest):
                 "promoCode": promoCode
             }
 
-            image_path = self.download_image()
-
-            with open(image_path, "rb") as image_file:
-                files = {
-                    "attachment": (image_path, image_file, "image/jpeg")
-                }
-
-                deposit_response = requests.post(
-                    f"{CREDENTIALS['BO_base_url']}/api/recharge", headers=headers, data=deposit_data, files=files
-                )
+            files = {
+                "attachment": get_image_store().upload("receipt")
+            }
 
-            if os.path.exists(image_path):
-                os.remove(image_path)
+            deposit_response = self.api.post(
+                f"{CREDENTIALS['BO_base_url']}/api/recharge", credentials=credentials, headers=headers,
+                data=deposit_data, files=files
+            )
 
             self.logger.info(f"Deposit response status: {deposit_response.status_code}")
 
@@ -114,14 +87,33 @@ class TestInit(BaseTest):
             self.logger.error(f"Error submitting deposit: {str(e)}")
             return False
 
-    def register_new_account(self):
-        try:
-            letters = ''.join(random.choices(string.ascii_letters, k=2))
-            numbers = ''.join(random.choices(string.digits, k=2))
-            random_string = f"{letters}{numbers}"
+    def register_new_account(self, state=FRESH):
+        pool = get_account_pool()
+        account = pool.checkout(state, owner=self.id())
+        if account:
+            self.logger.info(f"Checked out {state} account from pool: {account[0]}")
+            return account
+
+        self.logger.info(f"No {state} account in pool, registering one now")
+        if state != FRESH:
+            provisioner = AccountProvisioner(
+                pool, lambda: TestInit(methodName="runTest", language=self.language, browser=self.browser)
+            )
+            username = provisioner.provision(state)
+            if username:
+                pool.mark(username, CHECKED_OUT)
+                return username, username
+            return None, None
+
+        username, password = pool.reserve()
+        if self.register_account(username, password):
+            pool.mark(username, CHECKED_OUT)
+            return username, password
+        pool.discard(username)
+        return None, None
 
-            username = f"Test{random_string}"
-            password = f"Test{random_string}"
+    def register_account(self, username, password):
+        try:
             phone = f"601{random.randint(10000000, 99999999)}"
 
             self.logger.info(f"Starting registration process for username: {username}")
@@ -135,7 +127,7 @@ class TestInit(BaseTest):
                 "phone": phone,
             }
 
-            register_response = requests.post(f"{CREDENTIALS['BO_base_url']}/api/v3/register", json=register_data)
+            register_response = self.api.post(f"{CREDENTIALS['BO_base_url']}/api/v3/register", json=register_data)
             self.logger.info(f"Register response status: {register_response.status_code}")
 
             register_response.raise_for_status()
@@ -143,42 +135,14 @@ class TestInit(BaseTest):
             if data.get("code") == 200:
                 self.logger.info(f"Registration successful for username: {username}")
                 self.logger.info(f"Username: {username}, Password: {password}")
-                return username, password
+                return True
             else:
                 self.logger.error(f"Registration failed: {data.get('message')}")
-                return None, None
+                return False
 
         except Exception as e:
             self.logger.error(f"Error in registration: {str(e)}")
-            return None, None
-
-    def register_and_deposit_with_promo(self, with_additional_deposit=False):
-        try:
-            # Register new account
-            username, password = self.register_new_account()
-            self.logger.info(f"Username: {username}, Password: {password}")
-
-            if username and password:
-                # First deposit with promo
-                deposit_success = self.submit_deposit_api(promoCode="10DSRB", username=username, password=password)
-
-                if deposit_success and with_additional_deposit:
-                    # Additional deposit without promo if requested
-                    deposit_success = self.submit_deposit_api(username=username, password=password)
-
-                if deposit_success:
-                    self.logger.info("Deposit(s) successful")
-                    return username, password
-                else:
-                    self.logger.error("Deposit failed")
-                    return None, None
-            else:
-                self.logger.error("Registration failed")
-                return None, None
-
-        except Exception as e:
-            self.logger.error(f"Error in register_and_deposit_with_promo: {str(e)}")
-            return None, None
+            return False
 
     def withdraw_api(self, amount=None, username=None, password=None):
         try:
@@ -188,7 +152,6 @@ class TestInit(BaseTest):
                 return False
 
             headers = {
-                "Authorization": f"Bearer {token}",
                 "Accept": "application/json"
             }
 
@@ -197,8 +160,9 @@ class TestInit(BaseTest):
                 "bank": 524,
             }
 
-            withdraw_response = requests.post(
-                f"{CREDENTIALS['BO_base_url']}/api/withdraw", headers=headers, json=withdraw_data
+            withdraw_response = self.api.post(
+                f"{CREDENTIALS['BO_base_url']}/api/withdraw", credentials=(username, password), headers=headers,
+                json=withdraw_data
             )
             self.logger.info(f"Withdraw response status: {withdraw_response.status_code}")
 
@@ -226,7 +190,7 @@ class TestInit(BaseTest):
         else:
             url = CREDENTIALS["ApproveWithdrawRequest"].format(BO_base_url = CREDENTIALS["BO_base_url"], ID=ID)
 
-        response = requests.get(url)
+        response = self.api.get(url)
 
         if isReject:
             if response.status_code == 200:
@@ -253,7 +217,7 @@ class TestInit(BaseTest):
             "target_id": target_id,
             "amount": amount
         }
-        response = requests.post(f"{CREDENTIALS['BO_base_url']}/api/transfers", json=payload, headers=headers)
+        response = self.api.post(f"{CREDENTIALS['BO_base_url']}/api/transfers", json=payload, headers=headers)
         return response
 
     def get_promo_codes(self, username, password):
@@ -263,12 +227,13 @@ class TestInit(BaseTest):
             return []
 
         headers = {
-            "Authorization": f"Bearer {token}",
             "Accept": "application/json",
             "language": self.language
         }
 
-        deposit_info_response = requests.get(f"{CREDENTIALS['BO_base_url']}/api/depositInfo", headers=headers)
+        deposit_info_response = self.api.get(
+            f"{CREDENTIALS['BO_base_url']}/api/depositInfo", credentials=(username, password), headers=headers
+        )
         if deposit_info_response.status_code != 200:
             self.logger.error(f"Failed to get deposit info: {deposit_info_response.text}")
             return []
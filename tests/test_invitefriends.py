@@ -40,20 +40,19 @@ class TestInviteFriends(BaseTest):
         if not self.browser or not self.language:
             raise ValueError("Browser or language is not set.")
         self.logger.info(f"Setting up {self.browser} browser for {self.language} language...")
-        self.driver = self.initialize_browser(self.browser)
+        self.driver = self.acquire_browser()
         self.url = LANGUAGE_SETTINGS[self.language]["home_url"]
         self.driver.get(self.url)
         # self.driver.maximize_window()
         self.driver.set_window_size(375, 812)
-        self.navigate_to_login_page()
         self.username = CREDENTIALS["duplicated_user"]["username"]
         self.password = CREDENTIALS["duplicated_user"]["password"]
-        self.perform_login(self.username, self.password)
+        self.login_as(self.username, self.password)
         self.navigate_to_profile_page(self.language)
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
     
     def open_invite_modal(self):
         driver = self.driver
@@ -477,8 +476,7 @@ class TestInviteFriends(BaseTest):
             self.assertTrue(success_status, "Failed to topup")
             
             # Log out and log back in as original user
-            self.logout()
-            self.perform_login(self.username, self.password)
+            self.switchAccount(self.username, self.password)
             self.navigate_to_profile_page(self.language)
             
             # Verify member count increased by 1
@@ -48,15 +48,14 @@ class TestLiveAgent(BaseTest):
             else:
                 raise Exception("Failed to register new account after maximum attempts")
 
-        self.navigate_to_login_page()
-        self.perform_login(self.username, self.password)
+        self.login_as(self.username, self.password)
         self.userID = self.get_id_number()
         self.logger.info(f"User ID: {self.userID}")
         self.navigate_to_live_agent()
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
 
     def navigate_to_live_agent(self):
         live_agent_section = self.driver.find_element(By.ID, "chatbot-girl-button")
@@ -44,7 +44,7 @@ class TestLuckyWheelSpinPage(BaseTest):
         if not self.browser or not self.language:
             raise ValueError("Browser or language is not set.")
         self.logger.info(f"Setting up {self.browser} browser for {self.language} language...")
-        self.driver = self.initialize_browser(self.browser)
+        self.driver = self.acquire_browser()
         self.url = LANGUAGE_SETTINGS[self.language]["home_url"]
         self.driver.get(self.url)
         # self.driver.maximize_window()
@@ -54,7 +54,7 @@ class TestLuckyWheelSpinPage(BaseTest):
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
     
     def get_api_token(self):
         data = {
@@ -218,8 +218,7 @@ class TestLuckyWheelSpinPage(BaseTest):
         try:
             self.username, self.password = self.test_init.register_new_account()
             self.get_api_token()
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             self.get_api_token()
             
             self.clickMiniGameWidget("lucky_wheel")
@@ -241,8 +240,7 @@ class TestLuckyWheelSpinPage(BaseTest):
         driver = self.driver
 
         try:
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             self.get_api_token()
             spin_before = self.checkSpinTicket()
             driver.get(self.url)
@@ -264,8 +262,7 @@ class TestLuckyWheelSpinPage(BaseTest):
         self.logger.info("Starting spin wheel test...")
         
         try:
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             self.get_api_token()
             card_before = self.get4DCards()
             wallet_before = self.getWalletBalance()
@@ -297,8 +294,7 @@ class TestLuckyWheelSpinPage(BaseTest):
         self.logger.info("Starting TnC test...")
 
         try:
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             self.get_api_token()
             self.verify_tnc()
         
@@ -310,8 +306,7 @@ class TestLuckyWheelSpinPage(BaseTest):
         self.logger.info("Starting winner list test...")
 
         try:
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             self.get_api_token()
             self.verify_winner_list()
         
@@ -323,8 +318,7 @@ class TestLuckyWheelSpinPage(BaseTest):
         driver = self.driver
         try:
             # Login and get API token
-            self.navigate_to_login_page()
-            self.perform_login(self.username, self.password)
+            self.login_as(self.username, self.password)
             self.get_api_token()
             
             # Get prizes displayed on the wheel
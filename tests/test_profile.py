@@ -6,11 +6,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from config.constant import LANGUAGE_SETTINGS, CREDENTIALS, PROFILE_URL
+from config.constant import LANGUAGE_SETTINGS, CREDENTIALS
 from tests.authentication_test.base_test import BaseTest
-import tempfile
-import requests
-from urllib.parse import urlparse
+from utils.image_fixtures import get_image_store
 
 class TestProfilePage(BaseTest):
 
@@ -38,18 +36,17 @@ class TestProfilePage(BaseTest):
         if not self.browser or not self.language:
             raise ValueError("Browser or language is not set.")
         self.logger.info(f"Setting up {self.browser} browser for {self.language} language...")
-        self.driver = self.initialize_browser(self.browser)
+        self.driver = self.acquire_browser()
         self.url = LANGUAGE_SETTINGS[self.language]["home_url"]
         self.driver.get(self.url)
         # self.driver.maximize_window()
         self.driver.set_window_size(375, 812)
-        self.navigate_to_login_page()
-        self.perform_login(CREDENTIALS["duplicated_user"]["username"], CREDENTIALS["duplicated_user"]["password"])
+        self.login_as(CREDENTIALS["duplicated_user"]["username"], CREDENTIALS["duplicated_user"]["password"])
         self.navigate_to_profile_page(self.language)
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
 
     def verify_upload_success(self, isFromGallery = True):
         driver = self.driver
@@ -112,20 +109,7 @@ class TestProfilePage(BaseTest):
             )
             
             # Upload invalid format file
-            invalid_file_url = PROFILE_URL["invalid_format_url"]
-            # Get the filename from URL
-            filename = os.path.basename(urlparse(invalid_file_url).path)
-            
-            # Create a temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(filename)[1]) as temp_file:
-                try:
-                    response = requests.get(invalid_file_url)
-                    response.raise_for_status()  # Raises an HTTPError for bad responses
-                    temp_file.write(response.content)
-                    invalid_file_path = temp_file.name
-                except requests.exceptions.RequestException as e:
-                    self.fail(f"Failed to download image from URL: {e}")
-                    return False
+            invalid_file_path = get_image_store().path("invalid_format")
 
             if not os.path.exists(invalid_file_path):
                 raise FileNotFoundError(f"Test image not found at {invalid_file_path}")
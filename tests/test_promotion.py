@@ -11,6 +11,8 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from config.constant import API_URL, CREDENTIALS, LANGUAGE_SETTINGS
 from tests.authentication_test.base_test import BaseTest
+from utils.multi_language import multi_language
+from utils import reference_cache
 import pyperclip
 from PIL import Image
 import io
@@ -48,7 +50,7 @@ class TestPromotion(BaseTest):
         if not self.browser or not self.language:
             raise ValueError("Browser or language is not set.")
         self.logger.info(f"Setting up {self.browser} browser for {self.language} language...")
-        self.driver = self.initialize_browser(self.browser)
+        self.driver = self.acquire_browser()
         self.url = LANGUAGE_SETTINGS[self.language]["home_url"]
         self.driver.get(self.url)
         # self.driver.maximize_window()
@@ -57,34 +59,30 @@ class TestPromotion(BaseTest):
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
     
     def setup_test_user(self, register_new=False):
         """Set up test user - either create new or use existing"""
         if register_new:
             self.logger.info("Registering new account...")
-            self.username, self.password = self.test_init.register_new_account()
+            self.use_state()
+            return self.username, self.password
+
+        if self.language == "bm":
+            self.username = "LuffyTest1"
+            self.password = "LuffyTest1"
+        elif self.language == "cn":
+            self.username = "LuffyTest2"
+            self.password = "LuffyTest2"
+        elif self.language == "en":
+            self.username = "LuffyTest3"
+            self.password = "LuffyTest3"
         else:
-            if self.language == "bm":
-                self.username = "LuffyTest1"
-                self.password = "LuffyTest1"
-            elif self.language == "cn":
-                self.username = "LuffyTest2"
-                self.password = "LuffyTest2"
-            elif self.language == "en":
-                self.username = "LuffyTest3"
-                self.password = "LuffyTest3"
-            else:
-                self.username = "LuffyTest4"
-                self.password = "LuffyTest4"
-                
-        while self.username == None or self.password == None:
-            self.logger.info("Registering new account...")
-            self.username, self.password = self.test_init.register_new_account()
+            self.username = "LuffyTest4"
+            self.password = "LuffyTest4"
             
         self.logger.info(f"Username: {self.username}, Password: {self.password}")
-        self.navigate_to_login_page()
-        self.perform_login(self.username, self.password)
+        self.login_as(self.username, self.password)
         
         return self.username, self.password
     
@@ -114,16 +112,10 @@ class TestPromotion(BaseTest):
         self.navigate_to_profile_menu("profile-menu-promotion")
     
     def get_all_promotion_api(self):
-        token = self.login(self.username, self.password)
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json",
-            "Language": self.language
-        }
-        response = requests.get(f"{CREDENTIALS['GetAllPromotion'].format(BO_base_url = CREDENTIALS["BO_base_url"])}", headers=headers)
-        response.raise_for_status()
-        promotions = response.json().get("data").get("promotions")
-        return promotions
+        promotions = self.rendered_api_data("/api/promotion")
+        if promotions is not None:
+            return promotions.get("promotions")
+        return reference_cache.promotions(self.language)
 
     def normalize_with_bs4(self, html_str):
         soup = BeautifulSoup(html_str, 'html.parser')
@@ -183,6 +175,7 @@ class TestPromotion(BaseTest):
             endpoint += f"?{'&'.join(query_parts)}"
         return endpoint  
     
+    @multi_language
     def test_01_InfoShown(self):
         action = ActionChains(self.driver)
         try:
@@ -241,6 +234,7 @@ class TestPromotion(BaseTest):
             self.logger.error(f"Test failed with error: {str(e)}")
             self.fail(f"Test failed with error: {str(e)}")
     
+    @multi_language
     def test_02_ModalInfoShown(self):
         action = ActionChains(self.driver)
         try:
@@ -10,6 +10,7 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from config.constant import API_URL, LANGUAGE_SETTINGS, CREDENTIALS
 from tests.authentication_test.base_test import BaseTest
+from utils.multi_language import multi_language
 import pyperclip
 from PIL import Image
 import io
@@ -43,7 +44,7 @@ class TestVipMemberLevel(BaseTest):
         if not self.browser or not self.language:
             raise ValueError("Browser or language is not set.")
         self.logger.info(f"Setting up {self.browser} browser for {self.language} language...")
-        self.driver = self.initialize_browser(self.browser)
+        self.driver = self.acquire_browser()
         self.url = LANGUAGE_SETTINGS[self.language]["home_url"]
         self.driver.get(self.url)
         # self.driver.maximize_window()
@@ -52,18 +53,17 @@ class TestVipMemberLevel(BaseTest):
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
     
     def setup_test_user(self, register_new=False):
         """Set up test user - either create new or use existing"""
         if register_new:
-            self.username, self.password = self.test_init.register_new_account()
-        else:
-            self.username = "LuffyTest5"
-            self.password = "LuffyTest5"
-        
-        self.navigate_to_login_page()
-        self.perform_login(self.username, self.password)
+            self.use_state()
+            return self.username, self.password
+
+        self.username = "LuffyTest5"
+        self.password = "LuffyTest5"
+        self.login_as(self.username, self.password)
         return self.username, self.password
     
     # Helper methods
@@ -93,6 +93,7 @@ class TestVipMemberLevel(BaseTest):
         else:
             self.fail("No amount found in subtitle card text")
     
+    @multi_language
     def test_01_CurrentVipAndNextVipProfilePage(self):
         try:
             self.logger.info("Starting vip status profile page test...")
@@ -123,6 +124,7 @@ class TestVipMemberLevel(BaseTest):
             self.logger.error(f"Test failed with error: {str(e)}")
             self.fail(f"Test failed with error: {str(e)}")
     
+    @multi_language
     def test_02_RemainingTopupAmountProfilePage(self):
         try:
             self.logger.info("Starting remaining topup amount profile page test...")
@@ -155,6 +157,7 @@ class TestVipMemberLevel(BaseTest):
             self.logger.error(f"Test failed with error: {str(e)}")
             self.fail(f"Test failed with error: {str(e)}")
     
+    @multi_language
     def test_03_ProgressBarProfilePage(self):
         try:
             self.logger.info("Starting progress bar profile page test...")
@@ -191,6 +194,7 @@ class TestVipMemberLevel(BaseTest):
             self.logger.error(f"Test failed with error: {str(e)}")
             self.fail(f"Test failed with error: {str(e)}")
     
+    @multi_language
     def test_04_CheckVIPCardInfoUntilCurrentVIP(self):
         try:
             self.logger.info("Starting VIP level up test...")
@@ -248,6 +252,7 @@ class TestVipMemberLevel(BaseTest):
             self.logger.error(f"Test failed with error: {str(e)}")
             self.fail(f"Test failed with error: {str(e)}")
     
+    @multi_language
     def test_05_CheckVIPCardInfoFromCurrentVIPToLastVIP(self):
         try:
             self.logger.info("Starting VIP level up test...")
@@ -325,6 +330,7 @@ class TestVipMemberLevel(BaseTest):
             self.logger.error(f"Test failed with error: {str(e)}")
             self.fail(f"Test failed with error: {str(e)}")
 
+    @multi_language
     def test_06_CheckModalInfo(self):
         try:
             self.logger.info("Starting modal info test...")
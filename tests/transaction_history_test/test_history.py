@@ -12,6 +12,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from config.constant import LANGUAGE_SETTINGS, CREDENTIALS
 from tests.authentication_test.base_test import BaseTest
 from tests.test_init import TestInit
+from utils.history_verifier import HistoryVerifier
+from utils.fixtures import UserState, get_fixture_resolver
 
 
 class TestHistory(BaseTest):
@@ -22,37 +24,15 @@ class TestHistory(BaseTest):
 
     def setUp(self):
         super().setUp()
-        max_attempts = 3
-        attempt = 0
-
-        while attempt < max_attempts:
-            result = self.test_init.register_new_account()
-
-            if result and isinstance(result, tuple) and len(result) == 2:
-                self.username, self.password = result
-
-                if self.username is not None:
-                    self.logger.info(f"Successfully registered account: {self.username}")
-                    break
-
-            attempt += 1
-            self.logger.error(f"Registration attempt {attempt} failed. Got result: {result}")
-
-            if attempt < max_attempts:
-                self.logger.info("Retrying registration...")
-                time.sleep(2)
-            else:
-                raise Exception("Failed to register new account after maximum attempts")
-
-        self.navigate_to_login_page()
-        self.perform_login(self.username, self.password)
+        self.user = self.use_state()
+        self.logger.info(f"Successfully registered account: {self.username}")
         self.userID = self.get_id_number()
         self.logger.info(f"User ID: {self.userID}")
         self.navigate_to_history()
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
 
     def navigate_to_history(self):
         driver = self.driver
@@ -293,6 +273,27 @@ class TestHistory(BaseTest):
                 i.click()
                 return record_type_value
 
+    def history_verifier(self):
+        return HistoryVerifier(self.api, (self.username, self.password), self.language)
+
+    def verify_history_against_api(self, record_type_value, date_option_id=None, start_date=None, end_date=None):
+        """Reconcile every page of the currently filtered table with the API; fails listing the differences."""
+        verifier = self.history_verifier()
+        api_records = verifier.fetch_records(
+            record_type_value, date_option_id=date_option_id, start_date=start_date, end_date=end_date
+        )
+        ui_rows = self.collect_table_rows()
+        report = verifier.reconcile(record_type_value, api_records, ui_rows)
+        self.logger.info(report.summary())
+        if not report.ok:
+            self.fail(f"History does not match API:\n{report.summary()}")
+        return report
+
+    @staticmethod
+    def date_option_id(option_id):
+        """The ``date`` filter value of a ``date-type-option-<n>`` option from check_date_record."""
+        return option_id.split("-")[-1]
+
     def check_date_record(self, index):
         self.open_dropdown(index)
         time.sleep(2)
@@ -323,7 +324,7 @@ class TestHistory(BaseTest):
 
         if rebate_info:
             try:
-                date_option_id = record_type_id.split("-")[-1]
+                date_option_id = self.date_option_id(record_type_id)
                 index = int(date_option_id) - 1
 
                 if isinstance(rebate_info, list):
@@ -364,7 +365,7 @@ class TestHistory(BaseTest):
             record_option.click()
             time.sleep(2)
 
-            date_option_id = record_type_id.split("-")[-1]
+            date_option_id = self.date_option_id(record_type_id)
             self.logger.info(f"Extracted date option ID: {date_option_id}")
 
             try:
@@ -440,32 +441,18 @@ class TestHistory(BaseTest):
             if len(rows) > 0:
                 self.logger.info(f"Found {len(rows)} {record_type_text} records")
 
-                token = self.login(self.username, self.password)
-                if not token:
-                    self.logger.error("Failed to get token")
-                    return False
-
-                headers = {
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/json",
-                    "language": self.language
-                }
-                if date_range:
-                    api_url = f"{CREDENTIALS['SpecifyDateHistory'].format(BO_base_url = CREDENTIALS["BO_base_url"], record_type_value=record_type_value, start_date=start_date, end_date=end_date)}"
-                else:
-                    api_url = f"{CREDENTIALS['DateHistory'].format(BO_base_url = CREDENTIALS["BO_base_url"], record_type_value=record_type_value, date_option_id=date_option_id)}"
-
-                self.logger.info(f"API URL: {api_url}")
-
-                deposit_info_response = requests.get(api_url, headers=headers)
-                if deposit_info_response.status_code != 200:
-                    self.logger.error(f"Failed to get deposit info: {deposit_info_response.text}")
+                try:
+                    if date_range:
+                        api_records = self.history_verifier().fetch_records(
+                            record_type_value, start_date=start_date, end_date=end_date
+                        )
+                    else:
+                        api_records = self.history_verifier().fetch_records(
+                            record_type_value, date_option_id=date_option_id
+                        )
+                except Exception as e:
+                    self.logger.error(f"Failed to get history records: {str(e)}")
                     return False
-
-                deposit_info = deposit_info_response.json()
-                self.logger.info(f"API Response: {deposit_info}")
-
-                api_records = deposit_info.get('data', {}).get('data', [])
                 self.logger.info(f"API returned {len(api_records)} records")
 
                 first_row = rows[0]
@@ -903,12 +890,11 @@ class TestHistory(BaseTest):
 
     def setup_for_bet_test(self, use_yesterday=False):
 
-        _, amount = self.test_init.submit_deposit_api(
-            username=self.username, password=self.password, check_history_amount=True
-        )
+        # one approved deposit on the account setUp logged in with
+        self.user = get_fixture_resolver().apply(self.user, UserState(extra_deposits=1))
+        amount, _ = self.user.deposits[-1]
         transfer_amount = random.randint(1, amount)
 
-        self.handleDeposit(self.userID)
         if not use_yesterday:
             self.clear_selection()
         transfer_details, _ = self.transfer_to_random_game(transfer_amount, self.username, self.password)
@@ -1681,6 +1667,31 @@ class TestHistory(BaseTest):
             self.logger.error(traceback.format_exc())
             self.fail(f"Test failed: {str(e)}")
 
+    def test_15_ReconcileHistoryWithAPI(self):
+        try:
+            self.test_init.submit_deposit_api(username=self.username, password=self.password, check_history_amount=True)
+            self.handleDeposit(self.userID)
+            self.test_init.submit_deposit_api(username=self.username, password=self.password, check_history_amount=True)
+
+            self.driver.refresh()
+            self.waits.page_settled()
+            self.open_dropdown(0)
+            record_type_value = self.choose_specific_record_type("deposit")
+            self.waits.network_idle()
+
+            record_types = self.check_date_record(1)
+            # widest option, so the table spans several pages on long-lived accounts
+            record_type_id, record_type_text = record_types[-1]
+            self.logger.info(f"Reconciling {record_type_value} history for: {record_type_text}")
+            WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable((By.ID, record_type_id))).click()
+
+            report = self.verify_history_against_api(
+                record_type_value, date_option_id=self.date_option_id(record_type_id)
+            )
+            self.assertGreaterEqual(report.api_count, 2, "Expected both deposits in the API history")
+
+        except Exception as e:
+            self.fail(f"Test failed: {str(e)}")
 
 if __name__ == "__main__":
 
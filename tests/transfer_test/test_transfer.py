@@ -8,6 +8,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from config.constant import LANGUAGE_SETTINGS, CREDENTIALS
 from tests.authentication_test.base_test import BaseTest
 from tests.test_init import TestInit
+from utils.fixtures import UserState, get_fixture_resolver
 from datetime import datetime
 
 
@@ -19,24 +20,21 @@ class TestTransfer(BaseTest):
 
     def setUp(self):
         super().setUp()
-        self.navigate_to_login_page()
-        self.perform_login(CREDENTIALS["duplicated_user"]["username"], CREDENTIALS["duplicated_user"]["password"])
+        self.login_as(CREDENTIALS["duplicated_user"]["username"], CREDENTIALS["duplicated_user"]["password"])
         self.username = CREDENTIALS["duplicated_user"]["username"]
         self.password = CREDENTIALS["duplicated_user"]["password"]
         self.navigate_to_transfer()
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
 
     def switchToCompleteTurnoverAcc(self):
-        self.logout()
-        self.perform_login(CREDENTIALS["complete_turnover"]["username"], CREDENTIALS["complete_turnover"]["password"])
+        self.switchAccount(CREDENTIALS["complete_turnover"]["username"], CREDENTIALS["complete_turnover"]["password"])
         self.navigate_to_transfer()
 
     def switchToIncompleteTurnoverAcc(self):
-        self.logout()
-        self.perform_login(
+        self.switchAccount(
             CREDENTIALS["incomplete_turnover"]["username"], CREDENTIALS["incomplete_turnover"]["password"]
         )
         self.navigate_to_transfer()
@@ -620,70 +618,6 @@ class TestTransfer(BaseTest):
             self.logger.error(f"Screenshot saved as {screenshot_name}")
             raise
 
-    def modify_turnover_status(self, userID, turnoverIDs, action_type="unlock", partial=False):
-
-        try:
-            turnover_actions = {
-                "success": 1,
-                "in_progress": 0,
-                "unlock": -1
-            }
-
-            action = turnover_actions.get(action_type)
-            if action is None:
-                self.logger.error(f"Invalid action type: {action_type}")
-                return False
-
-            if partial and len(turnoverIDs) > 1:
-                num_to_complete = random.randint(1, len(turnoverIDs) - 1)
-                selected_ids = random.sample(turnoverIDs, num_to_complete)
-                self.logger.info(f"Partially completing {num_to_complete} out of {len(turnoverIDs)} turnovers")
-            else:
-                selected_ids = turnoverIDs
-
-            for turnover_id in selected_ids:
-                modify_url = CREDENTIALS["ModifyTurnover"].format(BO_base_url = CREDENTIALS["BO_base_url"], userID=userID, turnover_id=turnover_id, action=action)
-                self.logger.info(f"Attempting to {action_type} turnover ID: {turnover_id}")
-
-                response = requests.get(modify_url)
-                if response.status_code == 200:
-                    self.logger.info(f"Successfully {action_type} turnover ID: {turnover_id}")
-                else:
-                    self.logger.error(
-                        f"Failed to {action_type} turnover ID {turnover_id}. Status code: {response.status_code}"
-                    )
-                    return False
-
-            return True
-
-        except Exception as e:
-            self.logger.error(f"Error modifying turnover: {str(e)}")
-            return False
-
-    def get_turnover_ids(self, userID, language=None):
-        try:
-            turnoverAPI = CREDENTIALS["CheckTurnover"].format(BO_base_url = CREDENTIALS["BO_base_url"], ID=userID, language=language)
-            turnover_ids = []
-
-            response = requests.get(turnoverAPI)
-            if response.status_code == 200:
-                turnoverData = response.json()
-                self.logger.info(f"Turnover data: {turnoverData}")
-
-                for item in turnoverData:
-                    if 'id' in item:
-                        turnover_ids.append(item['id'])
-
-                self.logger.info(f"Found turnover IDs: {turnover_ids}")
-                return turnover_ids
-            else:
-                self.logger.error(f"Failed to get turnover data. Status code: {response.status_code}")
-                return []
-
-        except Exception as e:
-            self.logger.error(f"Error getting turnover IDs: {str(e)}")
-            return []
-
     def check_and_transfer_to_empty_providers(self, provider_ids):
 
         try:
@@ -780,14 +714,14 @@ class TestTransfer(BaseTest):
     def setup_and_get_turnover_amounts(self, with_additional_deposit=False):
         try:
 
-            username, password = self.test_init.register_and_deposit_with_promo(with_additional_deposit)
-            if not username or not password:
-                self.fail("Registration or deposit failed")
+            user = get_fixture_resolver().resolve(
+                UserState(locked_promos=1, extra_deposits=1 if with_additional_deposit else 0)
+            )
+            username, password = user.credentials
 
             self.switchAccount(username, password)
             self.navigate_to_transfer()
             userID = self.get_id_number()
-            self.handleDeposit(userID)
 
             turnoverIncomplete, turnoverList = self.checkIncompleteTurnover(
                 userID, checkIncomplete=True, language=self.language, transfer_check=True
@@ -1112,18 +1046,16 @@ class TestTransfer(BaseTest):
     def test_15_TransferFromSpecificWalletToMainUnlockBonus(self):
         try:
             userID = self.get_id_number()
-            turnoverIDs = self.get_turnover_ids(userID, self.language)
+            turnovers = self.turnovers(userID, self.language)
 
-            if not turnoverIDs:
+            if not turnovers.ids:
                 self.fail("No turnoverIDs found")
 
-            unlock_success = self.modify_turnover_status(userID, turnoverIDs, action_type="unlock")
+            unlock_success = turnovers.apply("unlock")
             if not unlock_success:
                 self.fail("Failed to unlock turnover")
 
-            turnoverIncomplete, locked_by_list = self.checkIncompleteTurnover(
-                userID, checkIncomplete=True, language=self.language, transfer_check=True
-            )
+            turnoverIncomplete, locked_by_list = turnovers.incomplete(transfer_check=True)
             self.logger.info(
                 f"Turnover status after unlock - Incomplete: {turnoverIncomplete}, Locked: {locked_by_list}"
             )
@@ -1156,18 +1088,16 @@ class TestTransfer(BaseTest):
                 provider_ids = self.parse_provider_ids(providers_list)
                 self.logger.info(f"Provider IDs: {provider_ids}")
 
-            turnoverIDs = self.get_turnover_ids(userID, self.language)
+            turnovers = self.turnovers(userID, self.language)
 
-            if not turnoverIDs:
+            if not turnovers.ids:
                 self.fail("No turnoverIDs found")
 
-            unlock_success = self.modify_turnover_status(userID, turnoverIDs, action_type="unlock")
+            unlock_success = turnovers.apply("unlock")
             if not unlock_success:
                 self.fail("Failed to unlock turnover")
 
-            turnoverIncomplete, locked_by_list = self.checkIncompleteTurnover(
-                userID, checkIncomplete=True, language=self.language, transfer_check=True
-            )
+            turnoverIncomplete, locked_by_list = turnovers.incomplete(transfer_check=True)
             self.logger.info(
                 f"Turnover status after unlock - Incomplete: {turnoverIncomplete}, Locked: {locked_by_list}"
             )
@@ -1199,18 +1129,16 @@ class TestTransfer(BaseTest):
                 provider_ids = self.parse_provider_ids(providers_list)
                 self.logger.info(f"Provider IDs: {provider_ids}")
 
-            turnoverIDs = self.get_turnover_ids(userID, self.language)
+            turnovers = self.turnovers(userID, self.language)
 
-            if not turnoverIDs:
+            if not turnovers.ids:
                 self.fail("No turnoverIDs found")
 
-            unlock_success = self.modify_turnover_status(userID, turnoverIDs, action_type="unlock")
+            unlock_success = turnovers.apply("unlock")
             if not unlock_success:
                 self.fail("Failed to unlock turnover")
 
-            turnoverIncomplete, locked_by_list = self.checkIncompleteTurnover(
-                userID, checkIncomplete=True, language=self.language, transfer_check=True
-            )
+            turnoverIncomplete, locked_by_list = turnovers.incomplete(transfer_check=True)
             self.logger.info(
                 f"Turnover status after unlock - Incomplete: {turnoverIncomplete}, Locked: {locked_by_list}"
             )
@@ -1242,18 +1170,16 @@ class TestTransfer(BaseTest):
                 provider_ids = self.parse_provider_ids(providers_list)
                 self.logger.info(f"Provider IDs: {provider_ids}")
 
-            turnoverIDs = self.get_turnover_ids(userID, self.language)
+            turnovers = self.turnovers(userID, self.language)
 
-            if not turnoverIDs:
+            if not turnovers.ids:
                 self.fail("No turnoverIDs found")
 
-            unlock_success = self.modify_turnover_status(userID, turnoverIDs, action_type="unlock")
+            unlock_success = turnovers.apply("unlock")
             if not unlock_success:
                 self.fail("Failed to unlock turnover")
 
-            turnoverIncomplete, locked_by_list = self.checkIncompleteTurnover(
-                userID, checkIncomplete=True, language=self.language, transfer_check=True
-            )
+            turnoverIncomplete, locked_by_list = turnovers.incomplete(transfer_check=True)
             self.logger.info(
                 f"Turnover status after unlock - Incomplete: {turnoverIncomplete}, Locked: {locked_by_list}"
             )
@@ -1290,16 +1216,14 @@ class TestTransfer(BaseTest):
             if transfer_needed:
                 time.sleep(2)
 
-        turnoverIDs = self.get_turnover_ids(userID, self.language)
-        if not turnoverIDs:
+        turnovers = self.turnovers(userID, self.language)
+        if not turnovers.ids:
             self.fail("No turnoverIDs found")
 
-        turnoverIncomplete, turnoverList = self.checkIncompleteTurnover(
-            userID, checkIncomplete=True, language=self.language, transfer_check=True
-        )
+        turnoverIncomplete, turnoverList = turnovers.incomplete(transfer_check=True)
         self.logger.info(f"Turnover status before unlock - Incomplete: {turnoverIncomplete}, Locked: {turnoverList}")
 
-        complete_success = self.modify_turnover_status(userID, turnoverIDs, action_type="success")
+        complete_success = turnovers.apply("success")
         if not complete_success:
             self.fail("Failed to complete turnover")
 
@@ -1331,16 +1255,14 @@ class TestTransfer(BaseTest):
             if transfer_needed:
                 time.sleep(2)
 
-        turnoverIDs = self.get_turnover_ids(userID, self.language)
-        if not turnoverIDs:
+        turnovers = self.turnovers(userID, self.language)
+        if not turnovers.ids:
             self.fail("No turnoverIDs found")
 
-        turnoverIncomplete, turnoverList = self.checkIncompleteTurnover(
-            userID, checkIncomplete=True, language=self.language, transfer_check=True
-        )
+        turnoverIncomplete, turnoverList = turnovers.incomplete(transfer_check=True)
         self.logger.info(f"Turnover status before unlock - Incomplete: {turnoverIncomplete}, Locked: {turnoverList}")
 
-        complete_success = self.modify_turnover_status(userID, turnoverIDs, action_type="success")
+        complete_success = turnovers.apply("success")
         if not complete_success:
             self.fail("Failed to complete turnover")
 
@@ -1599,11 +1521,11 @@ class TestTransfer(BaseTest):
 
             self.transfer_and_verify(game_id_from, game_id_to, credit_from, credit_to, amount=non_provider_amount)
 
-            turnoverIDs = self.get_turnover_ids(userID, self.language)
-            if not turnoverIDs:
+            turnovers = self.turnovers(userID, self.language)
+            if not turnovers.ids:
                 self.fail("No turnoverIDs found")
 
-            complete_success = self.modify_turnover_status(userID, turnoverIDs, action_type="success")
+            complete_success = turnovers.apply("success")
             if not complete_success:
                 self.fail("Failed to complete turnover")
 
@@ -1639,11 +1561,11 @@ class TestTransfer(BaseTest):
 
             self.transfer_and_verify(game_id_from, game_id_to, credit_from, credit_to, amount=non_provider_amount)
 
-            turnoverIDs = self.get_turnover_ids(userID, self.language)
-            if not turnoverIDs:
+            turnovers = self.turnovers(userID, self.language)
+            if not turnovers.ids:
                 self.fail("No turnoverIDs found")
 
-            complete_success = self.modify_turnover_status(userID, turnoverIDs, action_type="success")
+            complete_success = turnovers.apply("success")
             if not complete_success:
                 self.fail("Failed to complete turnover")
 
@@ -1677,11 +1599,11 @@ class TestTransfer(BaseTest):
 
             self.transfer_and_verify(game_id_from, game_id_to, credit_from, credit_to, amount=entire_amount)
 
-            turnoverIDs = self.get_turnover_ids(userID, self.language)
-            if not turnoverIDs:
+            turnovers = self.turnovers(userID, self.language)
+            if not turnovers.ids:
                 self.fail("No turnoverIDs found")
 
-            complete_success = self.modify_turnover_status(userID, turnoverIDs, action_type="success")
+            complete_success = turnovers.apply("success")
             if not complete_success:
                 self.fail("Failed to complete turnover")
 
@@ -1728,11 +1650,11 @@ class TestTransfer(BaseTest):
 
             self.transfer_and_verify(game_id_from, game_id_to, credit_from, credit_to, amount=entire_amount)
 
-            turnoverIDs = self.get_turnover_ids(userID, self.language)
-            if not turnoverIDs:
+            turnovers = self.turnovers(userID, self.language)
+            if not turnovers.ids:
                 self.fail("No turnoverIDs found")
 
-            complete_success = self.modify_turnover_status(userID, turnoverIDs, action_type="success", partial=True)
+            complete_success = turnovers.apply("success", partial=True)
             if not complete_success:
                 self.fail("Failed to complete turnover")
 
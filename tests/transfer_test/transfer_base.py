@@ -1,23 +1,26 @@
 from tests.authentication_test.base_test import BaseTest
 from tests.test_init import TestInit
-import requests
 from config.constant import CREDENTIALS
 import random
 import pandas as pd
 from datetime import datetime
 import json
 import math
+from concurrent.futures import ThreadPoolExecutor
+from utils.tracing import traced_helpers
 
 
+@traced_helpers
 class TransferBase(BaseTest):
 
     def __init__(self, methodName="runTest", language=None, browser=None):
         super().__init__(methodName, language, browser)
         self.test_init = TestInit(methodName="runTest", language=language, browser=browser)
         self.TRANSFER_AMOUNT = float(CREDENTIALS['transfer_amount']['amount'])
+        self.TRANSFER_WORKERS = int(CREDENTIALS['transfer_workers']['workers'])
 
     def get_main_account_balance(self, headers):
-        response = requests.get(f"{CREDENTIALS['BO_base_url']}/api/balance", headers=headers)
+        response = self.api.get(f"{CREDENTIALS['BO_base_url']}/api/balance", headers=headers)
         response.raise_for_status()
         return response.json().get("data")["balance"]
 
@@ -27,7 +30,7 @@ class TransferBase(BaseTest):
             "target_id": target_id,
             "amount": amount
         }
-        response = requests.post(f"{CREDENTIALS['BO_base_url']}/api/transfers", json=payload, headers=headers)
+        response = self.api.post(f"{CREDENTIALS['BO_base_url']}/api/transfers", json=payload, headers=headers)
         return response
 
     def print_game_data(self, label, game_data):
@@ -36,10 +39,12 @@ class TransferBase(BaseTest):
         print(formatted_data + "\n")
 
     def get_id_api(self, headers):
-        response = requests.get(f"{CREDENTIALS['BO_base_url']}/api/user", headers=headers)
+        response = self.api.get(f"{CREDENTIALS['BO_base_url']}/api/user", headers=headers)
         return response.json().get("data")["id"]
 
-    def transfer_to_all_providers(self, headers, initial_balance=None, provider_count=None, revert_mode=False, part=1):
+    def transfer_to_all_providers(
+        self, headers, initial_balance=None, provider_count=None, revert_mode=False, part=1, workers=None
+    ):
 
         all_games = sorted(self.get_game_ids(headers), key=lambda x: x["id"])
 
@@ -91,22 +96,30 @@ class TransferBase(BaseTest):
         test_results = []
         total_expected_credit = 0
 
-        current = 0
-        for game in initial_game_data:
-            game_id = game.get("id")
-            if game_id < 1:
-                continue
+        games = [game for game in initial_game_data if game.get("id") >= 1]
+        workers = max(1, min(workers or self.TRANSFER_WORKERS, len(games) or 1))
+        self.logger.info(f"Transferring to {len(games)} providers with {workers} workers")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self.make_transfer, headers, source_id=0, target_id=game.get("id"), amount=self.TRANSFER_AMOUNT
+                ) for game in games
+            ]
+            responses = []
+            for current, (game, future) in enumerate(zip(games, futures), start=1):
+                print(f"\rProcessing provider {current}/{provider_count}: {game.get('name')}", end="")
+                responses.append(future.result())
 
-            current += 1
-            print(f"\rProcessing provider {current}/{provider_count}: {game.get('name')}", end="")
+        # each provider receives a single transfer, so one snapshot afterwards gives every final balance
+        game_snapshot = {g["id"]: g for g in self.get_game_ids(headers)}
 
+        for game, response in zip(games, responses):
+            game_id = game.get("id")
             self.processed_providers.add(str(game_id))
 
             initial_credit = float(game.get("credit"))
-            response = self.make_transfer(headers, source_id=0, target_id=game_id, amount=self.TRANSFER_AMOUNT)
-
-            updated_game_data = self.get_game_ids(headers)
-            updated_game = next((g for g in updated_game_data if g["id"] == game_id), None)
+            updated_game = game_snapshot.get(game_id)
             final_credit = float(updated_game.get("credit", 0)) if updated_game else 0
 
             if response.status_code == 200:
@@ -141,7 +154,8 @@ class TransferBase(BaseTest):
             'failed_transfers': failed_transfers,
             'failed_game_ids': failed_game_ids,
             'test_results': test_results,
-            'total_expected_credit': total_expected_credit
+            'total_expected_credit': total_expected_credit,
+            'game_snapshot': game_snapshot
         }
 
     def setup_deposit_transfer(self, provider_count=None, revert_mode=False, part=1):
@@ -171,9 +185,10 @@ class TransferBase(BaseTest):
             headers, initial_balance, provider_count, revert_mode=revert_mode, part=part
         )
 
+        game_snapshot = transfer_results['game_snapshot']
         game_details = []
         for game_id in transfer_results['successful_transfers']:
-            game_data = next((g for g in self.get_game_ids(headers) if g["id"] == game_id), None)
+            game_data = game_snapshot.get(game_id)
             if game_data:
                 game_details.append({
                     'id': game_id,
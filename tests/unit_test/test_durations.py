@@ -0,0 +1,26 @@
+import unittest
+
+from utils.durations import predict_makespan
+
+
+class TestPredictMakespan(unittest.TestCase):
+
+    def test_single_worker_is_the_sum(self):
+        self.assertEqual(predict_makespan([3, 2, 1], 1), 6)
+
+    def test_jobs_go_to_the_first_free_worker(self):
+        # 3|3, then 2 -> 5|3, 2 -> 5|5, 2 -> 7|5
+        self.assertEqual(predict_makespan([3, 3, 2, 2, 2], 2), 7)
+
+    def test_more_workers_than_jobs(self):
+        self.assertEqual(predict_makespan([4, 1], 8), 4)
+
+    def test_no_jobs(self):
+        self.assertEqual(predict_makespan([], 4), 0)
+
+    def test_no_workers_counts_as_one(self):
+        self.assertEqual(predict_makespan([1, 2], 0), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from utils.history_verifier import HistoryVerifier
+
+
+def deposit(created_at, amount, status="Approved"):
+    return {"created_at": created_at, "amount": amount, "status": status}
+
+
+class TestReconcile(unittest.TestCase):
+
+    def setUp(self):
+        self.verifier = HistoryVerifier(api=None, credentials=None, language="en", workers=1)
+
+    def test_matching_rows_are_ok(self):
+        report = self.verifier.reconcile(
+            "deposit", [deposit("2025-01-31 14:05:59", "1,000.00")],
+            [["31/01/2025 02:05 PM", "1000", "", "Approved"]]
+        )
+        self.assertTrue(report.ok, report.summary())
+
+    def test_missing_and_extra_rows(self):
+        report = self.verifier.reconcile(
+            "deposit", [deposit("2025-01-31 14:05", "50")], [["31/01/2025 02:06 PM", "50", "", "Approved"]]
+        )
+        self.assertEqual(len(report.missing), 1)
+        self.assertEqual(len(report.extra), 1)
+        self.assertFalse(report.ok)
+
+    def test_status_mismatch(self):
+        report = self.verifier.reconcile(
+            "deposit", [deposit("2025-01-31 14:05", "50", "Pending")], [["31/01/2025 02:05 PM", "50", "", "Approved"]]
+        )
+        self.assertEqual([(api, ui) for _, api, ui in report.mismatched], [("pending", "approved")])
+
+    def test_duplicate_keys_are_counted(self):
+        record = deposit("2025-01-31 14:05", "50")
+        report = self.verifier.reconcile(
+            "deposit", [record, dict(record)], [["31/01/2025 02:05 PM", "50", "", "Approved"]]
+        )
+        self.assertEqual(len(report.missing), 1)
+        self.assertEqual(report.extra, [])
+
+    def test_no_record_placeholder_is_ignored(self):
+        report = self.verifier.reconcile("deposit", [], [["No record"]])
+        self.assertEqual(report.ui_count, 0)
+        self.assertTrue(report.ok)
+
+    def test_transfer_wallet_names_are_normalised(self):
+        report = self.verifier.reconcile(
+            "transfer", [{"created_at": "2025-01-31 14:05", "from": "Main", "to": "mega888", "amount": "-10",
+                          "status": "Success"}], [["31/01/2025 02:05 PM", "Main Wallet", "Mega888 Wallet", "10.00",
+                                                   "Success"]]
+        )
+        self.assertTrue(report.ok, report.summary())
+
+    def test_record_type_without_a_layout(self):
+        with self.assertRaises(ValueError):
+            self.verifier.reconcile("bet", [], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
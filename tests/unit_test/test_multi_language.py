@@ -0,0 +1,25 @@
+import unittest
+
+from utils.multi_language import language_url
+
+
+class TestLanguageUrl(unittest.TestCase):
+
+    def test_switches_the_language_route(self):
+        self.assertEqual(
+            language_url("https://example.com/cn/profile?tab=1", "en"), "https://example.com/en/profile?tab=1"
+        )
+
+    def test_adds_a_missing_language_route(self):
+        self.assertEqual(language_url("https://example.com/profile", "bm"), "https://example.com/bm/profile")
+
+    def test_home_page(self):
+        self.assertEqual(language_url("https://example.com/", "cn"), "https://example.com/cn")
+        self.assertEqual(language_url("https://example.com/en/", "cn"), "https://example.com/cn")
+
+    def test_only_the_first_segment_is_a_language(self):
+        self.assertEqual(language_url("https://example.com/en/cn", "bm"), "https://example.com/bm/cn")
+
+
+if __name__ == "__main__":
+    unittest.main()
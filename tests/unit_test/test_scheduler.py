@@ -0,0 +1,66 @@
+import unittest
+
+from utils.scheduler import WorkUnit, build_work_units
+
+
+class OrderedCase(unittest.TestCase):
+
+    def test_01_first(self):
+        pass
+
+    def test_02_second(self):
+        pass
+
+
+class UnorderedCase(unittest.TestCase):
+
+    def test_a(self):
+        pass
+
+    def test_b(self):
+        pass
+
+
+class FlaggedCase(unittest.TestCase):
+    ORDERED_TESTS = False
+
+    def test_01_first(self):
+        pass
+
+    def test_02_second(self):
+        pass
+
+
+def suite_of(*tests):
+    return unittest.TestSuite([unittest.TestSuite([test]) for test in tests])
+
+
+class TestBuildWorkUnits(unittest.TestCase):
+
+    def test_ordered_class_is_one_unit(self):
+        units = build_work_units(suite_of(OrderedCase("test_01_first"), OrderedCase("test_02_second")))
+        self.assertEqual(units, [WorkUnit(__name__, "OrderedCase", ["test_01_first", "test_02_second"])])
+
+    def test_unordered_class_is_split_per_method(self):
+        units = build_work_units(suite_of(UnorderedCase("test_a"), UnorderedCase("test_b")))
+        self.assertEqual(
+            units, [WorkUnit(__name__, "UnorderedCase", ["test_a"]),
+                    WorkUnit(__name__, "UnorderedCase", ["test_b"])]
+        )
+
+    def test_ordered_tests_flag_overrides_prefix(self):
+        units = build_work_units(suite_of(FlaggedCase("test_01_first"), FlaggedCase("test_02_second")))
+        self.assertEqual([unit.methods for unit in units], [["test_01_first"], ["test_02_second"]])
+
+    def test_units_keep_suite_order_across_classes(self):
+        units = build_work_units(
+            suite_of(UnorderedCase("test_b"), OrderedCase("test_01_first"), OrderedCase("test_02_second"))
+        )
+        self.assertEqual([unit.class_name for unit in units], ["UnorderedCase", "OrderedCase"])
+
+    def test_empty_suite(self):
+        self.assertEqual(build_work_units(unittest.TestSuite()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
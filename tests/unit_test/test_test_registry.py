@@ -0,0 +1,77 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from utils.test_registry import TestRegistry, shard
+
+SOURCE = '''
+from tests.authentication_test.base_test import BaseTest
+
+
+class TestOrdered(BaseTest):
+
+    def test_01_first(self):
+        pass
+
+    def test_02_second(self):
+        pass
+
+
+class TestLoose(BaseTest):
+    ORDERED_TESTS = False
+
+    def test_a(self):
+        pass
+
+    def test_b(self):
+        pass
+
+    def test_c(self):
+        pass
+'''
+
+
+class TestShard(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        with open(os.path.join(self.root, "test_sample.py"), "w", encoding="utf-8") as f:
+            f.write(SOURCE)
+        self.registry = TestRegistry(self.root)
+        self.selections = self.registry.select()
+
+    def methods(self, selections):
+        return {(selection.class_name, method) for selection in selections for method in selection.methods}
+
+    def test_single_shard_is_everything(self):
+        self.assertEqual(shard(self.registry, self.selections, 1, 1), self.selections)
+
+    def test_shards_cover_every_method_once(self):
+        shards = [shard(self.registry, self.selections, index, 3) for index in (1, 2, 3)]
+        covered = [method for selections in shards for method in self.methods(selections)]
+        self.assertEqual(len(covered), len(set(covered)))
+        self.assertEqual(set(covered), self.methods(self.selections))
+
+    def test_ordered_class_stays_whole(self):
+        for index in (1, 2, 3):
+            for selection in shard(self.registry, self.selections, index, 3):
+                if selection.class_name == "TestOrdered":
+                    self.assertEqual(selection.methods, ["test_01_first", "test_02_second"])
+
+    def test_shards_are_deterministic(self):
+        self.assertEqual(
+            shard(self.registry, self.selections, 2, 3), shard(TestRegistry(self.root), self.selections, 2, 3)
+        )
+
+
+class TestDiscovery(unittest.TestCase):
+
+    def test_unit_tests_are_not_registered(self):
+        modules = {entry.module for entry in TestRegistry().entries.values()}
+        self.assertFalse([module for module in modules if module.startswith("tests.unit_test.")])
+
+
+if __name__ == "__main__":
+    unittest.main()
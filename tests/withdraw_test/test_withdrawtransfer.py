@@ -22,13 +22,12 @@ class TestWithdrawTransfer(BaseTest):
 
     def setUp(self):
         super().setUp()
-        self.navigate_to_login_page()
-        self.perform_login(CREDENTIALS["duplicated_user"]["username"], CREDENTIALS["duplicated_user"]["password"])
+        self.login_as(CREDENTIALS["duplicated_user"]["username"], CREDENTIALS["duplicated_user"]["password"])
         self.navigate_to_bank_transfer()
 
     def tearDown(self):
         if hasattr(self, "driver"):
-            self.driver.quit()
+            self.release_browser()
 
     def navigate_to_bank_transfer(self):
         self.navigate_to_reload_page("withdraw")
@@ -67,8 +66,7 @@ class TestWithdrawTransfer(BaseTest):
                 self.fail("Approve deposit failed")
 
     def switchToCompleteTurnoverAcc(self):
-        self.logout()
-        self.perform_login(CREDENTIALS["complete_turnover"]["username"], CREDENTIALS["complete_turnover"]["password"])
+        self.switchAccount(CREDENTIALS["complete_turnover"]["username"], CREDENTIALS["complete_turnover"]["password"])
         self.navigate_to_bank_transfer()
 
     def getWithdrawableAmount(self):
@@ -0,0 +1,233 @@
+import argparse
+import logging
+import os
+import secrets
+import sqlite3
+import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from config.constant import ACCOUNT_POOL
+
+FRESH = "fresh"
+FUNDED = "funded"
+TURNOVER_COMPLETE = "turnover_complete"
+RESERVED = "reserved"
+CHECKED_OUT = "checked_out"
+USERNAME_PREFIX = "Test"
+USERNAME_LENGTH = 12
+# the password is the username and the backend rejects passwords without a number,
+# so every username ends in this many digits
+USERNAME_DIGITS = 3
+
+logger = logging.getLogger("AccountPool")
+
+
+def vip_state(level):
+    return f"vip_{level}"
+
+
+class AccountPool:
+    """
+    SQLite ledger of pre-registered test accounts, tagged by state.
+
+    Usernames are reserved in the ledger before they are registered, so two
+    workers (or two provisioning threads) can never hand the same name to
+    /api/v3/register. Checked-out accounts are never handed out again.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or ACCOUNT_POOL["path"]
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS accounts (
+                    username TEXT PRIMARY KEY,
+                    password TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    checked_out_by TEXT
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS accounts_state ON accounts (state, created_at)")
+
+    def _connect(self):
+        # one short-lived connection per call keeps the pool safe across threads and processes
+        return sqlite3.connect(self.path, timeout=30)
+
+    def reserve(self):
+        letter_count = USERNAME_LENGTH - len(USERNAME_PREFIX) - USERNAME_DIGITS
+        while True:
+            letters = "".join(secrets.choice(string.ascii_letters) for _ in range(letter_count))
+            digits = "".join(secrets.choice(string.digits) for _ in range(USERNAME_DIGITS))
+            username = f"{USERNAME_PREFIX}{letters}{digits}"
+            now = time.time()
+            try:
+                with self._connect() as conn:
+                    conn.execute(
+                        "INSERT INTO accounts VALUES (?, ?, ?, ?, ?, NULL)", (username, username, RESERVED, now, now)
+                    )
+                return username, username
+            except sqlite3.IntegrityError:
+                continue
+
+    def mark(self, username, state):
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE accounts SET state = ?, updated_at = ? WHERE username = ?", (state, time.time(), username)
+            )
+
+    def discard(self, username):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM accounts WHERE username = ?", (username, ))
+
+    def checkout(self, state=FRESH, owner=None):
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT username, password FROM accounts WHERE state = ? ORDER BY created_at LIMIT 1", (state, )
+            ).fetchone()
+            if row:
+                conn.execute(
+                    "UPDATE accounts SET state = ?, updated_at = ?, checked_out_by = ? WHERE username = ?",
+                    (CHECKED_OUT, time.time(), owner or str(os.getpid()), row[0])
+                )
+            conn.commit()
+            return row
+        finally:
+            conn.close()
+
+    def counts(self):
+        with self._connect() as conn:
+            return dict(conn.execute("SELECT state, COUNT(*) FROM accounts GROUP BY state").fetchall())
+
+
+class AccountProvisioner:
+    """
+    Registers and prepares accounts into the pool.
+
+    ``helper_factory`` returns a fresh TestInit-style object per account, since
+    helpers like get_user_id read the username/password from the instance.
+    """
+
+    def __init__(self, pool, helper_factory, workers=None):
+        self.pool = pool
+        self.helper_factory = helper_factory
+        self.workers = workers or ACCOUNT_POOL["refill_workers"]
+        self._stop = threading.Event()
+        self._thread = None
+
+    def provision(self, state=FRESH):
+        username, password = self.pool.reserve()
+        helper = self.helper_factory()
+        helper.username, helper.password = username, password
+        try:
+            if not helper.register_account(username, password):
+                raise RuntimeError("registration failed")
+
+            if state != FRESH:
+                self.fund(helper, state)
+
+            self.pool.mark(username, state)
+            logger.info(f"Provisioned {username} as {state}")
+            return username
+        except Exception as e:
+            logger.error(f"Could not provision {state} account {username}: {str(e)}")
+            self.pool.discard(username)
+            return None
+
+    def fund(self, helper, state):
+        amount = ACCOUNT_POOL["deposit_amount"]
+        if state.startswith("vip_"):
+            levels = sorted(helper.get_vip_levels("en"), key=lambda level: float(level["recharge"]))
+            amount = max(amount, float(levels[int(state.split("_")[1])]["recharge"]))
+
+        if not helper.submit_deposit_api(amount=amount, username=helper.username, password=helper.password):
+            raise RuntimeError("deposit failed")
+        user_id = helper.get_user_id()
+        helper.handleDeposit(user_id)
+
+        if state == TURNOVER_COMPLETE:
+            turnover_ids = helper.get_turnover_ids(user_id, "en")
+            if turnover_ids and not helper.modify_turnover_status(user_id, turnover_ids, "success"):
+                raise RuntimeError("could not complete turnover")
+
+    def fill(self, targets):
+        """Top each state up to its target count; returns the number of accounts added."""
+        counts = self.pool.counts()
+        jobs = [state for state, target in targets.items() for _ in range(max(0, target - counts.get(state, 0)))]
+        if not jobs:
+            return 0
+
+        logger.info(f"Provisioning {len(jobs)} accounts with {self.workers} workers")
+        added = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(self.provision, state) for state in jobs]
+            for future in as_completed(futures):
+                if future.result():
+                    added += 1
+        return added
+
+    def start_refill(self, targets=None, interval=None):
+        targets = targets or ACCOUNT_POOL["targets"]
+        interval = interval or ACCOUNT_POOL["refill_interval"]
+
+        def refill_loop():
+            while not self._stop.is_set():
+                try:
+                    self.fill(targets)
+                except Exception as e:
+                    logger.error(f"Account refill failed: {str(e)}")
+                self._stop.wait(interval)
+
+        self._thread = threading.Thread(target=refill_loop, name="account-refill", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop_refill(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+
+_pool = None
+
+
+def get_account_pool():
+    global _pool
+    if _pool is None:
+        _pool = AccountPool()
+    return _pool
+
+
+def default_helper_factory():
+    from tests.test_init import TestInit
+    return lambda: TestInit(methodName="runTest", language="en", browser="chrome")
+
+
+def parse_targets(values):
+    targets = dict(ACCOUNT_POOL["targets"])
+    for value in values or []:
+        state, count = value.split("=")
+        targets[state] = int(count)
+    return targets
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-register test accounts into the account pool")
+    parser.add_argument(
+        "--target", action="append", metavar="STATE=COUNT",
+        help="e.g. fresh=20, funded=5, turnover_complete=5, vip_2=3 (defaults come from ACCOUNT_POOL)"
+    )
+    parser.add_argument("--workers", type=int, default=ACCOUNT_POOL["refill_workers"])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    pool = get_account_pool()
+    provisioner = AccountProvisioner(pool, default_helper_factory(), workers=args.workers)
+    provisioner.fill(parse_targets(args.target))
+    logger.info(f"Pool now holds: {pool.counts()}")
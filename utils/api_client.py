@@ -0,0 +1,142 @@
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import PoolManager
+from urllib3.util import Retry
+
+from config.constant import CREDENTIALS, USE_MOCK_BACKOFFICE
+from utils.mock_backoffice import ensure_mock_backoffice
+
+TOKEN_TTL = 30 * 60
+DEFAULT_TIMEOUT = 60
+
+retry_strategy = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+
+
+class CustomAdapter(HTTPAdapter):
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False) -> None:
+        self.poolmanager = PoolManager(num_pools=connections, maxsize=maxsize, block=block, retries=self.max_retries)
+
+    def _get_pool_manager_kwargs(self) -> Dict[str, Any]:
+        return {
+            'num_pools': self._pool_connections,
+            'maxsize': self._pool_maxsize,
+            'block': self._pool_block,
+            'retries': self.max_retries
+        }
+
+
+class BackendClient:
+    """
+    Keep-alive HTTP client for the back office API.
+
+    One pooled session per process, plus a per-username token cache so helpers
+    stop paying a TLS handshake and a /api/v2/login round trip on every call.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, pool_size: int = 25, token_ttl: int = TOKEN_TTL) -> None:
+        self.base_url = base_url or CREDENTIALS["BO_base_url"]
+        self.token_ttl = token_ttl
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.session = requests.Session()
+        adapter = CustomAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry_strategy)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._tokens: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self.login_count = 0
+
+    def get_token(self, username: str, password: str, force: bool = False) -> Optional[str]:
+        with self._lock:
+            cached = self._tokens.get(username)
+            if cached and not force and cached[1] > time.monotonic():
+                return cached[0]
+
+        response = self.session.post(
+            f"{self.base_url}/api/v2/login", json={
+                "username": username,
+                "password": password
+            }, timeout=DEFAULT_TIMEOUT
+        )
+        response.raise_for_status()
+        data = response.json()
+        self.login_count += 1
+
+        if data.get("code") != 200:
+            self.logger.error(f"Login failed for {username}: {data.get('message')}")
+            return None
+
+        token = data["data"]["token"]
+        with self._lock:
+            self._tokens[username] = (token, time.monotonic() + self.token_ttl)
+        return token
+
+    def invalidate(self, username: Optional[str] = None) -> None:
+        with self._lock:
+            if username is None:
+                self._tokens.clear()
+            else:
+                self._tokens.pop(username, None)
+
+    def auth_headers(self, username: str, password: str, **extra: str) -> Dict[str, str]:
+        token = self.get_token(username, password)
+        if not token:
+            raise RuntimeError(f"Login failed for {username}")
+        headers = {"Authorization": f"Bearer {token}"}
+        headers.update(extra)
+        return headers
+
+    def request(
+        self, method: str, url: str, credentials: Optional[Tuple[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Send a request through the pooled session.
+
+        When ``credentials`` is given the cached bearer token is attached, and a
+        401 drops the cached token and retries once with a fresh login.
+        """
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        request_headers = dict(headers or {})
+        if credentials:
+            request_headers.update(self.auth_headers(*credentials))
+
+        response = self.session.request(method, url, headers=request_headers, **kwargs)
+
+        if credentials and response.status_code == 401:
+            username, password = credentials
+            self.logger.info(f"Token for {username} rejected, logging in again")
+            self.invalidate(username)
+            request_headers.update(self.auth_headers(username, password))
+            response = self.session.request(method, url, headers=request_headers, **kwargs)
+
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+
+_client: Optional[BackendClient] = None
+_client_pid: Optional[int] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> BackendClient:
+    """Return the process-wide client, rebuilding it after a fork so sockets are never shared."""
+    global _client, _client_pid
+    with _client_lock:
+        if _client is None or _client_pid != os.getpid():
+            if USE_MOCK_BACKOFFICE:
+                ensure_mock_backoffice()
+            _client = BackendClient()
+            _client_pid = os.getpid()
+        return _client
@@ -0,0 +1,71 @@
+# Collects everything the helpers need from a set of elements in a single
+# execute_script call instead of one WebDriver round trip per find_element/.text.
+SNAPSHOT_SCRIPT = """
+const [selectors, elements, children, attributes, childLists] = arguments;
+
+function visible(el) {
+    if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) return false;
+    const style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+}
+
+function describe(el) {
+    const item = {
+        element: el,
+        id: el.id || null,
+        tag: el.tagName.toLowerCase(),
+        text: (el.innerText || el.textContent || '').trim(),
+        classes: Array.from(el.classList),
+        visible: visible(el),
+        attributes: {},
+        children: {},
+        lists: {}
+    };
+    for (const name of attributes) item.attributes[name] = el.getAttribute(name);
+    for (const [name, selector] of Object.entries(children)) {
+        const child = el.querySelector(selector);
+        item.children[name] = child ? (child.innerText || child.textContent || '').trim() : null;
+    }
+    for (const [name, selector] of Object.entries(childLists)) {
+        item.lists[name] = Array.from(el.querySelectorAll(selector)).map(
+            child => (child.innerText || child.textContent || '').trim()
+        );
+    }
+    return item;
+}
+
+if (elements) return elements.map(describe);
+const result = {};
+for (const [name, selector] of Object.entries(selectors)) {
+    result[name] = Array.from(document.querySelectorAll(selector)).map(describe);
+}
+return result;
+"""
+
+
+def snapshot(driver, selector=None, children=None, attributes=None, elements=None, lists=None):
+    """
+    Describe every element matching ``selector`` (or the given WebElements) in one script call.
+
+    Each item is a dict with ``element`` (the WebElement, for clicking), ``id``,
+    ``tag``, ``text``, ``classes``, ``visible``, ``attributes`` (the requested
+    names), ``children``: for each name -> CSS selector in ``children``, the
+    text of the first matching descendant, or None when there is none, and
+    ``lists``: for each name -> CSS selector in ``lists``, the texts of every
+    matching descendant (e.g. all cells of a table row).
+
+    ``selector`` may also be a dict of name -> CSS selector, in which case a dict
+    of lists comes back, still from a single call.
+    """
+    children = children or {}
+    attributes = list(attributes or [])
+    lists = lists or {}
+    if elements is not None:
+        if not elements:
+            return []
+        return driver.execute_script(SNAPSHOT_SCRIPT, None, list(elements), children, attributes, lists)
+
+    selectors = selector if isinstance(selector, dict) else {"items": selector}
+    result = driver.execute_script(SNAPSHOT_SCRIPT, selectors, None, children, attributes, lists)
+    return result if isinstance(selector, dict) else result["items"]
+
@@ -0,0 +1,96 @@
+import atexit
+import logging
+import os
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger("DriverPool")
+
+
+class DriverPool:
+    """
+    Keeps one idle WebDriver session per browser in this process.
+
+    Tests acquire a session in setUp and release it in tearDown instead of
+    launching and quitting a browser every time. Before a session is handed out
+    again it is health-checked and its cookies, localStorage and sessionStorage
+    are cleared; a session that fails either step is quit and relaunched.
+    """
+
+    def __init__(self):
+        self._idle = {}
+        self.launched = 0
+        self.reused = 0
+
+    def acquire(self, browser, factory, home_url):
+        driver = self._idle.pop(browser, None)
+
+        if driver is not None:
+            try:
+                if not self.is_healthy(driver):
+                    raise WebDriverException("health check failed")
+                self.reset(driver, home_url)
+                self.reused += 1
+                return driver
+            except WebDriverException as e:
+                logger.warning(f"Discarding {browser} session and relaunching: {str(e)}")
+                self.quit(driver)
+
+        driver = factory(browser)
+        self.launched += 1
+        return driver
+
+    def release(self, browser, driver):
+        if browser in self._idle or not self.is_healthy(driver):
+            self.quit(driver)
+            return
+        self._idle[browser] = driver
+
+    def is_healthy(self, driver):
+        try:
+            driver.execute_script("return document.readyState")
+            return bool(driver.window_handles)
+        except WebDriverException:
+            return False
+
+    def reset(self, driver, home_url):
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        home = urlparse(home_url)
+        current = urlparse(driver.current_url)
+        if (current.scheme, current.netloc) != (home.scheme, home.netloc):
+            driver.get(home_url)
+
+        driver.delete_all_cookies()
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+
+    def quit(self, driver):
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logger.warning(f"Error quitting browser: {str(e)}")
+
+    def shutdown(self):
+        while self._idle:
+            _, driver = self._idle.popitem()
+            self.quit(driver)
+        if self.launched or self.reused:
+            logger.info(f"Browser sessions launched: {self.launched}, reused: {self.reused}")
+
+
+_pool = None
+_pool_pid = None
+
+
+def get_driver_pool():
+    global _pool, _pool_pid
+    if _pool is None or _pool_pid != os.getpid():
+        _pool = DriverPool()
+        _pool_pid = os.getpid()
+        atexit.register(_pool.shutdown)
+    return _pool
@@ -0,0 +1,60 @@
+import glob
+import heapq
+import logging
+import os
+import statistics
+
+from config.constant import DURATION_HISTORY
+from utils.results_store import RUNS_DIR, load_run
+
+logger = logging.getLogger("Durations")
+
+
+class DurationModel:
+    """
+    Expected wall time per test, learned from the last few stored runs.
+
+    Keyed by (class, method, language, browser) and using the median, so one
+    slow outlier doesn't reorder the suite. Tests with no exact history fall
+    back to the same method in any language/browser, then to the class median,
+    then to the median of everything, then to ``DURATION_HISTORY["default"]``.
+    """
+
+    def __init__(self, records=()):
+        samples = {}
+        for record in records:
+            if record.get("duration") is None or record.get("status") == "SKIP":
+                continue
+            duration = float(record["duration"])
+            cls, method = record["class"], record["method"]
+            for key in ((cls, method, record.get("language"), record.get("browser")), (cls, method), (cls, )):
+                samples.setdefault(key, []).append(duration)
+            samples.setdefault((), []).append(duration)
+        self.estimates = {key: statistics.median(values) for key, values in samples.items()}
+
+    @classmethod
+    def load(cls, runs=None, directory=RUNS_DIR):
+        runs = runs or DURATION_HISTORY["runs"]
+        run_dirs = sorted(glob.glob(os.path.join(directory, "*")), key=os.path.getmtime)[-runs:]
+        records = []
+        for run_dir in run_dirs:
+            records.extend(load_run(os.path.basename(run_dir), directory))
+        logger.info(f"Duration model built from {len(records)} results over {len(run_dirs)} runs")
+        return cls(records)
+
+    def estimate(self, class_name, method, language=None, browser=None):
+        for key in ((class_name, method, language, browser), (class_name, method), (class_name, ), ()):
+            if key in self.estimates:
+                return self.estimates[key]
+        return float(DURATION_HISTORY["default"])
+
+    def estimate_unit(self, unit, language=None, browser=None):
+        return sum(self.estimate(unit.class_name, method, language, browser) for method in unit.methods)
+
+
+def predict_makespan(durations, workers):
+    """Finish time of greedy list scheduling: each job, in order, goes to the worker that frees up first."""
+    finish_times = [0.0] * max(1, workers)
+    for duration in durations:
+        heapq.heapreplace(finish_times, finish_times[0] + duration)
+    return max(finish_times)
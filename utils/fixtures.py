@@ -0,0 +1,178 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config.constant import FIXTURES
+
+logger = logging.getLogger("Fixtures")
+
+
+class UserState:
+    """
+    Declarative description of the account a test needs, e.g.
+    ``UserState(vip=3, locked_promos=2, fourd_cards=5, balance=500)``.
+
+    ``vip`` is the ``id`` of a level in ``/api/uservip`` (0 leaves the account
+    at whatever level a fresh one starts on). ``shared`` states are cached per
+    process and handed to every test asking for an equal state, so only use it
+    for tests that don't change the account.
+    """
+
+    def __init__(self, vip=0, locked_promos=0, extra_deposits=0, fourd_cards=0, balance=0, shared=False):
+        self.vip = vip
+        self.locked_promos = locked_promos
+        self.extra_deposits = extra_deposits
+        self.fourd_cards = fourd_cards
+        self.balance = balance
+        self.shared = shared
+
+    def key(self):
+        return (self.vip, self.locked_promos, self.extra_deposits, self.fourd_cards, self.balance)
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{name}={value}" for name, value in zip(
+                ("vip", "locked_promos", "extra_deposits", "fourd_cards", "balance"), self.key()
+            ) if value
+        )
+        return f"UserState({fields or 'fresh'})"
+
+
+class ResolvedUser:
+
+    def __init__(self, username, password, user_id, deposits):
+        self.username = username
+        self.password = password
+        self.user_id = user_id
+        # (amount, promo code or None) of every deposit made while building the state
+        self.deposits = deposits
+
+    @property
+    def credentials(self):
+        return self.username, self.password
+
+
+class FixtureResolver:
+    """
+    Builds UserStates from the API helpers on TestInit.
+
+    The deposit chain (promo deposits, extra deposits, top-up to the balance or
+    VIP recharge target, one approval) and the 4D card grant don't depend on
+    each other and run in parallel; ``resolve_many`` also builds several users
+    at once, and ``apply`` builds a state on an account a test already has.
+    """
+
+    def __init__(self, helper_factory, workers=None):
+        self.helper_factory = helper_factory
+        self.workers = workers or FIXTURES["workers"]
+        self._cache = {}
+        self._lock = threading.Lock()
+        self._building = {}
+
+    def resolve(self, state):
+        if not state.shared:
+            return self.build(state)
+
+        with self._lock:
+            if state.key() in self._cache:
+                logger.info(f"Reusing cached {state}")
+                return self._cache[state.key()]
+            # a second thread asking for the same state waits for the first build
+            event = self._building.get(state.key())
+            if event is None:
+                self._building[state.key()] = threading.Event()
+
+        if event is not None:
+            event.wait()
+            return self.resolve(state)
+
+        try:
+            user = self.build(state)
+            with self._lock:
+                self._cache[state.key()] = user
+            return user
+        finally:
+            with self._lock:
+                self._building.pop(state.key()).set()
+
+    def resolve_many(self, states):
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(states)))) as executor:
+            return list(executor.map(self.resolve, states))
+
+    def build(self, state):
+        helper = self.helper_factory()
+        username, password = helper.register_new_account()
+        if not username:
+            raise RuntimeError(f"Could not get an account for {state}")
+        helper.username, helper.password = username, password
+        user_id = helper.get_user_id()
+        logger.info(f"Building {state} on {username}")
+        user = self.apply(ResolvedUser(username, password, user_id, []), state, helper)
+        logger.info(f"{state} ready on {username}")
+        return user
+
+    def apply(self, user, state, helper=None):
+        """
+        ``user`` with ``state``'s deposits and 4D cards added to the account; the
+        balance and VIP targets are counted from these deposits only.
+        """
+        if helper is None:
+            helper = self.helper_factory()
+            helper.username, helper.password = user.credentials
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            deposits = executor.submit(self.fund, helper, user.user_id, state)
+            cards = executor.submit(
+                helper.add_4d_cards_api, user.user_id, state.fourd_cards
+            ) if state.fourd_cards else None
+            resolved = ResolvedUser(user.username, user.password, user.user_id, user.deposits + deposits.result())
+            if cards:
+                cards.result()
+        return resolved
+
+    def deposit(self, helper, amount=None, promo_code=None):
+        result = helper.submit_deposit_api(
+            amount=amount, promoCode=promo_code, username=helper.username, password=helper.password,
+            check_history_amount=True
+        )
+        if not result:
+            raise RuntimeError(f"Deposit of {amount} (promo {promo_code}) failed for {helper.username}")
+        return result[1], promo_code
+
+    def fund(self, helper, user_id, state):
+        deposits = []
+        promo_codes = FIXTURES["promo_codes"]
+        for index in range(state.locked_promos):
+            deposits.append(self.deposit(helper, promo_code=promo_codes[index % len(promo_codes)]))
+        for _ in range(state.extra_deposits):
+            deposits.append(self.deposit(helper))
+
+        target = state.balance
+        if state.vip:
+            # looked up by id: the list is not guaranteed to start at a level 0 or to be in order
+            level = next((level for level in helper.get_vip_levels(helper.language) if level["id"] == state.vip), None)
+            if level is None:
+                raise ValueError(f"No VIP level with id {state.vip}")
+            target = max(target, float(level["recharge"]))
+
+        remaining = target - sum(float(amount) for amount, _ in deposits)
+        while remaining > 0:
+            amount = min(FIXTURES["max_deposit"], int(-(-remaining // 1)))
+            deposits.append(self.deposit(helper, amount=amount))
+            remaining -= amount
+
+        if deposits:
+            # approves every pending deposit of the user in one call
+            helper.handleDeposit(user_id)
+        return deposits
+
+
+_resolver = None
+
+
+def get_fixture_resolver():
+    global _resolver
+    if _resolver is None:
+        from utils.account_pool import default_helper_factory
+        _resolver = FixtureResolver(default_helper_factory())
+    return _resolver
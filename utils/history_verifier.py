@@ -0,0 +1,199 @@
+import logging
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+from config.constant import CREDENTIALS, HISTORY_VERIFIER
+
+logger = logging.getLogger("HistoryVerifier")
+
+KEY_FIELDS = ("timestamp", "amount", "type", "wallet")
+
+# history table column of each field, per record type, as the row checks in test_history read them;
+# fields a table doesn't show are left out of the key. Other record types are not reconciled.
+UI_COLUMNS = {
+    "deposit": {"timestamp": 0, "amount": 1, "status": 3},
+    "withdraw": {"timestamp": 0, "amount": 1, "status": 3},
+    "transfer": {"timestamp": 0, "type": 1, "wallet": 2, "amount": 3, "status": 4},
+}
+
+# first API field present wins
+API_FIELDS = {
+    "timestamp": ("created_at", "date", "time"),
+    "amount": ("amount", "win_loss", "bonus_amount"),
+    "type": ("from", "type", "transfer_type"),
+    "wallet": ("to", "wallet", "game_name", "provider_name"),
+    "status": ("status", ),
+}
+
+TIMESTAMP_FORMATS = ("%d/%m/%Y %I:%M %p", "%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M")
+
+
+def normalise_timestamp(value):
+    """Minute precision, local time: the UI never shows seconds."""
+    if value is None:
+        return None
+    text = " ".join(str(value).split())
+    parsed = None
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        for fmt in TIMESTAMP_FORMATS:
+            try:
+                parsed = datetime.strptime(text, fmt)
+                break
+            except ValueError:
+                continue
+    if parsed is None:
+        return text
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed.strftime("%Y-%m-%d %H:%M")
+
+
+def normalise_amount(value):
+    """Absolute amount to two decimals; the sign is direction, not identity."""
+    if value is None:
+        return None
+    text = re.sub(r"[^0-9.\-]", "", str(value).replace("−", "-").replace(",", ""))
+    try:
+        return abs(Decimal(text)).quantize(Decimal("0.01"))
+    except InvalidOperation:
+        return None
+
+
+def normalise_text(value):
+    # the UI shows "Mega888 Wallet" where the API says "mega888", as verify_transfer_row assumes
+    words = str(value or "").lower().split()
+    return words[0] if words else ""
+
+
+NORMALISERS = {
+    "timestamp": normalise_timestamp,
+    "amount": normalise_amount,
+    "type": normalise_text,
+    "wallet": normalise_text,
+    "status": lambda value: str(value or "").strip().lower(),
+}
+
+
+def api_value(record, field):
+    for name in API_FIELDS[field]:
+        if record.get(name) is not None:
+            return record[name]
+    return None
+
+
+def record_key(values, columns):
+    return tuple(NORMALISERS[field](values.get(field)) for field in KEY_FIELDS if field in columns)
+
+
+class HistoryReport:
+
+    def __init__(self, record_type, api_count, ui_count):
+        self.record_type = record_type
+        self.api_count = api_count
+        self.ui_count = ui_count
+        self.missing = []
+        self.extra = []
+        self.mismatched = []
+
+    @property
+    def ok(self):
+        return not (self.missing or self.extra or self.mismatched)
+
+    def summary(self):
+        lines = [
+            f"{self.record_type}: {self.api_count} API records, {self.ui_count} UI rows, "
+            f"{len(self.missing)} missing, {len(self.extra)} extra, {len(self.mismatched)} mismatched"
+        ]
+        lines += [f"  missing from UI: {key}" for key in self.missing]
+        lines += [f"  not in API: {key}" for key in self.extra]
+        lines += [f"  {key}: API status {api!r}, UI shows {ui!r}" for key, api, ui in self.mismatched]
+        return "\n".join(lines)
+
+
+class HistoryVerifier:
+    """
+    Reconciles the transaction history table against filter-records-by-date.
+
+    All API pages are fetched concurrently, then both sides are keyed by a
+    normalised (timestamp, amount, type, wallet) tuple and matched with dict
+    lookups instead of asserting row by row.
+    """
+
+    def __init__(self, api, credentials, language, workers=None):
+        self.api = api
+        self.credentials = credentials
+        self.headers = {"Accept": "application/json", "language": language}
+        self.workers = workers or HISTORY_VERIFIER["fetch_workers"]
+
+    def history_url(self, record_type_value, page, date_option_id=None, start_date=None, end_date=None):
+        if start_date and end_date:
+            return CREDENTIALS["SpecifyDateHistory"].format(
+                BO_base_url=CREDENTIALS["BO_base_url"], record_type_value=record_type_value, start_date=start_date,
+                end_date=end_date, page=page
+            )
+        return CREDENTIALS["DateHistory"].format(
+            BO_base_url=CREDENTIALS["BO_base_url"], record_type_value=record_type_value,
+            date_option_id=date_option_id, page=page
+        )
+
+    def fetch_page(self, url):
+        response = self.api.get(url, credentials=self.credentials, headers=self.headers)
+        response.raise_for_status()
+        return response.json().get("data", {})
+
+    def fetch_records(self, record_type_value, date_option_id=None, start_date=None, end_date=None):
+        filters = {"date_option_id": date_option_id, "start_date": start_date, "end_date": end_date}
+        first = self.fetch_page(self.history_url(record_type_value, 1, **filters))
+        records = list(first.get("data", []))
+
+        last_page = first.get("last_page")
+        if last_page is None and first.get("per_page"):
+            last_page = -(-int(first.get("total", 0)) // int(first["per_page"]))
+        last_page = int(last_page or 1)
+
+        if last_page > 1:
+            urls = [self.history_url(record_type_value, page, **filters) for page in range(2, last_page + 1)]
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(urls))) as executor:
+                # map keeps page order, so records stay newest first like the table
+                for page in executor.map(self.fetch_page, urls):
+                    records.extend(page.get("data", []))
+
+        logger.info(f"Fetched {len(records)} {record_type_value} records over {last_page} pages")
+        return records
+
+    def reconcile(self, record_type_value, api_records, ui_rows):
+        if record_type_value not in UI_COLUMNS:
+            raise ValueError(f"No history table layout for {record_type_value} records")
+        columns = UI_COLUMNS[record_type_value]
+        width = max(columns.values()) + 1
+        # the "no record" placeholder is a single spanning cell
+        ui_rows = [row for row in ui_rows if len(row) >= width]
+        report = HistoryReport(record_type_value, len(api_records), len(ui_rows))
+
+        api_index = defaultdict(list)
+        for record in api_records:
+            values = {field: api_value(record, field) for field in columns}
+            api_index[record_key(values, columns)].append(NORMALISERS["status"](values.get("status")))
+
+        ui_index = defaultdict(list)
+        for row in ui_rows:
+            values = {field: row[column] for field, column in columns.items()}
+            ui_index[record_key(values, columns)].append(NORMALISERS["status"](values.get("status")))
+
+        for key in api_index.keys() | ui_index.keys():
+            api_statuses, ui_statuses = api_index.get(key, []), ui_index.get(key, [])
+            paired = min(len(api_statuses), len(ui_statuses))
+            if "status" in columns:
+                for api_status, ui_status in zip(api_statuses[:paired], ui_statuses[:paired]):
+                    # the table shows a translated label that contains the API status
+                    if api_status not in ui_status:
+                        report.mismatched.append((key, api_status, ui_status))
+            report.missing += [key] * (len(api_statuses) - paired)
+            report.extra += [key] * (len(ui_statuses) - paired)
+
+        return report
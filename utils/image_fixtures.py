@@ -0,0 +1,161 @@
+import hashlib
+import io
+import json
+import logging
+import os
+import random
+import tempfile
+import threading
+
+from PIL import Image, ImageDraw
+
+logger = logging.getLogger("ImageFixtures")
+
+FIXTURE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test_results", "image_fixtures"
+)
+
+# Everything is generated from a fixed seed, so every process and every machine
+# produces the same bytes and therefore the same content hash.
+IMAGE_SPECS = {
+    # deposit receipt attached to /api/recharge
+    "receipt": {"kind": "gradient", "format": "JPEG", "size": [200, 300], "seed": 1},
+    "profile": {"kind": "avatar", "format": "PNG", "size": [256, 256], "seed": 2},
+    "profile_replace": {"kind": "avatar", "format": "PNG", "size": [256, 256], "seed": 3},
+    # noise barely compresses, so this stays above the 5 MB profile picture limit
+    "large": {"kind": "noise", "format": "JPEG", "size": [3400, 2300], "seed": 4},
+    "invalid_format": {"kind": "text", "format": "TXT", "seed": 5},
+}
+
+EXTENSIONS = {"JPEG": ".jpg", "PNG": ".png", "TXT": ".txt"}
+MIME_TYPES = {"JPEG": "image/jpeg", "PNG": "image/png", "TXT": "text/plain"}
+
+
+def render(spec):
+    rng = random.Random(spec["seed"])
+    if spec["kind"] == "text":
+        return "This is a plain text file, not an image.\n".encode("utf-8")
+
+    width, height = spec["size"]
+    if spec["kind"] == "noise":
+        image = Image.frombytes("RGB", (width, height), rng.randbytes(width * height * 3))
+    else:
+        start, end = [tuple(rng.randrange(256) for _ in range(3)) for _ in range(2)]
+        image = Image.new("RGB", (width, height))
+        draw = ImageDraw.Draw(image)
+        for y in range(height):
+            colour = tuple(int(a + (b - a) * y / max(1, height - 1)) for a, b in zip(start, end))
+            draw.line([(0, y), (width, y)], fill=colour)
+        if spec["kind"] == "avatar":
+            margin = width // 4
+            draw.ellipse([margin, margin, width - margin, height - margin], fill=end[::-1])
+
+    buffer = io.BytesIO()
+    image.save(buffer, spec["format"], **({"quality": 90} if spec["format"] == "JPEG" else {}))
+    return buffer.getvalue()
+
+
+class ImageFixtureStore:
+    """
+    Upload fixtures generated locally with Pillow instead of downloaded per test.
+
+    Files are stored as ``<name>-<sha256>.<ext>`` and written through a temp
+    file plus rename, so concurrent workers asking for the same fixture end up
+    sharing one identical file. ``manifest.json`` maps each spec to its content
+    hash so later processes skip generating it again.
+    """
+
+    def __init__(self, directory=FIXTURE_DIR):
+        self.directory = directory
+        self._bytes = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def spec(name):
+        if name not in IMAGE_SPECS:
+            raise KeyError(f"Unknown image fixture: {name}")
+        return IMAGE_SPECS[name]
+
+    @staticmethod
+    def fingerprint(name):
+        return hashlib.sha256(json.dumps(IMAGE_SPECS[name], sort_keys=True).encode("utf-8")).hexdigest()
+
+    def filename(self, name, content_hash):
+        return f"{name}-{content_hash[:16]}{EXTENSIONS[self.spec(name)['format']]}"
+
+    def mime_type(self, name):
+        return MIME_TYPES[self.spec(name)["format"]]
+
+    def read_manifest(self):
+        try:
+            with open(os.path.join(self.directory, "manifest.json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def write_atomic(self, filename, data):
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, os.path.join(self.directory, filename))
+
+    def path(self, name):
+        """Path of the fixture file, generating it on first use."""
+        self.spec(name)
+        entry = self.read_manifest().get(name)
+        if entry and entry["spec"] == self.fingerprint(name):
+            path = os.path.join(self.directory, entry["file"])
+            if os.path.exists(path):
+                return path
+
+        data = self.bytes(name)
+        content_hash = hashlib.sha256(data).hexdigest()
+        filename = self.filename(name, content_hash)
+        path = os.path.join(self.directory, filename)
+        if not os.path.exists(path):
+            self.write_atomic(filename, data)
+            logger.info(f"Generated image fixture {filename} ({len(data)} bytes)")
+
+        # another process can overwrite this update; that only costs it a regeneration later
+        with self._lock:
+            manifest = self.read_manifest()
+            manifest[name] = {"spec": self.fingerprint(name), "hash": content_hash, "file": filename}
+            self.write_atomic("manifest.json", json.dumps(manifest, indent=2).encode("utf-8"))
+        return path
+
+    def bytes(self, name):
+        """Fixture content, kept in memory after the first call in this process."""
+        with self._lock:
+            if name in self._bytes:
+                return self._bytes[name]
+
+        entry = self.read_manifest().get(name)
+        data = None
+        if entry and entry["spec"] == self.fingerprint(name):
+            try:
+                with open(os.path.join(self.directory, entry["file"]), "rb") as f:
+                    data = f.read()
+            except OSError:
+                data = None
+        if data is None:
+            data = render(self.spec(name))
+
+        with self._lock:
+            self._bytes[name] = data
+        return data
+
+    def upload(self, name, filename=None):
+        """``(filename, bytes, mime type)`` tuple for a requests ``files=`` entry."""
+        data = self.bytes(name)
+        return filename or self.filename(name, hashlib.sha256(data).hexdigest()), data, self.mime_type(name)
+
+
+_store = None
+
+
+def get_image_store():
+    global _store
+    if _store is None:
+        _store = ImageFixtureStore()
+    return _store
@@ -0,0 +1,142 @@
+import json
+import logging
+
+from selenium.common.exceptions import WebDriverException
+
+from config.constant import LEAN_BROWSER
+from utils.waits import page_scripts
+
+logger = logging.getLogger("LeanBrowser")
+
+# MUI reads transition durations from computed style, so zeroing them makes dialogs,
+# drawers and backdrops open and close on the next frame instead of after 225-300ms
+LEAN_CSS = """
+*, *::before, *::after {
+    transition-duration: 0s !important;
+    transition-delay: 0s !important;
+    animation-duration: 0s !important;
+    animation-delay: 0s !important;
+    animation-iteration-count: 1 !important;
+    scroll-behavior: auto !important;
+    caret-color: transparent !important;
+}
+"""
+
+# Adds LEAN_CSS and blanks cross-origin iframes (chat widgets, embedded videos) before they load.
+# Safe to run more than once per page.
+LEAN_SCRIPT = """
+(function(css) {
+    if (window.__leanBrowser) { return; }
+    window.__leanBrowser = true;
+    function addStyle() {
+        if (document.getElementById('__lean-browser-style')) { return; }
+        var style = document.createElement('style');
+        style.id = '__lean-browser-style';
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    }
+    function blankFrame(frame) {
+        var src = frame.getAttribute('src');
+        if (!src || src === 'about:blank') { return; }
+        try {
+            if (new URL(src, location.href).origin === location.origin) { return; }
+        } catch (e) { return; }
+        frame.setAttribute('data-lean-src', src);
+        frame.setAttribute('src', 'about:blank');
+    }
+    addStyle();
+    document.querySelectorAll('iframe').forEach(blankFrame);
+    new MutationObserver(function(mutations) {
+        addStyle();
+        mutations.forEach(function(mutation) {
+            if (mutation.type === 'attributes') { blankFrame(mutation.target); return; }
+            mutation.addedNodes.forEach(function(node) {
+                if (node.tagName === 'IFRAME') { blankFrame(node); }
+                else if (node.querySelectorAll) { node.querySelectorAll('iframe').forEach(blankFrame); }
+            });
+        });
+    }).observe(document.documentElement, {
+        childList: true, subtree: true, attributes: true, attributeFilter: ['src']
+    });
+})(%s);
+"""
+
+
+def lean_script():
+    return LEAN_SCRIPT % json.dumps(LEAN_CSS)
+
+
+def lean_browser(enabled=True):
+    """
+    Turn lean mode on (or off) for a single test, overriding the class's ``LEAN_BROWSER``::
+
+        @lean_browser()
+        def test_01_Something(self): ...
+    """
+
+    def decorator(func):
+        func.lean_browser = enabled
+        return func
+
+    return decorator
+
+
+def chromium_options(options):
+    """Chrome/Edge: images and fonts off through content settings, smooth scrolling off."""
+    options.add_experimental_option(
+        "prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        }
+    )
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--disable-smooth-scrolling")
+    options.add_argument("--force-prefers-reduced-motion")
+    return options
+
+
+def firefox_options(options):
+    """Firefox: images and web fonts off, tracking protection for analytics, no UI animations."""
+    options.set_preference("permissions.default.image", 2)
+    options.set_preference("gfx.downloadable_fonts.enabled", False)
+    options.set_preference("browser.display.use_document_fonts", 0)
+    options.set_preference("privacy.trackingprotection.enabled", True)
+    options.set_preference("privacy.trackingprotection.socialtracking.enabled", True)
+    options.set_preference("ui.prefersReducedMotion", 1)
+    options.set_preference("toolkit.cosmeticAnimations.enabled", False)
+    options.set_preference("general.smoothScroll", False)
+    options.set_preference("media.autoplay.default", 5)
+    return options
+
+
+def blocked_urls():
+    return list(LEAN_BROWSER["block_urls"]) + [f"*{extension}" for extension in LEAN_BROWSER["block_extensions"]]
+
+
+def install(driver):
+    """
+    Apply lean mode to a live session.
+
+    Chromium gets request blocking through CDP and the CSS/iframe script
+    registered for every new document. Other browsers have no equivalent, so
+    the script is run on the current page and ``Waits.page_settled`` re-runs it
+    after navigation.
+    """
+    script = lean_script()
+    try:
+        if hasattr(driver, "execute_cdp_cmd"):
+            if not getattr(driver, "_lean_registered", False):
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls()})
+                driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": script})
+                driver._lean_registered = True
+        else:
+            page_scripts(driver)["lean"] = (script, )
+        driver.execute_script(script)
+    except WebDriverException as e:
+        logger.warning(f"Could not fully enable lean mode: {str(e)}")
+
+
+
+def animation_delay(seconds):
+    return seconds * LEAN_BROWSER["sleep_scale"]
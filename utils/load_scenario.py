@@ -0,0 +1,375 @@
+import csv
+import json
+import logging
+import math
+import os
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import requests
+
+from config.constant import CREDENTIALS, LOAD_SCENARIOS
+from utils.account_pool import CHECKED_OUT, get_account_pool
+from utils.api_client import CustomAdapter, DEFAULT_TIMEOUT, retry_strategy
+
+logger = logging.getLogger("LoadScenario")
+
+
+class StepFailed(Exception):
+    """Raised by a step when the back office answers but rejects the call."""
+
+    def __init__(self, kind: str, message: str = "") -> None:
+        super().__init__(message or kind)
+        self.kind = kind
+
+
+class Sample(NamedTuple):
+    step: str
+    started: float
+    latency: float
+    ok: bool
+    error: Optional[str]
+
+
+class VirtualUser:
+    """One simulated player with its own keep-alive session, reused for every step it runs."""
+
+    def __init__(self, user_id: int, base_url: str, image_bytes: Optional[bytes] = None) -> None:
+        self.user_id = user_id
+        self.base_url = base_url
+        self.image_bytes = image_bytes
+        self.username: Optional[str] = None
+        self.password: Optional[str] = None
+        self.backend_id: Optional[int] = None
+        self.session = requests.Session()
+        adapter = CustomAdapter(pool_connections=1, pool_maxsize=2, max_retries=retry_strategy)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Accept"] = "application/json"
+
+    def call(self, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        response = self.session.request(method, f"{self.base_url}{path}", **kwargs)
+        if response.status_code != 200:
+            raise StepFailed(f"HTTP {response.status_code}", response.text[:200])
+        data = response.json()
+        if isinstance(data, dict) and data.get("code") not in (None, 200):
+            raise StepFailed(f"code {data.get('code')}", str(data.get("message")))
+        return data
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def step_register(user: VirtualUser, **params: Any) -> None:
+    pool = get_account_pool()
+    user.username, user.password = pool.reserve()
+    try:
+        user.call(
+            "POST", "/api/v3/register", json={
+                "username": user.username,
+                "realname": user.username,
+                "password": user.password,
+                "password_confirmation": user.password,
+                "phone": f"601{random.randint(10000000, 99999999)}",
+            }
+        )
+    except Exception:
+        pool.discard(user.username)
+        raise
+    pool.mark(user.username, CHECKED_OUT)
+
+
+def step_login(user: VirtualUser, **params: Any) -> None:
+    data = user.call("POST", "/api/v2/login", json={"username": user.username, "password": user.password})
+    user.session.headers["Authorization"] = f"Bearer {data['data']['token']}"
+    user.backend_id = user.call("GET", "/api/user")["data"]["id"]
+
+
+def random_amount(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return random.randint(*value)
+    return value
+
+
+def step_deposit(user: VirtualUser, amount: Any = (30, 2000), promo: Optional[str] = None, **params: Any) -> None:
+    data = {
+        "paytype": "bank",
+        "transferType": "2",
+        "amount": random_amount(amount),
+        "bankId": 9,
+    }
+    if promo:
+        data["optionCode"] = promo
+    files = {
+        "attachment": ("receipt.jpg", user.image_bytes or b"", "image/jpeg")
+    }
+    user.call("POST", "/api/recharge", data=data, files=files)
+
+
+def step_approve_deposit(user: VirtualUser, **params: Any) -> None:
+    user.call("GET", CREDENTIALS["ApproveDepositRequest"].format(BO_base_url="", ID=user.backend_id))
+
+
+def step_transfer(user: VirtualUser, amount: Any = 1, target_id: Optional[int] = None, **params: Any) -> None:
+    if target_id is None:
+        accounts = user.call("GET", "/api/transfers")["data"].get("accountList", [])
+        games = [game["id"] for account in accounts for game in account.get("games", [])]
+        if not games:
+            raise StepFailed("no providers")
+        target_id = random.choice(games)
+    user.call("POST", "/api/transfers", json={"source_id": 0, "target_id": target_id, "amount": random_amount(amount)})
+
+
+def step_withdraw(user: VirtualUser, amount: Any = 50, bank: int = 524, **params: Any) -> None:
+    user.call("POST", "/api/withdraw", json={"amount": random_amount(amount), "bank": bank})
+
+
+def step_bet_4d(user: VirtualUser, amount: float = 1.0, platforms: str = "GD", **params: Any) -> None:
+    bet_time = datetime.now() - timedelta(days=random.randint(0, 4))
+    date_time_str = bet_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    date_only = date_time_str.split("T")[0]
+    number = str(random.randint(1000, 9999))
+    user.call(
+        "POST", CREDENTIALS["Bet4d"].format(BO_base_url=""), data={
+            "pass": "123456",
+            "user_id": user.backend_id,
+            "bet_number": number,
+            "bet_number_list": number,
+            "bet_dates": date_only,
+            "bet_platforms": platforms,
+            "source": "whitelabel",
+            "B": amount,
+            "type": "coupon",
+            "coupon_id": "2",
+            "user_bet_time": date_time_str,
+            "show_id": "-1",
+            "user_bet_date": date_only,
+        }
+    )
+
+
+def step_add_4d_cards(user: VirtualUser, amount: int = 25, **params: Any) -> None:
+    user.call(
+        "POST", CREDENTIALS["Add4dCards"].format(BO_base_url=""), json={
+            "user_id": str(user.backend_id),
+            "amount": str(amount),
+            "pass": "123456"
+        }
+    )
+
+
+STEPS: Dict[str, Callable[..., None]] = {
+    "register": step_register,
+    "login": step_login,
+    "deposit": step_deposit,
+    "approve_deposit": step_approve_deposit,
+    "transfer": step_transfer,
+    "withdraw": step_withdraw,
+    "add_4d_cards": step_add_4d_cards,
+    "bet_4d": step_bet_4d,
+}
+
+
+class RateLimiter:
+    """Spaces request starts evenly so all virtual users together stay under ``rps``."""
+
+    def __init__(self, rps: float) -> None:
+        self.interval = 1.0 / rps if rps else 0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next, now)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+class LoadReport:
+
+    def __init__(self, name: str, samples: List[Sample], wall_time: float) -> None:
+        self.name = name
+        self.samples = samples
+        self.wall_time = wall_time
+
+    def step_summary(self) -> Dict[str, Dict[str, Any]]:
+        by_step: Dict[str, List[Sample]] = defaultdict(list)
+        for sample in self.samples:
+            by_step[sample.step].append(sample)
+
+        summary = {}
+        for step, samples in by_step.items():
+            latencies = [sample.latency * 1000 for sample in samples]
+            errors = Counter(sample.error for sample in samples if not sample.ok)
+            summary[step] = {
+                "count": len(samples),
+                "errors": sum(errors.values()),
+                "error_rate": round(sum(errors.values()) * 100 / len(samples), 2),
+                "p50_ms": round(percentile(latencies, 50), 1),
+                "p95_ms": round(percentile(latencies, 95), 1),
+                "p99_ms": round(percentile(latencies, 99), 1),
+                "max_ms": round(max(latencies), 1),
+                "error_breakdown": dict(errors),
+            }
+        return summary
+
+    def time_series(self, bucket: float = 1.0) -> List[Dict[str, Any]]:
+        buckets: Dict[tuple, List[Sample]] = defaultdict(list)
+        for sample in self.samples:
+            buckets[(int(sample.started // bucket), sample.step)].append(sample)
+
+        rows = []
+        for (index, step), samples in sorted(buckets.items()):
+            latencies = [sample.latency * 1000 for sample in samples]
+            rows.append({
+                "second": round(index * bucket, 3),
+                "step": step,
+                "requests": len(samples),
+                "errors": sum(1 for sample in samples if not sample.ok),
+                "mean_ms": round(sum(latencies) / len(latencies), 1),
+                "p95_ms": round(percentile(latencies, 95), 1),
+            })
+        return rows
+
+    @property
+    def success_count(self) -> int:
+        """Virtual-user iterations where every step succeeded."""
+        return sum(1 for sample in self.samples if sample.step == "iteration" and sample.ok)
+
+    def log(self) -> None:
+        logger.info(f"Scenario {self.name}: {len(self.samples)} samples in {self.wall_time:.1f}s")
+        for step, stats in self.step_summary().items():
+            logger.info(
+                f"  {step}: n={stats['count']} p50={stats['p50_ms']}ms p95={stats['p95_ms']}ms "
+                f"p99={stats['p99_ms']}ms errors={stats['error_rate']}% {stats['error_breakdown']}"
+            )
+
+    def export(self, directory: str = "test_results") -> str:
+        os.makedirs(directory, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base = os.path.join(directory, f"load_{self.name}_{timestamp}")
+
+        with open(f"{base}_summary.json", "w", encoding="utf-8") as f:
+            json.dump({
+                "scenario": self.name,
+                "wall_time": round(self.wall_time, 3),
+                "steps": self.step_summary()
+            }, f, indent=2)
+
+        rows = self.time_series()
+        with open(f"{base}_timeseries.csv", "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=["second", "step", "requests", "errors", "mean_ms", "p95_ms"])
+            writer.writeheader()
+            writer.writerows(rows)
+        return base
+
+
+class LoadScenario:
+    """
+    Runs a declarative scenario from ``LOAD_SCENARIOS`` against the back office.
+
+    ``setup`` steps run once per virtual user; ``steps`` run once, or repeat
+    until ``duration`` seconds have passed. Users start spread over ``ramp_up``
+    seconds and ``target_rps`` caps the combined request rate. A failed step
+    ends that user's iteration, since later steps depend on it.
+    """
+
+    def __init__(self, name: str, image_bytes: Optional[bytes] = None, **overrides: Any) -> None:
+        config = dict(LOAD_SCENARIOS[name])
+        config.update(overrides)
+        self.name = name
+        self.setup = [self.parse_step(step) for step in config.get("setup", [])]
+        self.steps = [self.parse_step(step) for step in config.get("steps", [])]
+        self.users = config.get("users", 1)
+        self.workers = config.get("workers") or self.users
+        self.ramp_up = config.get("ramp_up", 0)
+        self.duration = config.get("duration", 0)
+        self.limiter = RateLimiter(config.get("target_rps", 0))
+        self.base_url = config.get("base_url") or CREDENTIALS["BO_base_url"]
+        self.image_bytes = image_bytes
+        self._samples: List[Sample] = []
+        self._lock = threading.Lock()
+        self._started = 0.0
+
+    @staticmethod
+    def parse_step(step: Any) -> tuple:
+        if isinstance(step, str):
+            return step, {}
+        params = dict(step)
+        return params.pop("name"), params
+
+    def record(self, step: str, started: float, ok: bool, error: Optional[str]) -> None:
+        sample = Sample(step, started - self._started, time.monotonic() - started, ok, error)
+        with self._lock:
+            self._samples.append(sample)
+
+    def run_step(self, user: VirtualUser, name: str, params: Dict[str, Any]) -> bool:
+        self.limiter.acquire()
+        started = time.monotonic()
+        try:
+            STEPS[name](user, **params)
+        except StepFailed as e:
+            self.record(name, started, False, e.kind)
+            logger.warning(f"User #{user.user_id} {name} failed: {str(e)}")
+            return False
+        except requests.RequestException as e:
+            self.record(name, started, False, e.__class__.__name__)
+            logger.warning(f"User #{user.user_id} {name} failed: {str(e)}")
+            return False
+        except Exception as e:
+            # a step that breaks on an unexpected response (missing key, bad JSON) is a failed sample too
+            self.record(name, started, False, e.__class__.__name__)
+            logger.error(f"User #{user.user_id} {name} raised: {str(e)}")
+            return False
+        self.record(name, started, True, None)
+        return True
+
+    def run_steps(self, user: VirtualUser, steps: List[tuple]) -> bool:
+        started = time.monotonic()
+        ok = all(self.run_step(user, name, params) for name, params in steps)
+        self.record("iteration", started, ok, None if ok else "step failed")
+        return ok
+
+    def run_user(self, user_id: int) -> None:
+        if self.ramp_up and self.users > 1:
+            time.sleep(self.ramp_up * (user_id - 1) / (self.users - 1))
+
+        user = VirtualUser(user_id, self.base_url, self.image_bytes)
+        try:
+            if not all(self.run_step(user, name, params) for name, params in self.setup):
+                self.record("iteration", time.monotonic(), False, "setup failed")
+                return
+            deadline = self._started + self.duration
+            while True:
+                self.run_steps(user, self.steps)
+                if not self.duration or time.monotonic() >= deadline:
+                    break
+        finally:
+            user.close()
+
+    def run(self) -> LoadReport:
+        logger.info(f"Running scenario {self.name} with {self.users} users on {self.workers} workers")
+        self._samples = []
+        self._started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for future in [executor.submit(self.run_user, user_id) for user_id in range(1, self.users + 1)]:
+                future.result()
+        return LoadReport(self.name, list(self._samples), time.monotonic() - self._started)
@@ -0,0 +1,670 @@
+import json
+import logging
+import random
+import re
+import secrets
+import socket
+import threading
+import time
+from datetime import datetime
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from config.constant import CREDENTIALS, MOCK_BACKOFFICE
+
+logger = logging.getLogger("MockBackOffice")
+
+GAMES = [{"id": game_id, "name": f"Mock Provider {game_id}"} for game_id in range(1, 13)]
+VIP_LEVELS = [
+    {"id": 1, "vipname": "Normal", "recharge": "0"},
+    {"id": 2, "vipname": "Bronze", "recharge": "1000"},
+    {"id": 3, "vipname": "Silver", "recharge": "5000"},
+    {"id": 4, "vipname": "Gold", "recharge": "20000"},
+    {"id": 5, "vipname": "Platinum", "recharge": "50000"},
+]
+PROMOS = [
+    {"optionCode": "10DSRB", "optionName": "10% Daily Slot Reload Bonus", "optionValue": "10", "turnover": 5},
+    {"optionCode": "20DSRB", "optionName": "20% Daily Slot Reload Bonus", "optionValue": "20", "turnover": 8},
+]
+# daily check-in cycle served by /api/reward; reward ids are resolved by /api/rewards/<id>
+REWARD_TYPES = {1: "coin", 2: "ticket", 3: "bonus"}
+DAILY_REWARDS = [{
+    "id": day,
+    "name": f"Day {day}",
+    "consecutive_days": day,
+    "reward_id": 1 if day % 2 else 3,
+    "reward_value": "10" if day % 2 else "5",
+    "special_reward_id": 2 if day % 7 == 0 else 0,
+    "special_reward_value": "1" if day % 7 == 0 else "0"
+} for day in range(1, 32)]
+GIFTS = [{
+    "id": gift_id,
+    "title": f"Mock Gift {gift_id}",
+    "points": gift_id * 100,
+    "image": "",
+    "updated_at": f"2025-01-{gift_id:02d} 00:00:00"
+} for gift_id in range(1, 13)]
+WHEEL_PRIZES = [{"id": prize_id, "name": f"Mock Prize {prize_id}", "probability": 10} for prize_id in range(1, 11)]
+# rebate percentage per downline tier, for every provider
+REBATE_PERCENTAGE = {"2": 1.0, "3": 0.5}
+MISSIONS = [
+    {"id": 1, "title": "Deposit Mission", "desc": "Deposit 3 times", "condition_type": "deposit", "target": 3},
+    {"id": 2, "title": "Bet Mission", "desc": "Bet RM100", "condition_type": "bet", "target": 100},
+]
+
+
+def now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class MockUser:
+
+    def __init__(self, user_id, username, password, phone):
+        self.id = user_id
+        self.username = username
+        self.password = password
+        self.phone = phone
+        self.balance = 0.0
+        self.paysum = 0.0
+        self.games = {game["id"]: 0.0 for game in GAMES}
+        self.deposits = []
+        self.withdrawals = []
+        self.transfers = []
+        self.turnovers = []
+        self.fourd_cards = 0
+        self.fourd_records = []
+        self.bet_total = 0.0
+        self.checkin_days = 0
+
+    def vip_level(self):
+        return [level for level in VIP_LEVELS if self.paysum >= float(level["recharge"])][-1]
+
+    def vip(self):
+        current = self.vip_level()
+        index = VIP_LEVELS.index(current)
+        upcoming = VIP_LEVELS[index + 1] if index + 1 < len(VIP_LEVELS) else current
+        return current["vipname"], upcoming["vipname"]
+
+    def profile(self):
+        current_vip, next_vip = self.vip()
+        return {
+            "id": self.id,
+            "username": self.username,
+            "realname": self.username,
+            "phone": self.phone,
+            "balance": round(self.balance, 2),
+            "paysum": round(self.paysum, 2),
+            "vip": self.vip_level()["id"],
+            "current_vip": current_vip,
+            "next_vip": next_vip,
+        }
+
+
+class BackOfficeState:
+    """In-memory wallets, turnovers, 4D records and missions behind the mock endpoints."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.users = {}
+        self.by_username = {}
+        self.tokens = {}
+        self._ids = {"user": 1000, "deposit": 0, "withdraw": 0, "turnover": 0, "fourd": 0}
+        self.seed_users()
+
+    def next_id(self, kind):
+        self._ids[kind] += 1
+        return self._ids[kind]
+
+    def register(self, username, password, phone):
+        if username in self.by_username:
+            return None
+        user = MockUser(self.next_id("user"), username, password, phone)
+        self.users[user.id] = user
+        self.by_username[username] = user
+        return user
+
+    def seed_users(self):
+        """The fixed accounts the suite logs in with, e.g. duplicated_user for reference data."""
+        accounts = [(CREDENTIALS[key]["username"], CREDENTIALS[key]["password"], CREDENTIALS[key].get("phone_number"))
+                    for key in MOCK_BACKOFFICE["seed_credentials"]]
+        accounts += [(username, username, None) for username in MOCK_BACKOFFICE["seed_users"]]
+        for username, password, phone in accounts:
+            self.register(username, password, phone or f"1{self._ids['user'] + 1:08d}")
+
+
+class MockBackOfficeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    routes = []
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def dispatch(self, method):
+        parsed = urlparse(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        self.query_lists = parse_qs(parsed.query)
+        self.body = self.read_body()
+
+        latency = MOCK_BACKOFFICE["latency_ms"] + random.uniform(0, MOCK_BACKOFFICE["jitter_ms"])
+        if latency:
+            time.sleep(latency / 1000)
+
+        for route_method, pattern, handler_name in self.routes:
+            match = pattern.fullmatch(parsed.path)
+            if route_method == method and match:
+                with self.state.lock:
+                    status, payload = getattr(self, handler_name)(**match.groupdict())
+                return self.respond(status, payload)
+        self.respond(404, {"code": 404, "message": f"No mock for {method} {parsed.path}"})
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        content_type = self.headers.get("Content-Type", "")
+        if not raw:
+            return {}
+        if content_type.startswith("application/json"):
+            return json.loads(raw)
+        if content_type.startswith("multipart/form-data"):
+            message = BytesParser(policy=HTTP).parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + raw)
+            return {
+                part.get_param("name", header="content-disposition"): part.get_content()
+                for part in message.iter_parts() if not part.get_filename()
+            }
+        return {key: values[-1] for key, values in parse_qs(raw.decode()).items()}
+
+    def respond(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def current_user(self):
+        token = self.headers.get("Authorization", "").replace("Bearer ", "")
+        return self.state.users.get(self.state.tokens.get(token))
+
+    def query_user(self):
+        user_id = self.query.get("user_id") or self.query.get("ID") or (self.query_lists.get("user_ids[]") or [None])[0]
+        if user_id is None:
+            user_id = self.body.get("user_id")
+        return self.state.users.get(int(user_id)) if user_id else None
+
+    @staticmethod
+    def ok(data=None, message="success"):
+        return 200, {"code": 200, "message": message, "data": data}
+
+    @staticmethod
+    def error(message, code=400):
+        return 200, {"code": code, "message": message, "data": None}
+
+    @staticmethod
+    def unauthorized():
+        return 401, {"code": 401, "message": "Unauthenticated."}
+
+    # --- account ---
+
+    def login(self):
+        user = self.state.by_username.get(self.body.get("username"))
+        if not user or user.password != self.body.get("password"):
+            return self.error("Invalid username or password")
+        token = secrets.token_hex(16)
+        self.state.tokens[token] = user.id
+        return self.ok({"token": token})
+
+    def register(self):
+        if self.body.get("password") != self.body.get("password_confirmation"):
+            return self.error("Password confirmation does not match")
+        user = self.state.register(self.body.get("username"), self.body.get("password"), self.body.get("phone"))
+        if not user:
+            return self.error("Username already taken")
+        return self.ok({"id": user.id})
+
+    def user(self):
+        user = self.current_user()
+        return self.ok(user.profile()) if user else self.unauthorized()
+
+    def balance(self):
+        user = self.current_user()
+        return self.ok({"balance": round(user.balance, 2)}) if user else self.unauthorized()
+
+    def vip_levels(self):
+        return self.ok(VIP_LEVELS) if self.current_user() else self.unauthorized()
+
+    # --- deposit / withdraw ---
+
+    def deposit_info(self):
+        if not self.current_user():
+            return self.unauthorized()
+        promos = [{key: promo[key] for key in ("optionCode", "optionName", "optionValue")} for promo in PROMOS]
+        return self.ok({"popoPromo": promos, "banks": [{"id": 9, "name": "Mock Bank"}]})
+
+    def promotions(self):
+        return self.ok({"promotions": PROMOS})
+
+    def recharge(self):
+        user = self.current_user()
+        if not user:
+            return self.unauthorized()
+        amount = float(self.body.get("amount") or 0)
+        if amount <= 0:
+            return self.error("Invalid amount")
+        promo = self.body.get("promoCode") or self.body.get("optionCode")
+        deposit = {
+            "id": self.state.next_id("deposit"),
+            "amount": amount,
+            "promo": promo,
+            "status": "pending",
+            "created_at": now()
+        }
+        user.deposits.append(deposit)
+        return self.ok(deposit)
+
+    def settle_deposits(self, action):
+        user = self.query_user()
+        if not user:
+            return self.error("User not found", 404)
+        for deposit in user.deposits:
+            if deposit["status"] not in ("pending", "processing"):
+                continue
+            if action == "approve":
+                deposit["status"] = "approved"
+                self.credit_deposit(user, deposit)
+            else:
+                deposit["status"] = "rejected" if action == "refuse" else "processing"
+        return self.ok()
+
+    def credit_deposit(self, user, deposit):
+        promo = next((promo for promo in PROMOS if promo["optionCode"] == deposit["promo"]), None)
+        bonus = deposit["amount"] * float(promo["optionValue"]) / 100 if promo else 0
+        user.balance += deposit["amount"] + bonus
+        user.paysum += deposit["amount"]
+        multiplier = promo["turnover"] if promo else 1
+        user.turnovers.append({
+            "id": self.state.next_id("turnover"),
+            "progress": "0.00",
+            "target": f"{(deposit['amount'] + bonus) * multiplier:.2f}",
+            "lockedby": f"Promo: {promo['optionCode']}" if promo else "Deposit",
+            "created_at": now()
+        })
+
+    def withdraw(self):
+        user = self.current_user()
+        if not user:
+            return self.unauthorized()
+        amount = float(self.body.get("amount") or 0)
+        if any(float(t["progress"]) < float(t["target"]) for t in user.turnovers):
+            return self.error("Turnover incomplete")
+        if amount <= 0 or amount > user.balance:
+            return self.error("Insufficient balance")
+        user.balance -= amount
+        withdrawal = {"id": self.state.next_id("withdraw"), "amount": amount, "status": "pending", "created_at": now()}
+        user.withdrawals.append(withdrawal)
+        return self.ok(withdrawal)
+
+    def settle_withdrawals(self, action):
+        user = self.query_user()
+        if not user:
+            return self.error("User not found", 404)
+        for withdrawal in user.withdrawals:
+            if withdrawal["status"] not in ("pending", "processing"):
+                continue
+            if action == "refuse":
+                withdrawal["status"] = "rejected"
+                user.balance += withdrawal["amount"]
+            else:
+                withdrawal["status"] = "approved" if action == "approve" else "processing"
+        return self.ok()
+
+    # --- transfers / turnover ---
+
+    def transfer_list(self):
+        user = self.current_user()
+        if not user:
+            return self.unauthorized()
+        games = [{"id": game["id"], "name": game["name"], "credit": f"{user.games[game['id']]:.2f}"} for game in GAMES]
+        return self.ok({
+            "accountList": [{
+                "id": 0,
+                "label": "Main Wallet",
+                "credit": f"{user.balance:.2f}",
+                "games": games
+            }]
+        })
+
+    def revert_all(self):
+        user = self.current_user()
+        if not user:
+            return self.unauthorized()
+        user.balance += sum(user.games.values())
+        user.games = dict.fromkeys(user.games, 0.0)
+        return self.ok()
+
+    def transfer(self):
+        user = self.current_user()
+        if not user:
+            return self.unauthorized()
+        source, target = int(self.body.get("source_id")), int(self.body.get("target_id"))
+        amount = float(self.body.get("amount") or 0)
+        wallets = {0: user.balance, **user.games}
+        if source not in wallets or target not in wallets or source == target:
+            return 400, {"code": 400, "message": "Invalid wallet"}
+        if amount <= 0 or wallets[source] < amount:
+            return 400, {"code": 400, "message": "Insufficient balance"}
+        for wallet_id, delta in ((source, -amount), (target, amount)):
+            if wallet_id == 0:
+                user.balance += delta
+            else:
+                user.games[wallet_id] += delta
+        user.transfers.append({"source_id": source, "target_id": target, "amount": amount, "created_at": now()})
+        return self.ok()
+
+    def check_turnover(self):
+        user = self.query_user()
+        return (200, user.turnovers) if user else self.error("User not found", 404)
+
+    def modify_turnover(self):
+        user = self.query_user()
+        turnover = next((t for t in user.turnovers if t["id"] == int(self.query.get("turnover_id"))), None) if user else None
+        if not turnover:
+            return self.error("Turnover not found", 404)
+        action = int(self.query.get("action"))
+        if action == 1:
+            turnover["progress"] = turnover["target"]
+        elif action == 0:
+            turnover["progress"] = "0.00"
+        else:
+            user.turnovers.remove(turnover)
+        return self.ok()
+
+    def simulate_game_records(self):
+        user = self.query_user()
+        if not user:
+            return self.error("User not found", 404)
+        amount = float(self.query.get("amount") or 0)
+        user.bet_total += amount
+        for turnover in user.turnovers:
+            progress = min(float(turnover["target"]), float(turnover["progress"]) + amount)
+            turnover["progress"] = f"{progress:.2f}"
+        return self.ok()
+
+    def history(self):
+        user = self.current_user()
+        if not user:
+            return self.unauthorized()
+        record_type = self.query.get("type")
+        records = {
+            "1": user.deposits, "deposit": user.deposits,
+            "2": user.withdrawals, "withdraw": user.withdrawals,
+            "3": user.transfers, "transfer": user.transfers
+        }.get(record_type, [])
+        # paginated like the real endpoint, newest first
+        records = list(reversed(records))
+        per_page = 10
+        page = int(self.query.get("page") or 1)
+        return self.ok({
+            "data": records[(page - 1) * per_page:page * per_page],
+            "current_page": page,
+            "per_page": per_page,
+            "last_page": max(1, -(-len(records) // per_page)),
+            "total": len(records)
+        })
+
+    # --- 4D ---
+
+    def add_4d_cards(self):
+        user = self.query_user() or self.current_user()
+        if not user:
+            return self.error("User not found", 404)
+        user.fourd_cards += int(float(self.body.get("amount") or 0))
+        return self.ok({"cards": user.fourd_cards})
+
+    def bet_4d(self):
+        user = self.query_user() or self.current_user()
+        if not user:
+            return self.error("User not found", 404)
+        record = {
+            "id": self.state.next_id("fourd"),
+            "four_d_number": str(self.body.get("bet_number")),
+            "bet_dates": self.body.get("bet_dates"),
+            "bet_platforms": self.body.get("bet_platforms"),
+            "source": self.body.get("source"),
+            "type": self.body.get("type"),
+            "created_at": self.body.get("user_bet_time") or now(),
+            "is_won": 0,
+            "win_amount": "0.00",
+            **{size: self.body.get(size, "0") for size in ("B", "S", "SA", "SB", "SC", "SD", "SE")}
+        }
+        user.fourd_records.append(record)
+        return self.ok(record)
+
+    def fourd_history(self):
+        user = self.current_user()
+        if not user:
+            return self.unauthorized()
+        records = sorted(user.fourd_records, key=lambda record: record["created_at"], reverse=True)
+        if self.body.get("four_d_number"):
+            records = [r for r in records if r["four_d_number"] == str(self.body["four_d_number"])]
+        if str(self.body.get("is_won")) in ("0", "1"):
+            records = [r for r in records if r["is_won"] == int(self.body["is_won"])]
+        if self.body.get("start_date"):
+            records = [r for r in records if r["bet_dates"] >= self.body["start_date"]]
+        if self.body.get("end_date"):
+            records = [r for r in records if r["bet_dates"] <= self.body["end_date"]]
+
+        per_page = int(self.body.get("per_page") or 10)
+        page = int(self.body.get("page") or 1)
+        start = (page - 1) * per_page
+        return self.ok({"total": len(records), "data": records[start:start + per_page]})
+
+    def update_bet_result(self):
+        user = self.state.by_username.get(self.body.get("username")) or self.current_user()
+        record_id = int(self.body.get("betRecordId") or 0)
+        record = next((r for r in user.fourd_records if r["id"] == record_id), None) if user else None
+        if not record:
+            return self.error("Bet record not found", 404)
+        won = self.body.get("action") == "win"
+        record["is_won"] = int(won)
+        record["win_amount"] = f"{float(self.body.get('amount') or 0):.2f}" if won else "0.00"
+        if won:
+            user.balance += float(record["win_amount"])
+        return self.ok(record)
+
+    # --- check-in rewards / gifts ---
+
+    def rewards(self):
+        user = self.current_user()
+        if not user:
+            return self.unauthorized()
+        return self.ok([{
+            "user_consecutive_days": user.checkin_days,
+            "is_special": bool(reward["special_reward_id"]),
+            "reward": {**reward, "user_vip_id": user.vip_level()["id"]}
+        } for reward in DAILY_REWARDS])
+
+    def reward(self, reward_id):
+        reward_type = REWARD_TYPES.get(int(reward_id))
+        if reward_type is None:
+            return self.error("Reward not found", 404)
+        return self.ok({"id": int(reward_id), "reward_type": reward_type})
+
+    def gifts(self):
+        return self.ok(GIFTS) if self.current_user() else self.unauthorized()
+
+    def simulate_checkin(self):
+        user = self.query_user()
+        if not user:
+            return self.error("User not found", 404)
+        user.checkin_days = int(self.query.get("days") or 0)
+        return self.ok()
+
+    # --- lucky wheel ---
+
+    def wheel_prizes(self):
+        if not self.current_user():
+            return self.unauthorized()
+        prizes = [{key: prize[key] for key in ("id", "name")} for prize in WHEEL_PRIZES]
+        return self.ok({"prizes": prizes, "spin_left": 0, "tnc": "Mock lucky wheel terms"})
+
+    def wheel_probabilities(self):
+        return self.ok(WHEEL_PRIZES) if self.current_user() else self.unauthorized()
+
+    def prize_history(self):
+        return self.ok([]) if self.current_user() else self.unauthorized()
+
+    # --- referral rebates ---
+
+    def generate_downline(self):
+        if not self.query_user():
+            return self.error("User not found", 404)
+        tiers = {}
+        for tier in ("t2", "t3"):
+            username = f"mock{tier}{self.state._ids['user'] + 1}"
+            user = self.state.register(username, username, f"1{self.state._ids['user'] + 1:08d}")
+            tiers[f"{tier}_users"] = [{"id": user.id, "username": username, "password": username}]
+        return self.ok(tiers)
+
+    def rebate_list(self):
+        return self.ok([{"provider_id": game["id"], "rebate_percentage": REBATE_PERCENTAGE} for game in GAMES])
+
+    def calculate_rebate(self):
+        return self.ok()
+
+    # --- missions ---
+
+    def simulate_daily_mission(self):
+        return self.ok() if self.query_user() else self.error("User not found", 404)
+
+    def daily_missions(self):
+        user = self.current_user()
+        if not user:
+            return self.unauthorized()
+        progress = {
+            "deposit": len([d for d in user.deposits if d["status"] == "approved"]),
+            "bet": user.bet_total,
+        }
+        missions = []
+        for mission in MISSIONS:
+            current = min(progress.get(mission["condition_type"], 0), mission["target"])
+            missions.append({
+                **mission,
+                "progress": f"{current:.2f}",
+                "target": f"{mission['target']:.2f}",
+                "is_completed": current >= mission["target"],
+                "translations": []
+            })
+        return self.ok(missions)
+
+
+def route(method, path, handler_name):
+    pattern = re.compile(re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", path))
+    MockBackOfficeHandler.routes.append((method, pattern, handler_name))
+
+
+route("POST", "/api/v2/login", "login")
+route("POST", "/api/login", "login")
+route("POST", "/api/v3/register", "register")
+route("GET", "/api/user", "user")
+route("GET", "/api/balance", "balance")
+route("GET", "/api/uservip", "vip_levels")
+route("GET", "/api/depositInfo", "deposit_info")
+route("GET", "/api/promotion", "promotions")
+route("POST", "/api/recharge", "recharge")
+route("POST", "/api/withdraw", "withdraw")
+route("GET", "/api/transfers", "transfer_list")
+route("POST", "/api/transfers", "transfer")
+route("GET", "/api/check-turnover", "check_turnover")
+route("GET", "/api/modify-turnover", "modify_turnover")
+route("GET", "/api/simulate-game-records", "simulate_game_records")
+route("GET", "/api/filter-records-by-date", "history")
+route("POST", "/api/qa-redeem-fourd-card", "add_4d_cards")
+route("POST", "/api/qa-bet-fourd", "bet_4d")
+route("POST", "/api/user-4d-records-history", "fourd_history")
+route("POST", "/api/qa-update-bet-result", "update_bet_result")
+route("GET", "/api/getdailymissions", "daily_missions")
+route("GET", "/api/reward", "rewards")
+route("GET", "/api/rewards/{reward_id}", "reward")
+route("GET", "/api/gifts", "gifts")
+route("GET", "/api/simulate-checkin", "simulate_checkin")
+route("GET", "/api/simulate-daily-mission", "simulate_daily_mission")
+route("GET", "/api/getPrizes", "wheel_prizes")
+route("GET", "/api/getPrizesWithProbability", "wheel_probabilities")
+route("GET", "/api/prizes/history", "prize_history")
+route("POST", "/api/revertAll", "revert_all")
+route("GET", "/api/qa-generate-user", "generate_downline")
+route("GET", "/api/qa-rebate-list", "rebate_list")
+route("GET", "/api/qa-calculate-rebate", "calculate_rebate")
+for action in ("approve", "refuse", "process"):
+    route("GET", f"/api/recharge/{action}(/batch)?", f"settle_deposits_{action}")
+    route("GET", f"/api/withdraw/{action}(/batch)?", f"settle_withdrawals_{action}")
+    setattr(
+        MockBackOfficeHandler, f"settle_deposits_{action}",
+        lambda self, action=action: self.settle_deposits(action)
+    )
+    setattr(
+        MockBackOfficeHandler, f"settle_withdrawals_{action}",
+        lambda self, action=action: self.settle_withdrawals(action)
+    )
+
+
+class MockBackOffice:
+    """
+    Threaded stand-in for the staging back office, started in-process.
+
+    With ``USE_MOCK_BACKOFFICE`` on, config points ``BO_base_url``/``API_URL`` at
+    this server, so API-level helpers run without network access.
+    """
+
+    def __init__(self, host=None, port=None):
+        self.server = ThreadingHTTPServer((host or MOCK_BACKOFFICE["host"], port or MOCK_BACKOFFICE["port"]),
+                                          MockBackOfficeHandler)
+        self.server.daemon_threads = True
+        self.server.state = BackOfficeState()
+        self.thread = None
+
+    @property
+    def state(self):
+        return self.server.state
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name="mock-backoffice", daemon=True)
+        self.thread.start()
+        logger.info(f"Mock back office listening on {self.url}")
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+_server = None
+
+
+def ensure_mock_backoffice():
+    """Start the mock in this process unless another process (e.g. the main.py parent) already serves the port."""
+    global _server
+    if _server is not None:
+        return _server
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        if probe.connect_ex((MOCK_BACKOFFICE["host"], MOCK_BACKOFFICE["port"])) == 0:
+            return None
+    _server = MockBackOffice().start()
+    return _server
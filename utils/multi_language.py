@@ -0,0 +1,83 @@
+import functools
+from urllib.parse import urlparse, urlunparse
+
+from config.constant import LANGUAGE_SETTINGS
+
+
+def multi_language(func):
+    """
+    Mark a read-only test that only differs by language, e.g. checks of card text
+    or validation messages against ``LANGUAGE_SETTINGS``::
+
+        @multi_language
+        def test_01_EmptyFields(self): ...
+
+    When the run covers several languages the test is run once, in the first
+    language's process, and the body is repeated for every language as a
+    ``subTest`` in the same browser session: only the ``/cn``, ``/en``, ``/bm``
+    route is switched, and accounts resolved with ``use_state`` are reused.
+    Anything that changes the account (deposits, claims, transfers) must not use it.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        languages = self.languages or [self.language]
+        if len(languages) == 1:
+            return func(self, *args, **kwargs)
+
+        start_url = self.driver.current_url
+        self.pass_users = {}
+        try:
+            for index, language in enumerate(languages):
+                with self.subTest(language=language):
+                    if index:
+                        self.switch_language(language, start_url)
+                    func(self, *args, **kwargs)
+        finally:
+            self.language = languages[0]
+            self.pass_users = None
+
+    wrapper.multi_language = True
+    return wrapper
+
+
+def is_multi_language(test_class, method_name):
+    return getattr(getattr(test_class, method_name, None), "multi_language", False)
+
+
+def pass_languages(test_class, method_name, language, languages):
+    """
+    Languages one test instance covers: every language of the run for a
+    multi-language test in the first language's process, none (skip it) in the
+    other processes, and just ``language`` for everything else.
+    """
+    if not languages or len(languages) < 2 or not is_multi_language(test_class, method_name):
+        return [language]
+    return list(languages) if language == languages[0] else []
+
+
+def language_url(url, language):
+    """``url`` with its language route (the first path segment) switched to ``language``."""
+    parts = urlparse(url)
+    segments = parts.path.lstrip("/").split("/")
+    if segments and segments[0] in LANGUAGE_SETTINGS:
+        segments[0] = language
+    else:
+        segments.insert(0, language)
+    return urlunparse(parts._replace(path="/" + "/".join(segment for segment in segments if segment)))
+
+
+def result_target(test):
+    """
+    ``(test, language)`` to report for a result callback: a subtest of a
+    multi-language pass is reported as its test under that subtest's language.
+    """
+    params = getattr(test, "params", None)
+    if params and "language" in params:
+        return test.test_case, params["language"]
+    return test, getattr(test, "remote_language", None)
+
+
+def runs_language_pass(test):
+    """True when ``test`` reports one result per language instead of one for the whole test."""
+    return len(getattr(test, "languages", None) or []) > 1
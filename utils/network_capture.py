@@ -0,0 +1,256 @@
+import json
+import logging
+import time
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import WebDriverException
+
+from config.constant import NETWORK_CAPTURE
+from utils.waits import page_scripts
+
+logger = logging.getLogger("NetworkCapture")
+
+# Records fetch/XHR responses for browsers without CDP. Entries are also kept in
+# sessionStorage so responses from before a reload can still be collected; requests
+# still in flight are listed in window.__capturePending.
+CAPTURE_HOOK_JS = """
+(function(patterns, maxEntries) {
+    if (window.__networkCapture) { return; }
+    window.__networkCapture = true;
+    var KEY = '__capturedResponses';
+    var pending = window.__capturePending = [];
+    function wanted(url) {
+        return patterns.some(function(pattern) { return url.indexOf(pattern) !== -1; });
+    }
+    function track(method, url) {
+        var request = {method: method.toUpperCase(), url: String(url)};
+        if (wanted(request.url)) { pending.push(request); }
+        return request;
+    }
+    function untrack(request) {
+        var index = pending.indexOf(request);
+        if (index !== -1) { pending.splice(index, 1); }
+    }
+    function record(method, url, status, body) {
+        if (!wanted(url)) { return; }
+        var entries = [];
+        try { entries = JSON.parse(sessionStorage.getItem(KEY) || '[]'); } catch (e) {}
+        entries.push({method: method, url: url, status: status, body: body, timestamp: Date.now() / 1000});
+        try { sessionStorage.setItem(KEY, JSON.stringify(entries.slice(-maxEntries))); } catch (e) {}
+    }
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function(input, init) {
+            var method = (init && init.method) || (input && input.method) || 'GET';
+            var request = track(method, (input && input.url) || input);
+            return originalFetch.apply(this, arguments).then(function(response) {
+                response.clone().text().then(function(body) {
+                    record(method.toUpperCase(), response.url, response.status, body);
+                    untrack(request);
+                }, function() { untrack(request); });
+                return response;
+            }, function(error) {
+                untrack(request);
+                throw error;
+            });
+        };
+    }
+    var originalOpen = XMLHttpRequest.prototype.open;
+    XMLHttpRequest.prototype.open = function(method, url) {
+        this.__captureMethod = method;
+        this.__captureUrl = url;
+        return originalOpen.apply(this, arguments);
+    };
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        var xhr = this;
+        var request = track(xhr.__captureMethod || 'GET', xhr.__captureUrl);
+        xhr.addEventListener('loadend', function() {
+            untrack(request);
+            var body = (xhr.responseType === '' || xhr.responseType === 'text') ? xhr.responseText :
+                (xhr.responseType === 'json' ? JSON.stringify(xhr.response) : null);
+            record((xhr.__captureMethod || 'GET').toUpperCase(), xhr.responseURL, xhr.status, body);
+        });
+        return originalSend.apply(this, arguments);
+    };
+})(arguments[0], arguments[1]);
+"""
+
+CAPTURE_DRAIN_JS = """
+var entries = [];
+try { entries = JSON.parse(sessionStorage.getItem('__capturedResponses') || '[]'); } catch (e) {}
+sessionStorage.removeItem('__capturedResponses');
+return {entries: entries, pending: window.__capturePending || []};
+"""
+
+
+class CapturedResponse:
+
+    def __init__(self, method, url, status, body, timestamp):
+        self.method = method
+        self.url = url
+        self.status = status
+        self.body = body
+        self.timestamp = timestamp
+        self._json = None
+
+    @property
+    def path(self):
+        return urlparse(self.url).path
+
+    def json(self):
+        if self._json is None and self.body:
+            try:
+                self._json = json.loads(self.body)
+            except ValueError:
+                return None
+        return self._json
+
+    @property
+    def data(self):
+        payload = self.json()
+        return payload.get("data") if isinstance(payload, dict) else None
+
+    def __repr__(self):
+        return f"CapturedResponse({self.method} {self.url} {self.status})"
+
+
+class NetworkCapture:
+    """
+    The web app's own API responses, recorded while the test runs.
+
+    Chromium sessions are launched with performance logging (see
+    ``logging_capability``); ``collect`` reads the Network events from that log
+    and fetches each finished response's body with CDP
+    ``Network.getResponseBody``. Selenium's Firefox BiDi support has no network
+    module, so there a fetch/XHR recorder is injected into the page instead,
+    re-installed by ``Waits.page_settled``; it misses requests a freshly loaded
+    page makes before that. ``latest`` only waits while a request for the path
+    is in flight, so a response that was never going to be captured costs no
+    time.
+    """
+
+    def __init__(self, driver, patterns=None):
+        self.driver = driver
+        self.patterns = list(patterns or NETWORK_CAPTURE["url_patterns"])
+        self.responses = []
+        self._requests = {}
+        self._pending = []
+        self.use_cdp = hasattr(driver, "execute_cdp_cmd") and self._has_performance_log()
+
+    def _has_performance_log(self):
+        try:
+            return "performance" in self.driver.log_types
+        except WebDriverException:
+            return False
+
+    def wanted(self, url):
+        return any(pattern in url for pattern in self.patterns)
+
+    def start(self):
+        """Forget everything captured so far, including a pooled session's earlier tests."""
+        self.responses = []
+        self._requests = {}
+        self._pending = []
+        try:
+            if self.use_cdp:
+                self.driver.get_log("performance")
+            else:
+                self.install()
+                self.driver.execute_script(CAPTURE_DRAIN_JS)
+        except WebDriverException as e:
+            logger.debug(f"Could not reset network capture: {str(e)}")
+
+    def install(self):
+        args = (self.patterns, NETWORK_CAPTURE["max_entries"])
+        page_scripts(self.driver)["network_capture"] = (CAPTURE_HOOK_JS, *args)
+        try:
+            self.driver.execute_script(CAPTURE_HOOK_JS, *args)
+        except WebDriverException as e:
+            logger.debug(f"Could not install network capture hook: {str(e)}")
+
+    def collect(self):
+        try:
+            if self.use_cdp:
+                self._collect_cdp()
+            else:
+                self._collect_script()
+        except WebDriverException as e:
+            logger.warning(f"Could not collect captured responses: {str(e)}")
+        return self.responses
+
+    def _collect_cdp(self):
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            method, params = message.get("method"), message.get("params", {})
+            if method == "Network.requestWillBeSent" and self.wanted(params["request"]["url"]):
+                self._requests[params["requestId"]] = {
+                    "method": params["request"]["method"], "url": params["request"]["url"]
+                }
+            elif method == "Network.responseReceived" and params["requestId"] in self._requests:
+                self._requests[params["requestId"]]["status"] = params["response"]["status"]
+            elif method == "Network.loadingFinished" and params["requestId"] in self._requests:
+                request = self._requests.pop(params["requestId"])
+                self.responses.append(
+                    CapturedResponse(
+                        request["method"], request["url"], request.get("status"),
+                        self._response_body(params["requestId"]), entry["timestamp"] / 1000
+                    )
+                )
+            elif method == "Network.loadingFailed":
+                self._requests.pop(params["requestId"], None)
+
+    def _response_body(self, request_id):
+        try:
+            return self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id}).get("body")
+        except WebDriverException:
+            # the renderer drops bodies of pages that have navigated away
+            return None
+
+    def _collect_script(self):
+        drained = self.driver.execute_script(CAPTURE_DRAIN_JS) or {}
+        self.install()
+        self._pending = drained.get("pending", [])
+        for entry in drained.get("entries", []):
+            self.responses.append(
+                CapturedResponse(entry["method"], entry["url"], entry["status"], entry["body"], entry["timestamp"])
+            )
+
+    def find(self, path, method="GET"):
+        """Captured responses whose URL path ends with ``path``, oldest first."""
+        self.collect()
+        return [
+            response for response in self.responses
+            if response.path.rstrip("/").endswith(path) and (method is None or response.method == method)
+        ]
+
+    def pending(self, path, method="GET"):
+        """True while a request for ``path`` has been sent but its response not yet recorded."""
+        requests = self._requests.values() if self.use_cdp else self._pending
+        return any(
+            urlparse(request["url"]).path.rstrip("/").endswith(path)
+            and (method is None or request["method"].upper() == method) for request in requests
+        )
+
+    def latest(self, path, method="GET", timeout=None):
+        """
+        The most recent response for ``path``. When there is none yet, waits up to
+        ``timeout`` only while a request for ``path`` is still in flight.
+        """
+        deadline = time.monotonic() + (NETWORK_CAPTURE["timeout"] if timeout is None else timeout)
+        while True:
+            matches = [response for response in self.find(path, method) if response.body is not None]
+            if matches:
+                return matches[-1]
+            if not self.pending(path, method) or time.monotonic() >= deadline:
+                return None
+            time.sleep(0.2)
+
+
+def logging_capability(browser):
+    """Capability that turns on the performance log NetworkCapture reads on Chromium."""
+    if browser == "chrome":
+        return "goog:loggingPrefs", {"performance": "ALL"}
+    if browser == "edge":
+        return "ms:loggingPrefs", {"performance": "ALL"}
+    return None
@@ -0,0 +1,226 @@
+import atexit
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.constant import API_URL, CREDENTIALS, REFERENCE_CACHE
+from utils.api_client import get_client
+
+logger = logging.getLogger("ReferenceCache")
+
+CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test_results", "reference_cache"
+)
+
+
+class ReferenceCache:
+    """
+    Reference data (promos, VIP levels, providers, reward types) cached on disk.
+
+    One JSON file per (back office, endpoint, language), so every worker process
+    of a run, and the next run within the TTL against the same back office, reads
+    what the first one fetched. A refresh that fails drops the entry. Files are
+    written to a temp file and renamed into place, so a reader never sees a
+    half-written entry. Hit/miss counters are per process.
+    """
+
+    def __init__(self, directory=CACHE_DIR, ttl=None):
+        self.directory = directory
+        self.ttl = REFERENCE_CACHE["ttl"] if ttl is None else ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def path(self, endpoint, language=None):
+        # the back office is part of the key, so a run against another environment (or the mock) never reads it
+        key = f"{API_URL}|{CREDENTIALS['BO_base_url']}|{endpoint}|{language or ''}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def read(self, endpoint, language=None, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        try:
+            with open(self.path(endpoint, language), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry["stored_at"] > ttl:
+            return None
+        return entry
+
+    def write(self, endpoint, language, value):
+        os.makedirs(self.directory, exist_ok=True)
+        entry = {"endpoint": endpoint, "language": language, "stored_at": time.time(), "value": value}
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(temp_path, self.path(endpoint, language))
+
+    def get(self, endpoint, fetch, language=None, ttl=None, refresh=False):
+        """Cached value for ``endpoint`` and ``language``; ``fetch()`` is called on a miss."""
+        if not REFERENCE_CACHE["enabled"]:
+            return fetch()
+
+        entry = None if refresh else self.read(endpoint, language, ttl)
+        if entry is not None:
+            with self._lock:
+                self.hits += 1
+            return entry["value"]
+
+        with self._lock:
+            self.misses += 1
+        try:
+            value = fetch()
+        except Exception:
+            if refresh:
+                self.discard(endpoint, language)
+            raise
+        if value is not None:
+            self.write(endpoint, language, value)
+        elif refresh:
+            self.discard(endpoint, language)
+        return value
+
+    def discard(self, endpoint, language=None):
+        try:
+            os.remove(self.path(endpoint, language))
+        except FileNotFoundError:
+            pass
+
+    def invalidate(self, endpoint=None, language=None):
+        """Drop the entries matching ``endpoint`` and/or ``language``; no arguments clears the whole cache."""
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    entry = json.load(f)
+                if endpoint not in (None, entry["endpoint"]) or language not in (None, entry["language"]):
+                    continue
+                os.remove(path)
+            except (OSError, ValueError, KeyError):
+                continue
+
+    def log_summary(self):
+        if self.hits or self.misses:
+            logger.info(f"Reference cache: {self.hits} hits, {self.misses} misses")
+
+
+_cache = None
+_cache_pid = None
+
+
+def get_reference_cache():
+    global _cache, _cache_pid
+    if _cache is None or _cache_pid != os.getpid():
+        _cache = ReferenceCache()
+        _cache_pid = os.getpid()
+        atexit.register(_cache.log_summary)
+    return _cache
+
+
+def reference_credentials():
+    return CREDENTIALS["duplicated_user"]["username"], CREDENTIALS["duplicated_user"]["password"]
+
+
+def fetch_data(url, language=None, **headers):
+    if language:
+        headers["language"] = language
+    response = get_client().get(url, credentials=reference_credentials(), headers=headers)
+    response.raise_for_status()
+    return response.json().get("data")
+
+
+def deposit_info(language, refresh=False):
+    return get_reference_cache().get(
+        "/api/depositInfo", lambda: fetch_data(f"{CREDENTIALS['BO_base_url']}/api/depositInfo", language),
+        language, refresh=refresh
+    )
+
+
+def vip_levels(language=None, refresh=False):
+    return get_reference_cache().get(
+        "/api/uservip", lambda: fetch_data(f"{API_URL}/api/uservip", language), language, refresh=refresh
+    )
+
+
+def promotions(language, refresh=False):
+    url = CREDENTIALS["GetAllPromotion"].format(BO_base_url=CREDENTIALS["BO_base_url"])
+    return get_reference_cache().get(
+        "/api/promotion", lambda: fetch_data(url, language, Accept="application/json")["promotions"], language,
+        refresh=refresh
+    )
+
+
+def providers(refresh=False):
+    """Game providers (id and name) behind the transfer wallets; credits are per user and not cached."""
+
+    def fetch():
+        data = fetch_data(f"{CREDENTIALS['BO_base_url']}/api/transfers")
+        return [{
+            "id": game["id"],
+            "name": game["name"]
+        } for account in data.get("accountList", []) for game in account.get("games", [])]
+
+    return get_reference_cache().get("/api/transfers#providers", fetch, refresh=refresh)
+
+
+def reward_type(reward_id, refresh=False):
+
+    def fetch():
+        response = get_client().get(f"{API_URL}/api/rewards/{reward_id}")
+        response.raise_for_status()
+        result = response.json().get("data")
+        if not result or "reward_type" not in result:
+            raise ValueError("Invalid reward data returned from API.")
+        return result["reward_type"]
+
+    return get_reference_cache().get(f"/api/rewards/{reward_id}", fetch, refresh=refresh)
+
+
+def reward_ids(language=None):
+    rewards = fetch_data(f"{API_URL}/api/reward", language) or []
+    ids = set()
+    for reward in rewards:
+        ids.update(filter(None, (reward["reward"].get("reward_id"), reward["reward"].get("special_reward_id"))))
+    return ids
+
+
+def warm_up(languages, workers=None):
+    """Refetch every reference entry for ``languages`` at once, before the worker processes start."""
+    jobs = [lambda: providers(refresh=True)]
+    for language in languages:
+        jobs += [
+            lambda language=language: deposit_info(language, refresh=True),
+            lambda language=language: vip_levels(language, refresh=True),
+            lambda language=language: promotions(language, refresh=True),
+        ]
+    # the check-in tests ask without a language
+    jobs.append(lambda: vip_levels(refresh=True))
+
+    started = time.monotonic()
+    failed = 0
+    with ThreadPoolExecutor(max_workers=workers or REFERENCE_CACHE["workers"]) as executor:
+        futures = [executor.submit(job) for job in jobs]
+        try:
+            ids = reward_ids()
+        except Exception as e:
+            logger.warning(f"Could not list reward ids to prefetch: {str(e)}")
+            ids = set()
+        futures += [executor.submit(reward_type, reward_id, True) for reward_id in ids]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                failed += 1
+                logger.warning(f"Reference data prefetch failed: {str(e)}")
+
+    logger.info(
+        f"Prefetched {len(futures) - failed}/{len(futures)} reference entries in {time.monotonic() - started:.1f}s"
+    )
@@ -0,0 +1,200 @@
+import argparse
+import glob
+import html
+import json
+import logging
+import os
+import socket
+import threading
+from datetime import datetime
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test_results")
+RUNS_DIR = os.path.join(RESULTS_DIR, "runs")
+REPORT_COLUMNS = ["Test Class", "Test Name", "Language", "Browser", "Status", "Duration (s)", "Error Message"]
+
+
+def new_run_id():
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+def error_message(status, error_value):
+    message = str(error_value)
+    if status == "FAILURE" or isinstance(error_value, AssertionError) or "Test failed:" in message:
+        return message
+    return f"Test failed: {message}"
+
+
+class ResultsStore:
+    """
+    Append-only JSONL log of test outcomes for one run.
+
+    Every process writes its own file under ``test_results/runs/<run_id>`` and
+    flushes each line as the test finishes, so a killed run keeps everything
+    reported so far. ``load_run`` merges the files of all processes.
+    """
+
+    def __init__(self, run_id, language=None, browser=None, directory=RUNS_DIR, node=None):
+        self.run_id = run_id
+        self.language = language
+        self.browser = browser
+        # Grid node the browsers ran on, None for local browsers
+        self.node = node
+        self.run_dir = os.path.join(directory, run_id)
+        os.makedirs(self.run_dir, exist_ok=True)
+        self.path = os.path.join(self.run_dir, f"results-{language}-{browser}-{socket.gethostname()}-{os.getpid()}.jsonl")
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def append(self, test_class, method, status, duration=None, message=None, traceback=None, worker=None, **extra):
+        record = {
+            "run_id": self.run_id,
+            "class": test_class,
+            "method": method,
+            "language": self.language,
+            "browser": self.browser,
+            "status": status,
+            "duration": round(duration, 3) if duration is not None else None,
+            "message": message,
+            "traceback": traceback,
+            "worker": worker,
+            "pid": os.getpid(),
+            "node": self.node,
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        record.update(extra)
+        with self._lock:
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._file.flush()
+        return record
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def load_run(run_id, directory=RUNS_DIR):
+    records = []
+    for path in sorted(glob.glob(os.path.join(directory, run_id, "*.jsonl"))):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # last line of a process that was killed mid-write
+                    logging.warning(f"Skipping truncated result line in {path}")
+    return records
+
+
+def group_by_class(records):
+    grouped = {}
+    for record in records:
+        grouped.setdefault(record["class"], []).append(record)
+    return grouped
+
+
+def write_excel_reports(records, results_dir=RESULTS_DIR):
+    """One workbook per test class with a sheet per language/browser, built from stored records."""
+    # imported here so the scheduler and main.py --list, which only read stored records, skip openpyxl
+    from openpyxl import Workbook
+    from openpyxl.styles import Font, PatternFill
+
+    os.makedirs(results_dir, exist_ok=True)
+    pass_fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")
+    fail_fill = PatternFill(start_color="FFB6C1", end_color="FFB6C1", fill_type="solid")
+    header_font = Font(bold=True)
+    paths = []
+
+    for test_class, class_records in group_by_class(records).items():
+        wb = Workbook()
+        wb.remove(wb.active)
+        sheets = {}
+        for record in class_records:
+            key = (record.get("language"), record.get("browser"))
+            if key not in sheets:
+                # Excel caps sheet titles at 31 characters
+                ws = wb.create_sheet(f"{test_class}_{key[0]}_{key[1]}"[:31])
+                for col, header in enumerate(REPORT_COLUMNS, 1):
+                    ws.cell(row=1, column=col, value=header).font = header_font
+                sheets[key] = ws
+            ws = sheets[key]
+            row = ws.max_row + 1
+            values = [
+                test_class, record["method"], record.get("language"), record.get("browser"), record["status"],
+                record.get("duration"), record.get("message") or ""
+            ]
+            fill = pass_fill if record["status"] in ("PASS", "SKIP") else fail_fill
+            for col, value in enumerate(values, 1):
+                cell = ws.cell(row=row, column=col, value=value)
+                cell.fill = fill
+            ws.row_dimensions[row].height = 15 * max(str(values[-1]).count("\n") + 1, 1)
+
+        for ws in wb.worksheets:
+            for col in ws.columns:
+                width = max(len(str(cell.value)) if cell.value is not None else 0 for cell in col)
+                ws.column_dimensions[col[0].column_letter].width = width + 2
+
+        filepath = os.path.join(results_dir, f"{test_class}.xlsx")
+        wb.save(filepath)
+        logging.info(f"Test results Excel file created at: {filepath}")
+        paths.append(filepath)
+    return paths
+
+
+def write_html_report(records, run_id, results_dir=RESULTS_DIR):
+    os.makedirs(results_dir, exist_ok=True)
+    counts = {}
+    for record in records:
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
+    total_duration = sum(record.get("duration") or 0 for record in records)
+
+    rows = []
+    for record in sorted(records, key=lambda r: (r["class"], r["method"], r.get("language") or "")):
+        rows.append(
+            "<tr class='{status}'><td>{cls}</td><td>{method}</td><td>{language}</td><td>{browser}</td>"
+            "<td>{status}</td><td>{duration}</td><td><pre>{message}</pre></td></tr>".format(
+                status=html.escape(record["status"]), cls=html.escape(record["class"]),
+                method=html.escape(record["method"]), language=html.escape(str(record.get("language"))),
+                browser=html.escape(str(record.get("browser"))), duration=record.get("duration") or "",
+                message=html.escape(record.get("message") or "")
+            )
+        )
+
+    summary = ", ".join(f"{status}: {count}" for status, count in sorted(counts.items()))
+    page = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Test run {html.escape(run_id)}</title>
+<style>
+body {{ font-family: sans-serif; }} table {{ border-collapse: collapse; }}
+td, th {{ border: 1px solid #ccc; padding: 4px 8px; vertical-align: top; }}
+tr.PASS {{ background: #90EE90; }} tr.FAILURE, tr.ERROR {{ background: #FFB6C1; }}
+pre {{ margin: 0; white-space: pre-wrap; }}
+</style></head><body>
+<h1>Test run {html.escape(run_id)}</h1>
+<p>{len(records)} tests ({summary}), {total_duration:.1f}s of test time</p>
+<table><tr>{"".join(f"<th>{column}</th>" for column in REPORT_COLUMNS[:-1])}<th>Message</th></tr>
+{chr(10).join(rows)}
+</table></body></html>
+"""
+    filepath = os.path.join(results_dir, f"report_{run_id}.html")
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write(page)
+    logging.info(f"HTML report created at: {filepath}")
+    return filepath
+
+
+def build_reports(run_id, results_dir=RESULTS_DIR):
+    records = load_run(run_id)
+    if not records:
+        logging.warning(f"No results stored for run {run_id}")
+        return []
+    return write_excel_reports(records, results_dir) + [write_html_report(records, run_id, results_dir)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild Excel/HTML reports from a stored test run")
+    parser.add_argument("run_id", nargs="?", help="defaults to the most recent run")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    run_id = args.run_id or max(os.listdir(RUNS_DIR), key=lambda name: os.path.getmtime(os.path.join(RUNS_DIR, name)))
+    for path in build_reports(run_id):
+        print(path)
@@ -0,0 +1,334 @@
+import importlib
+import logging
+import multiprocessing
+import queue
+import re
+import time
+import traceback
+import unittest
+from typing import Dict, List, NamedTuple
+
+from utils.durations import predict_makespan
+from utils.multi_language import pass_languages, result_target, runs_language_pass
+
+ORDER_PREFIX = re.compile(r"^test_\d+_")
+POLL_INTERVAL = 5
+
+
+class WorkUnit(NamedTuple):
+    module: str
+    class_name: str
+    methods: List[str]
+
+
+def iter_tests(suite):
+    for item in suite:
+        if isinstance(item, unittest.TestSuite):
+            yield from iter_tests(item)
+        else:
+            yield item
+
+
+def is_order_dependent(test_class, method_names):
+    """
+    Decide whether a class's tests must run in sequence on one worker.
+
+    A class can set ``ORDERED_TESTS = False`` to let its methods spread across
+    workers (or ``True`` to force ordering). Without the flag, classes whose
+    methods all use the ``test_NN_`` prefix are treated as ordered.
+    """
+    flag = getattr(test_class, "ORDERED_TESTS", None)
+    if flag is not None:
+        return bool(flag)
+    return bool(method_names) and all(ORDER_PREFIX.match(name) for name in method_names)
+
+
+def build_work_units(suite):
+    methods_by_class: Dict[type, List[str]] = {}
+    for test in iter_tests(suite):
+        methods_by_class.setdefault(test.__class__, []).append(test._testMethodName)
+
+    units = []
+    for test_class, methods in methods_by_class.items():
+        if is_order_dependent(test_class, methods):
+            units.append(WorkUnit(test_class.__module__, test_class.__name__, methods))
+        else:
+            for method in methods:
+                units.append(WorkUnit(test_class.__module__, test_class.__name__, [method]))
+    return units
+
+
+def order_longest_first(units, model, language, browser):
+    """
+    Sort units by expected duration, longest first.
+
+    Workers pull from a shared queue, so this is greedy longest-processing-time
+    scheduling: a long test can no longer end up last in some worker's queue.
+    """
+    return sorted(units, key=lambda unit: model.estimate_unit(unit, language, browser), reverse=True)
+
+
+def predict_run(suite, model, language, browser, workers):
+    """Expected wall time of running ``suite`` on ``workers`` workers in longest-first order."""
+    units = order_longest_first(build_work_units(suite), model, language, browser)
+    workers = max(1, min(workers, len(units)))
+    return predict_makespan([model.estimate_unit(unit, language, browser) for unit in units], workers)
+
+
+class RecordingResult(unittest.TestResult):
+    """Worker-side result that ships a picklable record per test back to the parent."""
+
+    def __init__(self, worker_id, result_queue):
+        super().__init__()
+        self.worker_id = worker_id
+        self.result_queue = result_queue
+        self.reported = set()
+        self._started: Dict[str, float] = {}
+
+    def startTest(self, test):
+        super().startTest(test)
+        self._started[test.id()] = time.monotonic()
+
+    def _record(self, test, status, err=None, reason=None):
+        test, language = result_target(test)
+        if not hasattr(test, "_testMethodName"):
+            # setUpClass/tearDownClass errors arrive as an _ErrorHolder; the worker reports them per method
+            return
+        self.reported.add(test._testMethodName)
+        started = self._started.pop(test.id(), None)
+        if language:
+            # the next language of the pass starts now
+            self._started[test.id()] = time.monotonic()
+        record = {
+            "module": test.__class__.__module__,
+            "class": test.__class__.__name__,
+            "method": test._testMethodName,
+            "status": status,
+            "worker": self.worker_id,
+            "duration": round(time.monotonic() - started, 3) if started else None,
+            "message": reason,
+            "assertion": False,
+            "traceback": None,
+            "language": language,
+        }
+        if err:
+            error_type, error_value, error_tb = err
+            record["message"] = str(error_value)
+            record["assertion"] = isinstance(error_value, AssertionError)
+            record["traceback"] = "".join(traceback.format_exception(error_type, error_value, error_tb))
+        self.result_queue.put(record)
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        if not runs_language_pass(test):
+            self._record(test, "PASS")
+
+    def addSubTest(self, test, subtest, err):
+        super().addSubTest(test, subtest, err)
+        if err is None:
+            self._record(subtest, "PASS")
+        else:
+            self._record(subtest, "FAILURE" if issubclass(err[0], test.failureException) else "ERROR", err)
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._record(test, "FAILURE", err)
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self._record(test, "ERROR", err)
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self._record(test, "SKIP", reason=reason)
+
+
+def load_test_class(module_name, class_name):
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def make_test(test_class, method_name, language, browser, languages=None):
+    if not hasattr(test_class, method_name) and hasattr(test_class, "generate_test_methods"):
+        # Generated methods (e.g. TestRevert parts) only exist after generation in this process
+        test_class.generate_test_methods(language=language, browser=browser)
+    test = test_class(method_name, language=language, browser=browser)
+    covered = pass_languages(test_class, method_name, language, languages)
+    if len(covered) > 1:
+        test.languages = covered
+    return test
+
+
+def error_record(unit, method, worker_id, message, formatted_traceback=None):
+    return {
+        "module": unit.module,
+        "class": unit.class_name,
+        "method": method,
+        "status": "ERROR",
+        "worker": worker_id,
+        "duration": None,
+        "message": message,
+        "assertion": False,
+        "traceback": formatted_traceback,
+        "language": None,
+    }
+
+
+def worker_main(worker_id, task_queue, result_queue, language, browser, languages=None):
+    try:
+        run_units(worker_id, task_queue, result_queue, language, browser, languages)
+    finally:
+        finish_process()
+        result_queue.put(None)
+
+
+def finish_process():
+    """
+    Quit pooled browsers and log the per-process summaries. Test processes exit
+    through os._exit, so the atexit hooks that would do this never run there.
+    """
+    from utils.driver_pool import get_driver_pool
+    from utils.reference_cache import get_reference_cache
+    from utils.waits import wait_stats
+    get_driver_pool().shutdown()
+    wait_stats.log_summary()
+    get_reference_cache().log_summary()
+
+
+def run_units(worker_id, task_queue, result_queue, language, browser, languages=None):
+    logger = logging.getLogger("scheduler")
+    while True:
+        unit = task_queue.get()
+        if unit is None:
+            break
+        try:
+            test_class = load_test_class(unit.module, unit.class_name)
+            suite = unittest.TestSuite(
+                make_test(test_class, method, language, browser, languages) for method in unit.methods
+            )
+            result = RecordingResult(worker_id, result_queue)
+            suite.run(result)
+        except Exception as e:
+            logger.exception(f"Worker {worker_id} could not run {unit.class_name}")
+            for method in unit.methods:
+                result_queue.put(
+                    error_record(unit, method, worker_id, f"Test failed: {str(e)}", traceback.format_exc())
+                )
+            continue
+
+        class_errors = [
+            formatted.strip().splitlines()[-1] for holder, formatted in result.errors
+            if not hasattr(holder, "_testMethodName")
+        ]
+        for method in unit.methods:
+            if method not in result.reported:
+                message = class_errors[0] if class_errors else "Test did not report a result"
+                result_queue.put(error_record(unit, method, worker_id, f"Test failed: {message}"))
+
+
+class RemoteTestCase(unittest.TestCase):
+    """Stand-in for a test that ran in another process, used only for reporting."""
+
+    def runTest(self):
+        pass
+
+
+class RemoteError(Exception):
+
+    def __init__(self, message, remote_traceback=None):
+        super().__init__(message)
+        self.remote_traceback = remote_traceback
+
+
+_placeholder_classes: Dict[str, type] = {}
+
+
+def placeholder_test(record):
+    test_class = _placeholder_classes.get(record["class"])
+    if test_class is None:
+        test_class = type(record["class"], (RemoteTestCase, ), {"__module__": record["module"]})
+        _placeholder_classes[record["class"]] = test_class
+    test = test_class()
+    test._testMethodName = record["method"]
+    test.remote_duration = record["duration"]
+    test.remote_worker = record["worker"]
+    test.remote_language = record.get("language")
+    return test
+
+
+def replay_record(result, record):
+    """Feed one worker record into a parent-side unittest result (e.g. CustomTestResult)."""
+    test = placeholder_test(record)
+    result.startTest(test)
+    status = record["status"]
+    if status == "PASS":
+        result.addSuccess(test)
+    elif status == "SKIP":
+        result.addSkip(test, record["message"])
+    else:
+        error_class = AssertionError if record["assertion"] else RemoteError
+        error_value = error_class(record["message"])
+        error_value.remote_traceback = record["traceback"]
+        if status == "FAILURE":
+            result.addFailure(test, (error_class, error_value, None))
+        else:
+            result.addError(test, (error_class, error_value, None))
+    result.stopTest(test)
+    return test
+
+
+def run_parallel(suite, result, language, browser, workers, model=None, languages=None):
+    """
+    Spread the tests in ``suite`` over ``workers`` processes and merge the outcomes into ``result``.
+
+    Order-dependent classes are sent to a single worker as one unit; every other
+    test method is its own unit, so idle workers pick up whatever is left. With a
+    DurationModel the units are queued longest first.
+    """
+    logger = logging.getLogger("scheduler")
+    units = build_work_units(suite)
+    if model is not None:
+        units = order_longest_first(units, model, language, browser)
+    workers = max(1, min(workers, len(units)))
+    logger.info(f"Scheduling {len(units)} work units across {workers} workers")
+
+    task_queue = multiprocessing.Queue()
+    result_queue = multiprocessing.Queue()
+    for unit in units:
+        task_queue.put(unit)
+    for _ in range(workers):
+        task_queue.put(None)
+
+    processes = []
+    for worker_id in range(workers):
+        process = multiprocessing.Process(
+            target=worker_main, args=(worker_id, task_queue, result_queue, language, browser, languages)
+        )
+        process.start()
+        processes.append(process)
+
+    expected = {(unit.class_name, method) for unit in units for method in unit.methods}
+    finished = 0
+    while finished < len(processes):
+        try:
+            record = result_queue.get(timeout=POLL_INTERVAL)
+        except queue.Empty:
+            if not any(process.is_alive() for process in processes):
+                logger.error("All workers exited before reporting completion")
+                break
+            continue
+        if record is None:
+            finished += 1
+            continue
+        expected.discard((record["class"], record["method"]))
+        replay_record(result, record)
+
+    for process in processes:
+        process.join()
+
+    for class_name, method in sorted(expected):
+        logger.error(f"No result received for {class_name}.{method}; marking as error")
+        unit = WorkUnit("", class_name, [method])
+        replay_record(
+            result, error_record(unit, method, None, "Test failed: worker process exited before reporting a result")
+        )
+    return result
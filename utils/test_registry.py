@@ -0,0 +1,230 @@
+import ast
+import fnmatch
+import importlib
+import logging
+import os
+import re
+import unittest
+from typing import List, NamedTuple, Optional
+
+from utils.multi_language import pass_languages
+from utils.scheduler import ORDER_PREFIX
+
+logger = logging.getLogger("TestRegistry")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEST_DIR = os.path.join(ROOT, "tests")
+# browser-free unit tests of utils/, run with python -m unittest rather than through main.py
+UNIT_TEST_DIR = os.path.join(TEST_DIR, "unit_test")
+TEST_BASES = {"TestCase", "BaseTest"}
+
+CLASS_LINE = re.compile(r"^class\s+(\w+)\s*(?:\((.*)\))?\s*:")
+METHOD_LINE = re.compile(r"^    def\s+(\w+)\s*\(")
+ORDERED_LINE = re.compile(r"^    ORDERED_TESTS\s*=\s*(True|False)\b")
+
+
+class TestEntry(NamedTuple):
+    module: str
+    class_name: str
+    bases: List[str]
+    methods: List[str]
+    ordered: Optional[bool]
+    # classes like TestRevert create their test methods at load time
+    generated: bool
+
+
+class Selection(NamedTuple):
+    """One class to run and which of its methods; picklable, so it can be sent to worker processes."""
+    module: str
+    class_name: str
+    methods: Optional[List[str]]
+    method_patterns: Optional[List[str]]
+
+
+def module_name(path):
+    return os.path.splitext(os.path.relpath(path, ROOT))[0].replace(os.sep, ".")
+
+
+def parse_classes(source):
+    """(name, base names, method names, ORDERED_TESTS) for each top-level class."""
+    tree = ast.parse(source)
+    classes = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        bases = [base.attr if isinstance(base, ast.Attribute) else getattr(base, "id", "") for base in node.bases]
+        methods, ordered = [], None
+        for item in node.body:
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                methods.append(item.name)
+            elif isinstance(item, ast.Assign) and any(
+                getattr(target, "id", None) == "ORDERED_TESTS" for target in item.targets
+            ) and isinstance(item.value, ast.Constant):
+                ordered = bool(item.value.value)
+        classes.append((node.name, bases, methods, ordered))
+    return classes
+
+
+def scan_classes(source):
+    """Line-based fallback for files the running interpreter cannot parse (e.g. newer f-string syntax)."""
+    classes = []
+    for line in source.splitlines():
+        match = CLASS_LINE.match(line)
+        if match:
+            bases = [base.strip().split(".")[-1] for base in (match.group(2) or "").split(",") if base.strip()]
+            classes.append((match.group(1), bases, [], None))
+            continue
+        if not classes:
+            continue
+        match = METHOD_LINE.match(line)
+        if match:
+            classes[-1][2].append(match.group(1))
+            continue
+        match = ORDERED_LINE.match(line)
+        if match:
+            classes[-1] = classes[-1][:3] + (match.group(1) == "True", )
+    return classes
+
+
+class TestRegistry:
+    """
+    Every test class under tests/, found by reading the source instead of importing it.
+
+    Importing a test module pulls in selenium, pandas, bs4, pyzbar and friends,
+    so the registry lets main.py pick what to run before anything is imported;
+    only the selected modules are imported, in the process that runs them.
+    """
+
+    def __init__(self, root=TEST_DIR):
+        self.root = root
+        self.entries = {}
+        self._raw = {}
+        self.discover()
+
+    def discover(self):
+        for directory, subdirectories, files in os.walk(self.root):
+            subdirectories[:] = [name for name in subdirectories if os.path.join(directory, name) != UNIT_TEST_DIR]
+            for filename in sorted(files):
+                if not filename.endswith(".py"):
+                    continue
+                path = os.path.join(directory, filename)
+                with open(path, encoding="utf-8") as f:
+                    source = f.read()
+                try:
+                    classes = parse_classes(source)
+                except SyntaxError:
+                    classes = scan_classes(source)
+                for name, bases, methods, ordered in classes:
+                    self._raw[name] = (module_name(path), bases, methods, ordered)
+
+        for name in self._raw:
+            if not self.is_test_class(name):
+                continue
+            module, bases, _, ordered = self._raw[name]
+            methods = sorted({method for method in self.all_methods(name) if method.startswith("test")})
+            generated = "generate_test_methods" in self.all_methods(name)
+            if methods or generated:
+                self.entries[name] = TestEntry(module, name, bases, methods, ordered, generated)
+
+    def is_test_class(self, name, seen=()):
+        if name in TEST_BASES:
+            return True
+        if name not in self._raw or name in seen:
+            return False
+        return any(self.is_test_class(base, seen + (name, )) for base in self._raw[name][1])
+
+    def all_methods(self, name, seen=()):
+        """Methods defined on the class or inherited from classes found under tests/."""
+        if name not in self._raw or name in seen:
+            return set()
+        _, bases, methods, _ = self._raw[name]
+        inherited = set()
+        for base in bases:
+            inherited |= self.all_methods(base, seen + (name, ))
+        return inherited | set(methods)
+
+    def select(self, classes=None, methods=None):
+        """
+        Selections for classes whose name (or module) matches one of the ``classes``
+        globs, keeping only methods matching one of the ``methods`` globs.
+        """
+        selections = []
+        for name in sorted(self.entries):
+            entry = self.entries[name]
+            if classes and not any(
+                fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(entry.module, pattern) for pattern in classes
+            ):
+                continue
+            if entry.generated:
+                # method names are only known after generation, so the patterns travel with the selection
+                selections.append(Selection(entry.module, name, None, methods))
+                continue
+            chosen = [method for method in entry.methods if not methods or matches(method, methods)]
+            if chosen:
+                selections.append(Selection(entry.module, name, chosen, None))
+        return selections
+
+    def is_ordered(self, selection):
+        entry = self.entries[selection.class_name]
+        if entry.ordered is not None:
+            return entry.ordered
+        methods = selection.methods or []
+        return entry.generated or (bool(methods) and all(ORDER_PREFIX.match(name) for name in methods))
+
+
+def matches(method, patterns):
+    return any(fnmatch.fnmatch(method, pattern) for pattern in patterns)
+
+
+def shard(registry, selections, index, count):
+    """
+    Deterministic 1-based shard ``index`` of ``count``: order-dependent classes stay
+    whole, every other method is dealt round robin on its own.
+    """
+    if count <= 1:
+        return selections
+    units = []
+    for selection in selections:
+        if registry.is_ordered(selection) or selection.methods is None:
+            units.append(selection)
+        else:
+            units += [selection._replace(methods=[method]) for method in selection.methods]
+
+    mine = {}
+    for position, unit in enumerate(units):
+        if position % count != index - 1:
+            continue
+        key = (unit.module, unit.class_name)
+        if key in mine and unit.methods is not None:
+            mine[key] = mine[key]._replace(methods=mine[key].methods + unit.methods)
+        else:
+            mine[key] = unit
+    return list(mine.values())
+
+
+def load_suite(selections, language, browser, languages=None):
+    """
+    Import only the selected modules and build the suite for one language and browser.
+
+    ``languages`` are all languages of the run; ``@multi_language`` tests are
+    only added for the first of them and then cover every language.
+    """
+    suite = unittest.TestSuite()
+    for selection in selections:
+        test_class = getattr(importlib.import_module(selection.module), selection.class_name)
+        methods = selection.methods
+        if methods is None:
+            test_class.generate_test_methods(language=language, browser=browser)
+            methods = [
+                name for name in unittest.TestLoader().getTestCaseNames(test_class)
+                if not selection.method_patterns or matches(name, selection.method_patterns)
+            ]
+        for method in methods:
+            covered = pass_languages(test_class, method, language, languages)
+            if not covered:
+                continue
+            test = test_class(method, language=language, browser=browser)
+            if len(covered) > 1:
+                test.languages = covered
+            suite.addTest(test)
+    return suite
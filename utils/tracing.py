@@ -0,0 +1,228 @@
+import functools
+import glob
+import json
+import os
+import threading
+import time
+import types
+from contextlib import contextmanager
+from datetime import datetime
+
+from config.constant import TRACING
+
+TRACE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test_results", "traces")
+CATEGORIES = ("sleep", "wait", "webdriver", "http")
+NOT_HELPERS = {"setUp", "tearDown", "run", "debug", "id", "shortDescription"}
+
+
+class Span:
+    __slots__ = ("name", "start", "end", "categories")
+
+    def __init__(self, name):
+        self.name = name
+        self.start = time.perf_counter()
+        self.end = None
+        self.categories = dict.fromkeys(CATEGORIES, 0.0)
+
+
+class Tracer:
+    """
+    Records nested helper spans for the test running on the current thread.
+
+    Time spent in ``time.sleep``, WebDriverWait, WebDriver commands and
+    requests calls is added to every open span, so each span shows how its
+    own duration splits across those categories. Only the outermost category
+    counts: a WebDriver command issued while polling inside a wait is wait time.
+    """
+
+    def __init__(self):
+        self.local = threading.local()
+        self.helpers = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._fallback_run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    @property
+    def run_id(self):
+        # set by CustomTestRunner so every process of a run writes into one directory
+        return os.environ.get("TEST_RUN_ID") or self._fallback_run_id
+
+    @property
+    def stack(self):
+        return getattr(self.local, "stack", None)
+
+    def active(self):
+        return bool(self.stack)
+
+    def timestamp(self, value):
+        return int((value - self._origin) * 1_000_000)
+
+    def add_event(self, name, category, start, end, args=None):
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": self.timestamp(start),
+            "dur": max(1, int((end - start) * 1_000_000)),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self.local.events.append(event)
+
+    @contextmanager
+    def test(self, test_id):
+        install_hooks()
+        self.local.stack = [Span(test_id)]
+        self.local.events = []
+        self.local.category = None
+        try:
+            yield
+        finally:
+            root = self.local.stack[0]
+            root.end = time.perf_counter()
+            self.add_event(test_id, "test", root.start, root.end, self.breakdown(root))
+            self.export(test_id)
+            self.local.stack = None
+
+    @contextmanager
+    def span(self, name):
+        stack = self.stack
+        span = Span(name)
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            span.end = time.perf_counter()
+            stack.pop()
+            self.add_event(name, "helper", span.start, span.end, self.breakdown(span))
+            self.record_helper(span)
+
+    @contextmanager
+    def category(self, name, label=None):
+        if not self.active() or self.local.category is not None:
+            yield
+            return
+        self.local.category = name
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.local.category = None
+            for span in self.stack:
+                span.categories[name] += end - start
+            self.add_event(label or name, name, start, end)
+
+    @staticmethod
+    def breakdown(span):
+        total = span.end - span.start
+        parts = {category: round(seconds, 4) for category, seconds in span.categories.items()}
+        parts["other"] = round(max(0.0, total - sum(span.categories.values())), 4)
+        parts["total"] = round(total, 4)
+        return parts
+
+    def record_helper(self, span):
+        with self._lock:
+            stats = self.helpers.setdefault(span.name, {"count": 0, "total": 0.0, **dict.fromkeys(CATEGORIES, 0.0)})
+            stats["count"] += 1
+            stats["total"] += span.end - span.start
+            for category, seconds in span.categories.items():
+                stats[category] += seconds
+
+    def export(self, test_id):
+        directory = os.path.join(TRACE_DIR, self.run_id)
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"{test_id}-{os.getpid()}.json"), "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.local.events, "displayTimeUnit": "ms"}, f)
+        # cumulative per process, rewritten after every test so a killed run keeps its numbers
+        with self._lock, open(os.path.join(directory, f"helpers-{os.getpid()}.json"), "w", encoding="utf-8") as f:
+            json.dump(self.helpers, f)
+
+
+tracer = Tracer()
+
+
+def traced_helpers(cls):
+    """Wrap the public helper methods defined on ``cls`` in tracing spans."""
+    if not TRACING["enabled"]:
+        return cls
+    for name, attr in list(vars(cls).items()):
+        if name.startswith(("_", "test")) or name in NOT_HELPERS or not isinstance(attr, types.FunctionType):
+            continue
+        setattr(cls, name, traced(f"{cls.__name__}.{name}", attr))
+    return cls
+
+
+def traced(name, func):
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not tracer.active():
+            return func(*args, **kwargs)
+        with tracer.span(name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def traced_category(category, func, label=None):
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not tracer.active():
+            return func(*args, **kwargs)
+        with tracer.category(category, label(*args, **kwargs) if label else None):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+_hooks_installed = False
+
+
+def install_hooks():
+    global _hooks_installed
+    if _hooks_installed or not TRACING["enabled"]:
+        return
+    _hooks_installed = True
+
+    import requests
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.support.wait import WebDriverWait
+
+    time.sleep = traced_category("sleep", time.sleep)
+    WebDriverWait.until = traced_category("wait", WebDriverWait.until)
+    WebDriverWait.until_not = traced_category("wait", WebDriverWait.until_not)
+    WebDriver.execute = traced_category(
+        "webdriver", WebDriver.execute, label=lambda driver, command, *args, **kwargs: f"webdriver {command}"
+    )
+    requests.Session.request = traced_category(
+        "http", requests.Session.request, label=lambda session, method, url, *args, **kwargs: f"{method} {url}"
+    )
+
+
+def load_helper_stats(run_id):
+    merged = {}
+    for path in glob.glob(os.path.join(TRACE_DIR, run_id, "helpers-*.json")):
+        with open(path, encoding="utf-8") as f:
+            for name, stats in json.load(f).items():
+                target = merged.setdefault(name, dict.fromkeys(stats, 0))
+                for key, value in stats.items():
+                    target[key] += value
+    return merged
+
+
+def top_helpers(run_id, limit=None):
+    limit = limit or TRACING["top_n"]
+    stats = load_helper_stats(run_id)
+    return sorted(stats.items(), key=lambda item: -item[1]["total"])[:limit]
+
+
+def format_top_helpers(run_id, limit=None):
+    lines = []
+    for name, stats in top_helpers(run_id, limit):
+        split = ", ".join(f"{category} {stats[category]:.1f}s" for category in CATEGORIES)
+        lines.append(f"{name}: {stats['total']:.1f}s over {stats['count']} calls ({split})")
+    return lines
@@ -0,0 +1,145 @@
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.constant import CREDENTIALS, TURNOVER_SERVICE
+from utils.api_client import get_client
+from utils.tracing import tracer
+
+# action values of the back office's ModifyTurnover endpoint
+TURNOVER_ACTIONS = {"success": 1, "in_progress": 0, "unlock": -1}
+
+
+def summarize(turnovers, check_incomplete=False, transfer_check=False):
+    """
+    ``(has_incomplete, locked_by)`` for a turnover list, as checkIncompleteTurnover
+    reports it; ``transfer_check`` only counts promo locks.
+    """
+    locked_by, has_incomplete = [], False
+    for turnover in turnovers:
+        locked = turnover["lockedby"]
+        if transfer_check:
+            if not locked.startswith("Promo:"):
+                continue
+            locked = locked.replace("Promo:", "").strip()
+        locked_by.append(locked)
+        if check_incomplete and float(turnover["progress"]) < float(turnover["target"]):
+            has_incomplete = True
+    return has_incomplete, list(set(locked_by))
+
+
+class TurnoverService:
+    """
+    Turnovers of one user, read and changed through the back office QA endpoints.
+
+    ``fetch`` reads the turnover list once; ``apply`` sends one ModifyTurnover
+    call per id, ``TURNOVER_SERVICE["workers"]`` at a time, and applies the
+    outcome to the fetched list, so ``state``/``incomplete`` answer without
+    reading the list again. The local list is only current until something else
+    (a deposit, transfer or game record) changes the account; call ``fetch``
+    again after that. Every call's latency is kept in ``latencies`` per action.
+    """
+
+    def __init__(self, user_id, language=None, client=None, logger=None, workers=None):
+        self.user_id = user_id
+        self.language = language
+        self.client = client or get_client()
+        self.logger = logger or logging.getLogger("TurnoverService")
+        self.workers = workers or TURNOVER_SERVICE["workers"]
+        self.turnovers = None
+        self.latencies = {action: [] for action in TURNOVER_ACTIONS}
+
+    def fetch(self):
+        url = CREDENTIALS["CheckTurnover"].format(
+            BO_base_url=CREDENTIALS["BO_base_url"], ID=self.user_id, language=self.language
+        )
+        response = self.client.get(url)
+        response.raise_for_status()
+        self.turnovers = response.json()
+        self.logger.info(f"Turnover data: {self.turnovers}")
+        return self.turnovers
+
+    def state(self):
+        """The turnover list, fetched on first use and kept up to date by ``apply``."""
+        if self.turnovers is None:
+            self.fetch()
+        return self.turnovers
+
+    @property
+    def ids(self):
+        return [turnover["id"] for turnover in self.state() if "id" in turnover]
+
+    def incomplete(self, transfer_check=False):
+        return summarize(self.state(), check_incomplete=True, transfer_check=transfer_check)
+
+    def _modify(self, turnover_id, action_type):
+        url = CREDENTIALS["ModifyTurnover"].format(
+            BO_base_url=CREDENTIALS["BO_base_url"], userID=self.user_id, turnover_id=turnover_id,
+            action=TURNOVER_ACTIONS[action_type]
+        )
+        started = time.perf_counter()
+        try:
+            status = self.client.get(url).status_code
+        except Exception as e:
+            self.logger.error(f"Failed to {action_type} turnover ID {turnover_id}: {str(e)}")
+            status = None
+        return turnover_id, status, started, time.perf_counter()
+
+    def apply(self, action_type, turnover_ids=None, partial=False):
+        """
+        Set ``turnover_ids`` (default: all of them) to ``action_type``; ``partial``
+        picks a random non-empty subset, leaving at least one untouched.
+        Returns True when every call succeeded.
+        """
+        if action_type not in TURNOVER_ACTIONS:
+            self.logger.error(f"Invalid action type: {action_type}")
+            return False
+
+        turnover_ids = list(self.ids if turnover_ids is None else turnover_ids)
+        if partial and len(turnover_ids) > 1:
+            count = random.randint(1, len(turnover_ids) - 1)
+            turnover_ids = random.sample(turnover_ids, count)
+            self.logger.info(f"Partially applying {action_type} to {count} turnovers")
+        if not turnover_ids:
+            return True
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(turnover_ids)))) as executor:
+            results = list(executor.map(lambda turnover_id: self._modify(turnover_id, action_type), turnover_ids))
+        elapsed = time.perf_counter() - started
+
+        failed = []
+        for turnover_id, status, call_started, call_ended in results:
+            self.latencies[action_type].append(call_ended - call_started)
+            if tracer.active():
+                # the calls ran on pool threads, so they are added to this test's trace here
+                tracer.add_event(
+                    f"turnover.{action_type}", "http", call_started, call_ended, {"turnover_id": turnover_id}
+                )
+            if status == 200:
+                self.update_local(turnover_id, action_type)
+            else:
+                failed.append(turnover_id)
+                self.logger.error(f"Failed to {action_type} turnover ID {turnover_id}. Status code: {status}")
+
+        slowest = max(call_ended - call_started for _, _, call_started, call_ended in results)
+        self.logger.info(
+            f"Applied {action_type} to {len(results) - len(failed)}/{len(results)} turnovers in {elapsed:.2f}s "
+            f"(slowest call {slowest:.2f}s)"
+        )
+        return not failed
+
+    def update_local(self, turnover_id, action_type):
+        # mirrors the back office: success fills the progress, in_progress resets it, unlock removes the turnover
+        if self.turnovers is None:
+            return
+        turnover = next((t for t in self.turnovers if t.get("id") == turnover_id), None)
+        if turnover is None:
+            return
+        if action_type == "success":
+            turnover["progress"] = turnover["target"]
+        elif action_type == "in_progress":
+            turnover["progress"] = "0.00"
+        else:
+            self.turnovers.remove(turnover)
@@ -0,0 +1,189 @@
+import atexit
+import logging
+import threading
+import time
+
+from selenium.common.exceptions import (
+    JavascriptException, NoSuchElementException, StaleElementReferenceException, TimeoutException,
+    WebDriverException
+)
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+DEFAULT_TIMEOUT = 10
+POLL_FREQUENCY = 0.1
+NETWORK_IDLE_MS = 500
+STABLE_MS = 300
+
+BACKDROP_SELECTOR = ".MuiBackdrop-root:not(.MuiBackdrop-invisible), .swal2-container.swal2-backdrop-show"
+TOAST_SELECTOR = ".MuiSnackbar-root, .MuiAlert-root, .Toastify__toast, #swal2-html-container"
+
+# Counts in-flight fetch/XHR requests so "network idle" can be polled from Python.
+NETWORK_HOOK_JS = """
+(function() {
+    if (window.__networkHook) { return; }
+    window.__networkHook = true;
+    window.__pendingRequests = 0;
+    window.__lastNetworkActivity = Date.now();
+    function start() { window.__pendingRequests++; window.__lastNetworkActivity = Date.now(); }
+    function done() {
+        window.__pendingRequests = Math.max(0, window.__pendingRequests - 1);
+        window.__lastNetworkActivity = Date.now();
+    }
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function() {
+            start();
+            return originalFetch.apply(this, arguments).then(
+                function(response) { done(); return response; },
+                function(error) { done(); throw error; }
+            );
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        start();
+        this.addEventListener('loadend', done);
+        return originalSend.apply(this, arguments);
+    };
+})();
+"""
+
+NETWORK_STATE_JS = """
+if (!window.__networkHook) { return null; }
+return [document.readyState, window.__pendingRequests, Date.now() - window.__lastNetworkActivity];
+"""
+
+ELEMENT_RECT_JS = """
+var rect = arguments[0].getBoundingClientRect();
+return [rect.x, rect.y, rect.width, rect.height];
+"""
+
+
+def page_scripts(driver):
+    """Idempotent scripts (name -> (script, *args)) that ``Waits.page_settled`` re-runs on the current page."""
+    if not hasattr(driver, "_page_scripts"):
+        driver._page_scripts = {}
+    return driver._page_scripts
+
+
+class WaitStats:
+    """Per-process totals of time spent in each named wait condition."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.totals = {}
+
+    def add(self, name, elapsed, timed_out):
+        with self._lock:
+            count, total, timeouts = self.totals.get(name, (0, 0.0, 0))
+            self.totals[name] = (count + 1, total + elapsed, timeouts + int(timed_out))
+
+    def log_summary(self, logger=None):
+        logger = logger or logging.getLogger("Waits")
+        if not self.totals:
+            return
+        logger.info("Wait time by condition:")
+        for name, (count, total, timeouts) in sorted(self.totals.items(), key=lambda item: -item[1][1]):
+            logger.info(f"  {name}: {total:.2f}s over {count} waits ({timeouts} timed out)")
+
+
+wait_stats = WaitStats()
+atexit.register(wait_stats.log_summary)
+
+
+class Waits:
+    """
+    Named readiness conditions used in place of fixed ``time.sleep`` calls.
+
+    Every wait logs how long it took under its condition name. Settling waits
+    (backdrop, network, stability) give up quietly after the timeout because
+    the sleeps they replace never failed a test; ``toast_shown`` raises.
+    """
+
+    def __init__(self, driver, logger=None, timeout=DEFAULT_TIMEOUT):
+        self.driver = driver
+        self.logger = logger or logging.getLogger("Waits")
+        self.timeout = timeout
+
+    def until(self, name, condition, timeout=None, required=True):
+        started = time.monotonic()
+        timed_out = False
+        try:
+            return WebDriverWait(
+                self.driver, timeout or self.timeout, poll_frequency=POLL_FREQUENCY,
+                ignored_exceptions=(StaleElementReferenceException, NoSuchElementException, JavascriptException)
+            ).until(condition)
+        except TimeoutException:
+            timed_out = True
+            if required:
+                raise
+            self.logger.warning(f"Gave up waiting for {name} after {timeout or self.timeout}s")
+            return None
+        finally:
+            elapsed = time.monotonic() - started
+            wait_stats.add(name, elapsed, timed_out)
+            self.logger.info(f"Waited {elapsed:.2f}s for {name}")
+
+    def install_network_hook(self):
+        try:
+            if hasattr(self.driver, "execute_cdp_cmd") and not getattr(self.driver, "_network_hook_registered", False):
+                # Chromium can run the hook before page scripts, so requests made during load are counted too
+                self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_HOOK_JS})
+                self.driver._network_hook_registered = True
+            self.driver.execute_script(NETWORK_HOOK_JS)
+        except WebDriverException as e:
+            self.logger.debug(f"Could not install network hook: {str(e)}")
+
+    def reapply_page_scripts(self):
+        # browsers without CDP can't register scripts for new documents, so they are re-run after navigation
+        for name, (script, *args) in page_scripts(self.driver).items():
+            try:
+                self.driver.execute_script(script, *args)
+            except WebDriverException as e:
+                self.logger.debug(f"Could not reapply page script {name}: {str(e)}")
+
+    def backdrop_gone(self, timeout=None):
+        return self.until(
+            "backdrop_gone", EC.invisibility_of_element_located(("css selector", BACKDROP_SELECTOR)), timeout,
+            required=False
+        )
+
+    def network_idle(self, idle_ms=NETWORK_IDLE_MS, timeout=None):
+        self.install_network_hook()
+
+        def idle(driver):
+            state = driver.execute_script(NETWORK_STATE_JS)
+            if state is None:
+                # page navigated and dropped the hook; reinstall and keep polling
+                driver.execute_script(NETWORK_HOOK_JS)
+                return False
+            ready_state, pending, quiet_ms = state
+            return ready_state == "complete" and pending == 0 and quiet_ms >= idle_ms
+
+        return self.until("network_idle", idle, timeout, required=False)
+
+    def element_stable(self, element_or_locator, stable_ms=STABLE_MS, timeout=None):
+        """Wait until the element has not moved or resized for ``stable_ms``."""
+        last = {"rect": None, "since": None}
+
+        def stable(driver):
+            element = element_or_locator
+            if isinstance(element_or_locator, tuple):
+                element = driver.find_element(*element_or_locator)
+            rect = driver.execute_script(ELEMENT_RECT_JS, element)
+            now = time.monotonic()
+            if rect != last["rect"]:
+                last["rect"], last["since"] = rect, now
+                return False
+            return element if (now - last["since"]) * 1000 >= stable_ms else False
+
+        return self.until("element_stable", stable, timeout, required=False)
+
+    def toast_shown(self, selector=TOAST_SELECTOR, timeout=None):
+        return self.until("toast_shown", EC.visibility_of_element_located(("css selector", selector)), timeout)
+
+    def page_settled(self, timeout=None):
+        self.reapply_page_scripts()
+        self.backdrop_gone(timeout)
+        self.network_idle(timeout=timeout)
@@ -0,0 +1,62 @@
+import logging
+import os
+import re
+from urllib.parse import urlparse
+
+from config.constant import WEBDRIVER_BACKEND
+
+logger = logging.getLogger("WebDriverBackend")
+
+# set per process by main.py when shards are spread over several Grid nodes
+NODE_ENV = "WEBDRIVER_REMOTE_URL"
+
+# selenium.webdriver class names; selenium is only imported once a browser is started, so
+# main.py --list and the node helpers stay cheap to import
+LOCAL_DRIVERS = {
+    "chrome": ("Chrome", "ChromeService"),
+    "firefox": ("Firefox", "FirefoxService"),
+    "safari": ("Safari", "SafariService"),
+    "edge": ("Edge", "EdgeService"),
+}
+
+
+def remote_url():
+    """Grid endpoint for this process, or None when browsers are launched locally."""
+    url = os.environ.get(NODE_ENV)
+    if url:
+        return url
+    if WEBDRIVER_BACKEND["backend"] == "remote":
+        return WEBDRIVER_BACKEND["nodes"][0]
+    return None
+
+
+def nodes():
+    return list(WEBDRIVER_BACKEND["nodes"]) if WEBDRIVER_BACKEND["backend"] == "remote" else []
+
+
+def node_label(url):
+    return re.sub(r"\W+", "_", urlparse(url).netloc or url).strip("_")
+
+
+def start_driver(browser, options):
+    """
+    Launch ``browser`` with ``options`` on the configured backend.
+
+    Remote sessions get the extra capabilities from ``WEBDRIVER_BACKEND`` and a
+    LocalFileDetector, so file inputs receive fixtures from this machine rather
+    than paths that only exist here.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.remote.file_detector import LocalFileDetector
+
+    url = remote_url()
+    if url is None:
+        driver_class, service_class = (getattr(webdriver, name) for name in LOCAL_DRIVERS[browser])
+        return driver_class(service=service_class(), options=options)
+
+    for name, value in WEBDRIVER_BACKEND["capabilities"].get(browser, {}).items():
+        options.set_capability(name, value)
+    driver = webdriver.Remote(command_executor=url, options=options)
+    driver.file_detector = LocalFileDetector()
+    logger.info(f"Started remote {browser} session {driver.session_id} on {url}")
+    return driver